@@ -0,0 +1,41 @@
+"""On-disk JSON caches for data derived from the lesson catalog."""
+
+import json
+import os
+from typing import Callable
+
+from .paths import get_cache_dir
+
+
+def load_cached(name: str, key: str, version: int, build: Callable[[], dict]) -> dict:
+    """Load cached data for a key, building and storing it on a miss.
+
+    Each cache ``name`` keeps one file per key (normally the catalog hash);
+    files for other keys are removed when a new one is written. Failures
+    to create, read or write the cache (e.g. a read-only home) are treated
+    as misses since the cache can always be rebuilt.
+    """
+    try:
+        cache_dir = get_cache_dir()
+    except OSError:
+        return build()
+    cache_file = cache_dir / f"{name}-{key[:16]}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == version and cached.get("key") == key:
+            return cached["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = build()
+    try:
+        for stale in cache_dir.glob(f"{name}-*.json"):
+            stale.unlink(missing_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "key": key, "data": data}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return data
@@ -0,0 +1,221 @@
+"""Precomputed lesson catalog index for VimLearn."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Union
+
+from .lesson import Lesson, LessonHeader, Module, parse_lesson_id
+
+if TYPE_CHECKING:
+    from .snapshot import CatalogSnapshot
+
+LessonEntry = Union[LessonHeader, Lesson]
+
+
+@dataclass(frozen=True)
+class LessonCatalog:
+    """Immutable lookup tables over an ordered lesson sequence.
+
+    Built once so that lookups by id, ordinal and module, and next/previous
+    navigation are O(1) instead of rescanning the lesson list. Entries may be
+    lesson headers; ``load()`` materializes the full lesson on demand, from
+    the binary snapshot when one is configured and otherwise by importing the
+    module's lesson source.
+    """
+
+    lessons: tuple[LessonEntry, ...]
+    by_id: Mapping[str, LessonEntry]
+    ordinals: Mapping[str, int]
+    parsed_ids: Mapping[str, tuple[int, int]]
+    module_ranges: Mapping[int, tuple[int, int]]
+    next_ids: Mapping[str, Optional[str]]
+    previous_ids: Mapping[str, Optional[str]]
+    modules: Mapping[int, Module] = field(default_factory=dict)
+    snapshot_loader: Optional[Callable[[], Optional["CatalogSnapshot"]]] = None
+    _loaded: dict[str, Lesson] = field(default_factory=dict, repr=False, compare=False)
+    _snapshot: list = field(default_factory=list, repr=False, compare=False)
+
+    @classmethod
+    def from_lessons(
+        cls,
+        lessons: Iterable[LessonEntry],
+        modules: Iterable[Module] = (),
+        snapshot_loader: Optional[Callable[[], Optional["CatalogSnapshot"]]] = None,
+    ) -> "LessonCatalog":
+        """Build the index from lessons in curriculum order."""
+        ordered = tuple(lessons)
+        ids = [lesson.id for lesson in ordered]
+
+        module_ranges: dict[int, tuple[int, int]] = {}
+        for ordinal, lesson in enumerate(ordered):
+            start, _ = module_ranges.get(lesson.module_num, (ordinal, ordinal))
+            module_ranges[lesson.module_num] = (start, ordinal + 1)
+
+        return cls(
+            lessons=ordered,
+            by_id=MappingProxyType({lesson.id: lesson for lesson in ordered}),
+            ordinals=MappingProxyType({lesson_id: i for i, lesson_id in enumerate(ids)}),
+            parsed_ids=MappingProxyType({lesson_id: parse_lesson_id(lesson_id) for lesson_id in ids}),
+            module_ranges=MappingProxyType(module_ranges),
+            next_ids=MappingProxyType(dict(zip(ids, ids[1:] + [None]))),
+            previous_ids=MappingProxyType(dict(zip(ids, [None] + ids[:-1]))),
+            modules=MappingProxyType({module.num: module for module in modules}),
+            snapshot_loader=snapshot_loader,
+        )
+
+    @classmethod
+    def from_modules(
+        cls,
+        modules: Iterable[Module],
+        snapshot_loader: Optional[Callable[[], Optional["CatalogSnapshot"]]] = None,
+    ) -> "LessonCatalog":
+        """Build the index from modules in curriculum order."""
+        modules = list(modules)
+        return cls.from_lessons((lesson for module in modules for lesson in module.lessons), modules, snapshot_loader)
+
+    def __len__(self) -> int:
+        return len(self.lessons)
+
+    def __contains__(self, lesson_id: object) -> bool:
+        return lesson_id in self.by_id
+
+    def get(self, lesson_id: str) -> Optional[LessonEntry]:
+        """Get a lesson header by its ID without loading its content."""
+        return self.by_id.get(lesson_id)
+
+    def load(self, lesson_id: str) -> Optional[Lesson]:
+        """Get the full lesson for an ID, loading its module on first use."""
+        entry = self.by_id.get(lesson_id)
+        if entry is None or isinstance(entry, Lesson):
+            return entry
+        if lesson_id not in self._loaded:
+            snapshot = self.snapshot()
+            lesson = snapshot.lesson(lesson_id) if snapshot is not None else None
+            if lesson is not None:
+                self._loaded[lesson_id] = lesson
+                return lesson
+
+            module = self.modules.get(entry.module_num)
+            if module is None:
+                raise LookupError(f"No module {entry.module_num} for lesson {lesson_id}")
+            for lesson in module.load_lessons():
+                self._loaded[lesson.id] = lesson
+            if lesson_id not in self._loaded:
+                raise LookupError(f"Lesson {lesson_id} missing from {module.source}")
+        return self._loaded[lesson_id]
+
+    def snapshot(self) -> Optional["CatalogSnapshot"]:
+        """Get the binary snapshot, opening it on first use."""
+        if not self._snapshot:
+            self._snapshot.append(self.snapshot_loader() if self.snapshot_loader else None)
+        return self._snapshot[0]
+
+    def vim_profile(self, lesson: LessonEntry) -> Optional[str]:
+        """Get the recommended Vim launch profile for a lesson."""
+        profile = getattr(lesson, "vim_profile", None)
+        if profile is None:
+            module = self.modules.get(lesson.module_num)
+            profile = module.vim_profile if module is not None else None
+        return profile
+
+    def ordinal(self, lesson_id: str) -> Optional[int]:
+        """Get the position of a lesson in curriculum order."""
+        return self.ordinals.get(lesson_id)
+
+    def parse_id(self, lesson_id: str) -> tuple[int, int]:
+        """Get the (module, lesson) numbers for a lesson ID."""
+        parsed = self.parsed_ids.get(lesson_id)
+        if parsed is None:
+            return parse_lesson_id(lesson_id)
+        return parsed
+
+    def module_lessons(self, module_num: int) -> tuple[LessonEntry, ...]:
+        """Get all lessons in a module."""
+        start, end = self.module_ranges.get(module_num, (0, 0))
+        return self.lessons[start:end]
+
+    def next_id(self, lesson_id: str) -> Optional[str]:
+        """Get the next lesson ID after the given one."""
+        return self.next_ids.get(lesson_id)
+
+    def previous_id(self, lesson_id: str) -> Optional[str]:
+        """Get the previous lesson ID before the given one."""
+        return self.previous_ids.get(lesson_id)
+
+
+class CompletionSet:
+    """Completed lessons as a bitset over catalog ordinals.
+
+    Membership, adding and "is this module done" are O(1), and per-module
+    completion counts are kept up to date as lessons are added. IDs that are
+    not in the catalog (e.g. lessons since removed from the curriculum) are
+    kept aside so they survive a load/save round trip.
+    """
+
+    def __init__(self, catalog: LessonCatalog, lesson_ids: Iterable[str] = ()):
+        self.catalog = catalog
+        self.bits = 0
+        self.module_counts: dict[int, int] = {}
+        self.unknown: list[str] = []
+        self._count = 0
+        for lesson_id in lesson_ids:
+            self.add(lesson_id)
+
+    def add(self, lesson_id: str) -> bool:
+        """Mark a lesson completed. Returns False if it already was."""
+        ordinal = self.catalog.ordinals.get(lesson_id)
+        if ordinal is None:
+            if lesson_id in self.unknown:
+                return False
+            self.unknown.append(lesson_id)
+            return True
+        mask = 1 << ordinal
+        if self.bits & mask:
+            return False
+        self.bits |= mask
+        module_num = self.catalog.lessons[ordinal].module_num
+        self.module_counts[module_num] = self.module_counts.get(module_num, 0) + 1
+        self._count += 1
+        return True
+
+    def update(self, other: "CompletionSet") -> None:
+        """Add every lesson completed in another set over the same catalog."""
+        added = other.bits & ~self.bits
+        if added:
+            self.bits |= added
+            self._count += added.bit_count()
+            for module_num, (start, end) in self.catalog.module_ranges.items():
+                gained = ((added >> start) & ((1 << (end - start)) - 1)).bit_count()
+                if gained:
+                    self.module_counts[module_num] = self.module_counts.get(module_num, 0) + gained
+        for lesson_id in other.unknown:
+            if lesson_id not in self.unknown:
+                self.unknown.append(lesson_id)
+
+    def __contains__(self, lesson_id: object) -> bool:
+        ordinal = self.catalog.ordinals.get(lesson_id)  # type: ignore[arg-type]
+        if ordinal is None:
+            return lesson_id in self.unknown
+        return bool(self.bits >> ordinal & 1)
+
+    def __len__(self) -> int:
+        return self._count + len(self.unknown)
+
+    def module_count(self, module_num: int) -> int:
+        """Get how many lessons of a module are completed."""
+        return self.module_counts.get(module_num, 0)
+
+    def module_done(self, module_num: int) -> bool:
+        """Check whether every lesson of a module is completed."""
+        start, end = self.catalog.module_ranges.get(module_num, (0, 0))
+        return end > start and self.module_counts.get(module_num, 0) == end - start
+
+    def ids(self) -> list[str]:
+        """Get the completed lesson IDs in curriculum order."""
+        ids = []
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            ids.append(self.catalog.lessons[low.bit_length() - 1].id)
+            bits ^= low
+        return ids + self.unknown
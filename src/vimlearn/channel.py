@@ -0,0 +1,263 @@
+"""Persistent Vim session driven over a Vim channel.
+
+VimLearn listens on a localhost socket and starts one Vim that connects to it
+in JSON mode. Exercises are opened in that Vim by sending ``call`` messages,
+and Vim reports writes and learner commands (``:VimlearnHint`` etc.) back as
+events, so no Vim process is spawned per exercise.
+
+Other local users can connect to the port too, so the bootstrap script (only
+readable by the learner) carries a per-session token that Vim sends first;
+connections without it are dropped.
+"""
+
+import codecs
+import hmac
+import json
+import os
+import secrets
+import select
+import socket
+import subprocess
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from .lesson import Exercise, Lesson
+
+BOOTSTRAP_SCRIPT = r"""
+let g:vimlearn_channel = ch_open('localhost:{port}', {{'mode': 'json', 'waittime': 3000}})
+if ch_status(g:vimlearn_channel) !=# 'open'
+  cquit 3
+endif
+call ch_sendexpr(g:vimlearn_channel, {{'event': 'hello', 'token': '{token}'}})
+
+function! s:Send(event) abort
+  call ch_sendexpr(g:vimlearn_channel, {{'event': a:event, 'file': expand('%:p')}})
+endfunction
+
+function! VimlearnShowLesson(lines) abort
+  let l:buf = bufadd('vimlearn://lesson')
+  call bufload(l:buf)
+  call setbufvar(l:buf, '&buftype', 'nofile')
+  call setbufvar(l:buf, '&bufhidden', 'hide')
+  call setbufvar(l:buf, '&swapfile', 0)
+  call setbufvar(l:buf, '&modifiable', 1)
+  silent call deletebufline(l:buf, 1, '$')
+  call setbufline(l:buf, 1, a:lines)
+  call setbufvar(l:buf, '&modifiable', 0)
+  if bufwinnr(l:buf) == -1
+    execute 'topleft sbuffer' l:buf
+    execute 'resize' min([len(a:lines), &lines / 2])
+    wincmd p
+  endif
+  redraw
+endfunction
+
+function! VimlearnOpen(file, title, col) abort
+  if bufname('%') ==# 'vimlearn://lesson'
+    wincmd p
+  endif
+  let l:previous = bufnr('%')
+  execute 'edit!' fnameescape(a:file)
+  if l:previous != bufnr('%') && bufname(l:previous) =~# 'vimlearn_exercise_'
+    silent! execute 'bwipeout!' l:previous
+  endif
+  let b:vimlearn_title = a:title
+  " Exercises are submitted by writing; keep the usual exit habits from quitting
+  cnoreabbrev <buffer> <expr> wq (getcmdtype() ==# ':' && getcmdline() ==# 'wq') ? 'w' : 'wq'
+  cnoreabbrev <buffer> <expr> x (getcmdtype() ==# ':' && getcmdline() ==# 'x') ? 'w' : 'x'
+  nnoremap <buffer> ZZ :w<CR>
+  call cursor(1, a:col)
+  redraw
+  echo a:title
+endfunction
+
+function! VimlearnMessage(lines, error) abort
+  redraw
+  execute 'echohl' (a:error ? 'ErrorMsg' : 'MoreMsg')
+  echo join(a:lines, "\n")
+  echohl None
+endfunction
+
+set hidden
+set laststatus=2
+set statusline=%{{get(b:,'vimlearn_title','')}}%=%t
+augroup vimlearn
+  autocmd!
+  autocmd BufWritePost vimlearn_exercise_* call s:Send('write')
+augroup END
+command! VimlearnHint call s:Send('hint')
+command! VimlearnWhy call s:Send('why')
+command! VimlearnSkip call s:Send('skip')
+command! VimlearnPass call s:Send('pass')
+"""
+
+# Shown at the bottom of the lesson window.
+COMMAND_HELP = ":w 提交（:wq/ZZ 同样只保存）  :VimlearnHint 提示  :VimlearnWhy 设计原因  :VimlearnSkip 跳过  :VimlearnPass 强制通过  :qa 退出"
+
+
+@lru_cache(maxsize=None)
+def channels_available(vim: str = "vim") -> bool:
+    """Check whether the installed Vim was built with channel support."""
+    try:
+        result = subprocess.run([vim, "--version"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return "+channel" in result.stdout
+
+
+class VimChannel:
+    """A single long-lived Vim process controlled over a localhost channel."""
+
+    def __init__(self, script_dir: Path, vim_cmd: Optional[list[str]] = None):
+        self.script_dir = script_dir
+        self.vim_cmd = vim_cmd or ["vim"]
+        self.process: Optional[subprocess.Popen] = None
+        self.conn: Optional[socket.socket] = None
+        self.script_file: Optional[Path] = None
+        self._buffer = ""
+        # Chunks may split a multibyte character
+        self._utf8 = codecs.getincrementaldecoder("utf-8")("replace")
+        self._decoder = json.JSONDecoder()
+
+    def start(self, connect_timeout: float = 5.0) -> bool:
+        """Start Vim and wait for it to connect. Returns False if unavailable."""
+        if not channels_available(self.vim_cmd[0]):
+            return False
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server.bind(("127.0.0.1", 0))
+            server.listen(4)
+            port = server.getsockname()[1]
+            token = secrets.token_hex(16)
+
+            self.script_file = self.script_dir / "channel.vim"
+            fd = os.open(self.script_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(BOOTSTRAP_SCRIPT.format(port=port, token=token))
+
+            try:
+                self.process = subprocess.Popen([*self.vim_cmd, "-S", str(self.script_file)])
+            except FileNotFoundError:
+                return False
+
+            deadline = time.monotonic() + connect_timeout
+            while self.conn is None:
+                server.settimeout(max(0.0, deadline - time.monotonic()))
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    self.close()
+                    return False
+                if self._authenticate(conn, token, deadline):
+                    self.conn = conn
+                else:
+                    conn.close()
+            return True
+        finally:
+            server.close()
+
+    def _authenticate(self, conn: socket.socket, token: str, deadline: float) -> bool:
+        """Check that a new connection's first message carries the session token."""
+        self._buffer = ""
+        self._utf8.reset()
+        while True:
+            event = self._pop_event()
+            if event is not None:
+                return event.get("event") == "hello" and hmac.compare_digest(str(event.get("token", "")), token)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([conn], [], [], remaining)[0]:
+                return False
+            try:
+                data = conn.recv(65536)
+            except OSError:
+                return False
+            if not data:
+                return False
+            self._buffer += self._utf8.decode(data)
+
+    def _send(self, message: list) -> None:
+        if self.conn is not None:
+            self.conn.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _call(self, func: str, *args) -> None:
+        self._send(["call", func, list(args)])
+
+    def show_lesson(self, lesson: Lesson) -> None:
+        """Show the lesson title and explanation in the top window."""
+        lines = [f"[课程 {lesson.id}] {lesson.title}", ""]
+        lines.extend(lesson.explanation.strip().split("\n"))
+        lines.extend(["", COMMAND_HELP])
+        self._call("VimlearnShowLesson", lines)
+
+    def show_exercise(self, filepath: Path, exercise: Exercise, title: str) -> None:
+        """Open an exercise file with its instruction in the status line."""
+        column = 1 if exercise.cursor_position is None else exercise.cursor_position + 1
+        self._call("VimlearnOpen", str(filepath), title, column)
+
+    def message(self, text: str, error: bool = False) -> None:
+        """Echo a (possibly multi-line) message in Vim."""
+        self._call("VimlearnMessage", text.strip().split("\n"), 1 if error else 0)
+
+    def next_event(self) -> dict:
+        """
+        Block until Vim sends an event.
+
+        Returns a dict with an ``event`` key ("write", "hint", "why", "skip",
+        "pass"), or ``{"event": "exit"}`` once Vim has exited.
+        """
+        while True:
+            event = self._pop_event()
+            if event is not None:
+                return event
+            if self.conn is None:
+                return {"event": "exit"}
+
+            readable, _, _ = select.select([self.conn], [], [], 0.5)
+            if not readable:
+                if self.process is not None and self.process.poll() is not None:
+                    return {"event": "exit"}
+                continue
+
+            data = self.conn.recv(65536)
+            if not data:
+                self.conn.close()
+                self.conn = None
+                continue
+            self._buffer += self._utf8.decode(data)
+
+    def _pop_event(self) -> Optional[dict]:
+        """Decode one complete message from the receive buffer, if any."""
+        text = self._buffer.lstrip()
+        if not text:
+            return None
+        try:
+            message, end = self._decoder.raw_decode(text)
+        except ValueError:
+            return None
+        self._buffer = text[end:]
+        # Vim sends [msgid, payload] for ch_sendexpr()
+        if isinstance(message, list) and len(message) == 2 and isinstance(message[1], dict):
+            return message[1]
+        return self._pop_event()
+
+    def close(self) -> None:
+        """Wait for Vim to exit and release the channel."""
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._send(["ex", "qa!"])
+                try:
+                    self.process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self.process.terminate()
+            self.process = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.script_file is not None:
+            self.script_file.unlink(missing_ok=True)
+            self.script_file = None
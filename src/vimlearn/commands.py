@@ -0,0 +1,92 @@
+"""Reverse index from Vim commands to the exercises that teach them."""
+
+import bisect
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from .cache import load_cached
+from .lesson import Lesson
+
+INDEX_VERSION = 1
+
+# Ctrl+r, Ctrl-R, ctrl r, <C-r>, ^R  ->  <C-r>
+_CTRL = re.compile(r"<c-(.)>|\bctrl[-+ ]?(.)|\^([A-Z\[\]\\^_@])", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+def _ctrl_key(match: re.Match) -> str:
+    key = next(group for group in match.groups() if group is not None)
+    return f"<C-{key.lower()}>"
+
+
+def normalize_command(command: str) -> str:
+    """Normalize a command so equivalent spellings map to the same key.
+
+    Ctrl chords become ``<C-x>``. Ex commands keep single spaces between
+    words; whitespace is dropped from normal-mode key sequences (``d w``).
+    """
+    command = _CTRL.sub(_ctrl_key, command.strip())
+    if command.startswith(":"):
+        return _SPACE.sub(" ", command)
+    return _SPACE.sub("", command)
+
+
+@dataclass
+class CommandMatch:
+    """An exercise that practices a command."""
+
+    command: str
+    lesson_id: str
+    exercise_index: int
+
+
+class CommandIndex:
+    """Sorted mapping from normalized command to (lesson id, exercise index)."""
+
+    def __init__(self, entries: dict[str, list[list]]):
+        self.entries = entries
+        self.keys = sorted(entries)
+
+    @classmethod
+    def build(cls, lessons: Iterable[Lesson]) -> "CommandIndex":
+        """Index the commands_to_learn of every exercise."""
+        entries: dict[str, list[list]] = {}
+        for lesson in lessons:
+            for i, exercise in enumerate(lesson.exercises):
+                for command in exercise.commands_to_learn:
+                    targets = entries.setdefault(normalize_command(command), [])
+                    if [lesson.id, i] not in targets:
+                        targets.append([lesson.id, i])
+        return cls(entries)
+
+    def lookup(self, command: str, prefix: bool = False) -> list[CommandMatch]:
+        """Find exercises for a command, or for every command starting with it."""
+        key = normalize_command(command)
+        if not key:
+            return []
+        if not prefix:
+            keys = [key] if key in self.entries else []
+        else:
+            start = bisect.bisect_left(self.keys, key)
+            end = bisect.bisect_left(self.keys, key + "\U0010ffff", lo=start)
+            keys = self.keys[start:end]
+        return [
+            CommandMatch(command=k, lesson_id=lesson_id, exercise_index=exercise_index)
+            for k in keys
+            for lesson_id, exercise_index in self.entries[k]
+        ]
+
+    def first(self, command: str) -> Optional[CommandMatch]:
+        """Get the first exercise for a command, falling back to prefix matches."""
+        matches = self.lookup(command) or self.lookup(command, prefix=True)
+        return matches[0] if matches else None
+
+
+def load_command_index(catalog_hash: str, lessons_factory: Callable[[], Iterable[Lesson]]) -> CommandIndex:
+    """Load the cached command index for a catalog version, building it if missing."""
+    entries = load_cached(
+        "commands", catalog_hash, INDEX_VERSION,
+        lambda: CommandIndex.build(lessons_factory()).entries,
+    )
+    return CommandIndex(entries)
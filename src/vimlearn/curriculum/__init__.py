@@ -0,0 +1,5 @@
+"""Lesson content for VimLearn, one file per module.
+
+Each ``module_NN`` file defines ``LESSONS``, the full lessons of that module.
+They are imported lazily by ``vimlearn.lessons`` when a lesson is opened.
+"""
@@ -0,0 +1,200 @@
+"""Module 1: 基础移动."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="1.1",
+        title="hjkl 基础移动",
+        module="基础移动",
+        module_num=1,
+        description="学习 Vim 最基本的光标移动方式",
+        explanation="""
+在 Vim 中，我们使用 h、j、k、l 四个键来移动光标：
+
+  h - 左移一个字符
+  j - 下移一行
+  k - 上移一行
+  l - 右移一个字符
+
+这四个键位于键盘主行，让你的手指无需离开打字位置就能移动光标。
+
+记忆技巧：
+- h 在最左边，所以向左移动
+- l 在最右边，所以向右移动
+- j 像一个向下的钩子，所以向下移动
+- k 像一个向上的指针，所以向上移动
+""",
+        why="""
+为什么不用方向键？
+
+1. 效率：hjkl 键在主键盘区，手指不需要移动到方向键区域
+2. 速度：减少手指移动距离，提高编辑速度
+3. 组合：可以与数字组合，如 5j 向下移动5行
+4. 历史：Vim 的前身 vi 诞生时，很多键盘没有方向键
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 j 键将光标移动到最后一行，然后保存退出 (:wq)",
+                initial="第一行\n第二行\n第三行\n目标行",
+                expected="第一行\n第二行\n第三行\n目标行",
+                hint="按 j 三次到达最后一行，然后输入 :wq 保存退出",
+                commands_to_learn=["j", ":wq"],
+                solution="jjj:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 l 键将光标移动到行尾的 X 处，将 X 改为 Y (使用 r 命令替换字符)",
+                initial="找到这个X",
+                expected="找到这个Y",
+                hint="按 l 移动到 X，然后按 r 再按 Y 替换字符",
+                commands_to_learn=["l", "r"],
+                cursor_position=0,
+                solution="llllrY:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="1.2",
+        title="单词移动 w/b/e",
+        module="基础移动",
+        module_num=1,
+        description="学习按单词移动光标",
+        explanation="""
+按字符移动太慢了，Vim 提供了按单词移动的方式：
+
+  w - 移动到下一个单词的开头 (word)
+  b - 移动到上一个单词的开头 (back)
+  e - 移动到当前/下一个单词的结尾 (end)
+
+大写版本 W、B、E 以空格为分隔符，忽略标点：
+  W - 移动到下一个空格分隔的单词
+  B - 移动到上一个空格分隔的单词
+  E - 移动到当前/下一个空格分隔单词的结尾
+""",
+        why="""
+为什么区分 w 和 W？
+
+在编程中，我们经常遇到 snake_case 或 camelCase 这样的标识符。
+- w 会把 hello_world 当作两个单词
+- W 会把 hello_world 当作一个单词
+
+这让你可以根据需要选择合适的移动粒度。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 w 移动到 'world' 单词，将其改为 'vim' (使用 cw 命令)",
+                initial="hello world",
+                expected="hello vim",
+                hint="按 w 移动到 world，然后按 cw 输入 vim，按 Esc 退出插入模式",
+                commands_to_learn=["w", "cw"],
+                cursor_position=0,
+                solution="wcwvim<Esc>:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 2w 一次跳过两个单词，到达 'third' 并删除它",
+                initial="first second third",
+                expected="first second",
+                hint="按 2w 跳到 third，按 dw 删除",
+                commands_to_learn=["2w", "dw"],
+                cursor_position=0,
+                solution="2wdw:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="1.3",
+        title="行内移动 0/$/^",
+        module="基础移动",
+        module_num=1,
+        description="学习在行内快速移动",
+        explanation="""
+在一行内快速移动：
+
+  0 - 移动到行首（第0列）
+  $ - 移动到行尾
+  ^ - 移动到行首第一个非空白字符
+
+这些命令让你能快速到达行的关键位置。
+""",
+        why="""
+为什么用这些符号？
+
+- 0 表示第0列，即行的最开始
+- $ 在正则表达式中表示行尾，Vim 沿用了这个约定
+- ^ 在正则表达式中表示行首，这里表示第一个非空字符
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 $ 移动到行尾，添加感叹号",
+                initial="Hello World",
+                expected="Hello World!",
+                hint="按 $ 到行尾，按 a 追加，输入 !，按 Esc",
+                commands_to_learn=["$", "a"],
+                cursor_position=0,
+                solution="$a!<Esc>:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 0 移动到行首，删除前导空格（使用 dw）",
+                initial="    Hello",
+                expected="Hello",
+                hint="按 0 到行首，按 dw 删除空格",
+                commands_to_learn=["0", "dw"],
+                cursor_position=4,
+                solution="0dw:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="1.4",
+        title="数字前缀",
+        module="基础移动",
+        module_num=1,
+        description="学习使用数字倍增命令",
+        explanation="""
+几乎所有 Vim 命令都可以加数字前缀来重复执行：
+
+移动命令：
+  5j - 向下移动 5 行
+  3w - 向前移动 3 个单词
+  10l - 向右移动 10 个字符
+
+编辑命令：
+  3dd - 删除 3 行
+  2dw - 删除 2 个单词
+  5x - 删除 5 个字符
+
+这是 Vim 效率的重要来源！
+""",
+        why="""
+为什么数字前缀这么重要？
+
+配合相对行号使用效果最佳：
+- 看到目标在第 8 行，当前在第 3 行
+- 不用算 8-3=5，直接看相对行号显示 5
+- 按 5j 直接到达
+
+数字前缀让你用最少的按键完成操作。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 3dd 一次删除三行",
+                initial="删除1\n删除2\n删除3\n保留",
+                expected="保留",
+                hint="按 3dd 删除三行",
+                commands_to_learn=["3dd"],
+                cursor_position=0,
+                solution="3dd:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 4x 删除前四个字符",
+                initial="abcdefgh",
+                expected="efgh",
+                hint="按 4x 删除四个字符",
+                commands_to_learn=["4x"],
+                cursor_position=0,
+                solution="4x:wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,204 @@
+"""Module 2: 编辑操作."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="2.1",
+        title="插入模式 i/a/o",
+        module="编辑操作",
+        module_num=2,
+        description="学习进入插入模式的多种方式",
+        explanation="""
+Vim 有多种方式进入插入模式：
+
+  i - 在光标前插入 (insert)
+  a - 在光标后追加 (append)
+  I - 在行首插入
+  A - 在行尾追加
+  o - 在下方新建一行并插入
+  O - 在上方新建一行并插入
+
+按 Esc 或 Ctrl+[ 退出插入模式回到普通模式。
+""",
+        why="""
+为什么有这么多进入插入模式的方式？
+
+每种方式都针对特定场景优化：
+- i/a 用于精确位置插入
+- I/A 用于行首/行尾快速编辑
+- o/O 用于快速新建行
+
+这避免了"移动光标 + 进入插入模式"的组合操作。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 A 在行尾添加 ' World'",
+                initial="Hello",
+                expected="Hello World",
+                hint="按 A 到行尾进入插入模式，输入 ' World'，按 Esc",
+                commands_to_learn=["A"],
+                cursor_position=0,
+                solution="A World<Esc>:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 o 在下方新建一行，输入 '第二行'",
+                initial="第一行",
+                expected="第一行\n第二行",
+                hint="按 o 在下方新建行，输入 '第二行'，按 Esc",
+                commands_to_learn=["o"],
+                cursor_position=0,
+                solution="o第二行<Esc>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="2.2",
+        title="删除操作 d/x",
+        module="编辑操作",
+        module_num=2,
+        description="学习删除文本的各种方式",
+        explanation="""
+删除命令：
+
+  x - 删除光标下的字符
+  X - 删除光标前的字符
+  dd - 删除整行
+  dw - 删除到下一个单词开头
+  de - 删除到单词结尾
+  d$ 或 D - 删除到行尾
+  d0 - 删除到行首
+
+d 命令可以与移动命令组合：d + 移动 = 删除到移动目标位置
+""",
+        why="""
+为什么 d 要和移动命令组合？
+
+这是 Vim 的"动词 + 名词"语法：
+- d 是动词（删除）
+- w、e、$ 等是名词（移动范围）
+
+这种组合方式让你只需学习少量命令，就能组合出大量操作。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 dd 删除第二行",
+                initial="保留这行\n删除这行\n保留这行",
+                expected="保留这行\n保留这行",
+                hint="按 j 移动到第二行，按 dd 删除整行",
+                commands_to_learn=["dd"],
+                cursor_position=0,
+                solution="jdd:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 dw 删除第一个单词",
+                initial="delete this word",
+                expected="this word",
+                hint="按 dw 删除第一个单词（包括空格）",
+                commands_to_learn=["dw"],
+                cursor_position=0,
+                solution="dw:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="2.3",
+        title="修改操作 c",
+        module="编辑操作",
+        module_num=2,
+        description="学习修改（删除并进入插入模式）",
+        explanation="""
+c 命令 = 删除 + 进入插入模式：
+
+  cw - 修改单词（删除到单词尾并进入插入模式）
+  cc 或 S - 修改整行
+  c$ 或 C - 修改到行尾
+  ci" - 修改引号内的内容
+  ci( - 修改括号内的内容
+
+c 命令的语法和 d 命令相同，但会进入插入模式。
+""",
+        why="""
+为什么需要 c 命令？
+
+c 命令是 d + i 的快捷方式。比如：
+- dw + i 需要两步
+- cw 只需一步
+
+在实际编辑中，"删除后立即输入新内容"是非常常见的操作。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 cw 将 'old' 改为 'new'",
+                initial="old text",
+                expected="new text",
+                hint="按 cw 删除 'old' 并进入插入模式，输入 'new'，按 Esc",
+                commands_to_learn=["cw"],
+                cursor_position=0,
+                solution="cwnew<Esc>:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 cc 将整行替换为 '新的一行'",
+                initial="旧的内容",
+                expected="新的一行",
+                hint="按 cc 删除整行并进入插入模式，输入 '新的一行'，按 Esc",
+                commands_to_learn=["cc"],
+                cursor_position=0,
+                solution="cc新的一行<Esc>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="2.4",
+        title="其他实用编辑",
+        module="编辑操作",
+        module_num=2,
+        description="学习合并行、大小写转换等实用操作",
+        explanation="""
+这些命令在日常编辑中非常实用：
+
+合并行：
+  J - 将下一行合并到当前行（用空格连接）
+  gJ - 合并行但不加空格
+
+大小写转换：
+  ~ - 切换光标下字符的大小写
+  gu{motion} - 转小写（如 guw 转换单词）
+  gU{motion} - 转大写（如 gUw 转换单词）
+  guu - 整行转小写
+  gUU - 整行转大写
+
+交换技巧：
+  xp - 交换两个字符（先删除再粘贴）
+  ddp - 交换两行
+""",
+        why="""
+这些命令的实际用途：
+
+1. J 合并行：格式化代码、合并被错误换行的文本
+2. ~ 大小写：快速修正大小写错误
+3. xp 交换：修正 teh -> the 这类拼写错误
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 J 将两行合并为一行",
+                initial="Hello\nWorld",
+                expected="Hello World",
+                hint="按 J 合并下一行到当前行",
+                commands_to_learn=["J"],
+                cursor_position=0,
+                solution="J:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 gUw 将单词转为大写",
+                initial="hello world",
+                expected="HELLO world",
+                hint="按 gUw 将第一个单词转大写",
+                commands_to_learn=["gUw", "~"],
+                cursor_position=0,
+                solution="gUw:wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,87 @@
+"""Module 3: 复制粘贴与撤销."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="3.1",
+        title="复制粘贴 y/p",
+        module="复制粘贴与撤销",
+        module_num=3,
+        description="学习复制和粘贴操作",
+        explanation="""
+复制（yank）和粘贴（put）：
+
+  yy - 复制整行
+  yw - 复制单词
+  y$ - 复制到行尾
+  p - 在光标后粘贴
+  P - 在光标前粘贴
+
+y 命令的语法和 d、c 相同，可以与移动命令组合。
+
+注意：Vim 中删除的内容也会被复制到寄存器，所以 dd 后可以用 p 粘贴。
+""",
+        why="""
+为什么叫 yank 而不是 copy？
+
+在 Vim 的历史中，y 代表 yank（猛拉），这个术语来自更早的编辑器。
+虽然不太直观，但 y 键位置好，而且 c 已经被 change 占用了。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 yy 复制第一行，然后用 p 粘贴到下方",
+                initial="复制我",
+                expected="复制我\n复制我",
+                hint="按 yy 复制当前行，按 p 在下方粘贴",
+                commands_to_learn=["yy", "p"],
+                cursor_position=0,
+                solution="yyp:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 dd 删除第一行，然后用 p 粘贴到第二行下方（交换两行）",
+                initial="第二行\n第一行",
+                expected="第一行\n第二行",
+                hint="按 dd 删除第一行（会自动复制），按 p 粘贴到当前行下方",
+                commands_to_learn=["dd", "p"],
+                cursor_position=0,
+                solution="ddp:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="3.2",
+        title="撤销与重做 u/Ctrl+r",
+        module="复制粘贴与撤销",
+        module_num=3,
+        description="学习撤销和重做操作",
+        explanation="""
+撤销和重做：
+
+  u - 撤销上一次操作 (undo)
+  Ctrl+r - 重做被撤销的操作 (redo)
+  U - 撤销当前行的所有修改
+
+Vim 的撤销是基于操作的，每次从普通模式进入插入模式到退出算一次操作。
+""",
+        why="""
+为什么 Vim 的撤销这么强大？
+
+Vim 支持无限撤销，而且有撤销树（undo tree）功能。
+即使你撤销后又做了新修改，之前的历史也不会丢失。
+可以使用 :earlier 和 :later 命令按时间回溯。
+""",
+        exercises=[
+            Exercise(
+                instruction="先用 dd 删除第一行，再用 u 撤销，最后删除第二行",
+                initial="保留这行\n删除这行",
+                expected="保留这行",
+                hint="按 dd 删除，按 u 撤销，按 j 到第二行，按 dd 删除",
+                commands_to_learn=["u", "dd"],
+                cursor_position=0,
+                solution="ddujdd:wq<CR>",
+            ),
+        ],
+    ),
+]
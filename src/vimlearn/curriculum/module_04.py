@@ -0,0 +1,108 @@
+"""Module 4: 文本对象."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="4.1",
+        title="内部文本对象 i",
+        module="文本对象",
+        module_num=4,
+        description="学习使用内部文本对象精确选择",
+        explanation="""
+文本对象让你可以操作结构化的文本块。内部文本对象 (i = inner)：
+
+  iw - 内部单词（不含周围空格）
+  i" - 引号内的内容（不含引号）
+  i' - 单引号内的内容
+  i( 或 ib - 括号内的内容
+  i{ 或 iB - 花括号内的内容
+  i[ - 方括号内的内容
+  it - HTML/XML 标签内的内容
+  ip - 段落内容
+  is - 句子内容
+
+用法：操作符 + i + 对象，如 di" 删除引号内内容
+""",
+        why="""
+为什么文本对象这么强大？
+
+文本对象让你可以从任意位置操作整个结构：
+- 光标在引号内任意位置，ci" 就能修改整个引号内容
+- 不需要先移动到开头，再选择到结尾
+
+这是 Vim 效率的核心秘密之一。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 ci\" 修改引号内的内容为 'Vim'",
+                initial='Hello "World"',
+                expected='Hello "Vim"',
+                hint="将光标移到引号内，按 ci\" 然后输入 Vim，按 Esc",
+                commands_to_learn=["ci\""],
+                cursor_position=7,
+                solution="ci\"Vim<Esc>:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 di( 删除括号内的内容",
+                initial="function(delete this)",
+                expected="function()",
+                hint="将光标移到括号内，按 di(",
+                commands_to_learn=["di("],
+                cursor_position=10,
+                solution="di(:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="4.2",
+        title="外部文本对象 a",
+        module="文本对象",
+        module_num=4,
+        description="学习使用外部文本对象（包含边界）",
+        explanation="""
+外部文本对象 (a = around) 包含边界字符或周围空格：
+
+  aw - 一个单词（含周围空格）
+  a" - 引号及其内容
+  a' - 单引号及其内容
+  a( 或 ab - 括号及其内容
+  a{ 或 aB - 花括号及其内容
+  a[ - 方括号及其内容
+  at - HTML/XML 标签及其内容
+  ap - 段落（含周围空行）
+
+i 和 a 的区别：
+  di" - 删除引号内内容，保留引号
+  da" - 删除引号和内容
+""",
+        why="""
+什么时候用 i，什么时候用 a？
+
+- 想保留容器（引号、括号等），用 i
+- 想连容器一起操作，用 a
+- 删除单词时，用 daw 会更干净（连空格一起删）
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 daw 删除单词 'bad'（包括周围空格）",
+                initial="this is bad text",
+                expected="this is text",
+                hint="移动到 bad 单词上，按 daw",
+                commands_to_learn=["daw"],
+                cursor_position=8,
+                solution="daw:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 da\" 删除整个引号字符串",
+                initial='keep "delete this" keep',
+                expected="keep keep",
+                hint="移动到引号内，按 da\"",
+                commands_to_learn=["da\""],
+                cursor_position=6,
+                solution="da\":wq<CR>",
+            ),
+        ],
+    ),
+]
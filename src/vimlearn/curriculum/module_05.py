@@ -0,0 +1,109 @@
+"""Module 5: 可视模式."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="5.1",
+        title="可视模式基础 v/V/Ctrl-v",
+        module="可视模式",
+        module_num=5,
+        description="学习三种可视模式",
+        explanation="""
+Vim 有三种可视模式用于选择文本：
+
+  v - 字符可视模式（逐字符选择）
+  V - 行可视模式（整行选择）
+  Ctrl-v - 块可视模式（矩形选择）
+
+选择后可以执行操作：
+  d - 删除选中内容
+  y - 复制选中内容
+  c - 修改选中内容
+  > - 增加缩进
+  < - 减少缩进
+  u - 转小写
+  U - 转大写
+
+按 Esc 或再按一次相同键退出可视模式。
+""",
+        why="""
+什么时候用可视模式？
+
+虽然 Vim 高手更多使用 动词+名词 的方式（如 d2w），
+但可视模式在以下场景很有用：
+- 不确定要选多少内容时，可以先看着选
+- 需要对不规则区域操作时
+- 块模式编辑多行时
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 V 选中两行，然后按 d 删除",
+                initial="保留\n删除1\n删除2\n保留",
+                expected="保留\n保留",
+                hint="按 j 到第二行，按 V 进入行可视模式，按 j 选中下一行，按 d 删除",
+                commands_to_learn=["V", "d"],
+                cursor_position=0,
+                solution="jVjd:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 v 选中 'select' 单词，然后按 U 转大写",
+                initial="please select this",
+                expected="please SELECT this",
+                hint="移动到 s，按 v 进入可视模式，按 e 选到词尾，按 U",
+                commands_to_learn=["v", "U"],
+                cursor_position=7,
+                solution="veU:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 V 选中两行代码，然后按 > 增加缩进",
+                initial="line1\nline2\nline3",
+                expected="line1\n\tline2\n\tline3",
+                hint="按 j 到第二行，按 V 选中，按 j 再选一行，按 > 缩进",
+                commands_to_learn=[">", "<"],
+                cursor_position=0,
+                solution="jVj>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="5.2",
+        title="块可视模式",
+        module="可视模式",
+        module_num=5,
+        description="学习块可视模式的强大功能",
+        explanation="""
+块可视模式 (Ctrl-v) 可以选择矩形区域：
+
+选择后的特殊操作：
+  I - 在块前插入（所有行）
+  A - 在块后追加（所有行）
+  c - 修改块内容（所有行）
+  r - 替换块内所有字符
+
+这对于编辑表格数据、批量添加前缀等非常有用。
+
+技巧：选择后按 I 或 A 输入文本，按 Esc 后会应用到所有行。
+""",
+        why="""
+块模式的实际应用场景：
+
+1. 给多行代码添加注释前缀 //
+2. 删除多行的相同前缀
+3. 在多行末尾添加分号
+4. 编辑对齐的表格数据
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 Ctrl-v 选中三行开头，按 I 添加 '# ' 注释",
+                initial="line 1\nline 2\nline 3",
+                expected="# line 1\n# line 2\n# line 3",
+                hint="按 Ctrl-v，按 jj 选中三行，按 I 输入 '# '，按 Esc",
+                commands_to_learn=["Ctrl-v", "I"],
+                cursor_position=0,
+                solution="<C-v>jjI# <Esc>:wq<CR>",
+            ),
+        ],
+    ),
+]
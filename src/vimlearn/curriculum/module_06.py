@@ -0,0 +1,129 @@
+"""Module 6: 搜索与替换."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="6.1",
+        title="搜索 /和?",
+        module="搜索与替换",
+        module_num=6,
+        description="学习在文件中搜索文本",
+        explanation="""
+搜索命令：
+
+  /pattern - 向下搜索 pattern
+  ?pattern - 向上搜索 pattern
+  n - 跳到下一个匹配
+  N - 跳到上一个匹配
+  * - 搜索光标下的单词（向下）
+  # - 搜索光标下的单词（向上）
+
+搜索支持正则表达式。按 Enter 确认搜索，按 Esc 取消。
+""",
+        why="""
+为什么用 / 和 ?
+
+这是从 ed 和 sed 编辑器继承的传统。
+/ 向下搜索很直观（像是在文档中向下翻找）。
+? 是 / 的反向版本。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 /vim 搜索 'vim'，然后按 n 跳到下一个匹配",
+                initial="学习 vim 很有趣\nvim 是最好的编辑器\n我爱 vim",
+                expected="学习 vim 很有趣\nvim 是最好的编辑器\n我爱 vim",
+                hint="输入 /vim 然后按 Enter，按 n 跳到下一个",
+                commands_to_learn=["/", "n"],
+                cursor_position=0,
+                solution="/vim<CR>n:wq<CR>",
+            ),
+            Exercise(
+                instruction="将光标移到 'error' 上，按 * 搜索所有 error，然后 :noh 清除高亮",
+                initial="error: file not found\nwarning: deprecated\nerror: timeout",
+                expected="error: file not found\nwarning: deprecated\nerror: timeout",
+                hint="移动到 error，按 * 搜索，输入 :noh 清除高亮，:wq 退出",
+                commands_to_learn=["*", ":noh"],
+                cursor_position=0,
+                solution="*:noh<CR>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="6.2",
+        title="行内搜索 f/t",
+        module="搜索与替换",
+        module_num=6,
+        description="学习在行内快速跳转到字符",
+        explanation="""
+行内搜索命令：
+
+  f{char} - 向右跳到字符 char（光标在字符上）
+  F{char} - 向左跳到字符 char
+  t{char} - 向右跳到字符 char 前一个位置
+  T{char} - 向左跳到字符 char 后一个位置
+  ; - 重复上次 f/t 搜索（同方向）
+  , - 重复上次 f/t 搜索（反方向）
+
+这是行内移动最快的方式！
+""",
+        why="""
+f 和 t 的区别？
+
+- f 落在目标字符上，适合删除到某字符（df,）
+- t 落在目标字符前，适合删除到某字符之前（dt,）
+
+技巧：寻找行内不常见的字符（如 x、z、标点）作为跳转目标。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 f, 跳到逗号，然后用 dt. 删除到句号前的内容",
+                initial="Hello, delete this part.",
+                expected="Hello,.",
+                hint="按 f, 跳到逗号，按 dt. 删除到句号前",
+                commands_to_learn=["f", "dt"],
+                cursor_position=0,
+                solution="f,ldt.:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="6.3",
+        title="替换 :s",
+        module="搜索与替换",
+        module_num=6,
+        description="学习搜索替换命令",
+        explanation="""
+替换命令：
+
+  :s/old/new/ - 替换当前行第一个 old 为 new
+  :s/old/new/g - 替换当前行所有 old 为 new
+  :%s/old/new/g - 替换整个文件所有 old 为 new
+  :%s/old/new/gc - 替换前逐个确认
+
+常用标志：
+  g - 全局替换（一行内多次）
+  c - 确认每次替换
+  i - 忽略大小写
+""",
+        why="""
+为什么替换命令这么复杂？
+
+:s 命令来自 sed，是一个非常强大的工具。
+它支持正则表达式，可以进行复杂的文本转换。
+虽然语法看起来复杂，但掌握后效率极高。
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 :%s/cat/dog/g 将所有 'cat' 替换为 'dog'",
+                initial="I have a cat.\nMy cat is cute.\ncat cat cat",
+                expected="I have a dog.\nMy dog is cute.\ndog dog dog",
+                hint="输入 :%s/cat/dog/g 然后按 Enter",
+                commands_to_learn=[":%s"],
+                cursor_position=0,
+                solution=":%s/cat/dog/g<CR>:wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,152 @@
+"""Module 7: 高级移动与跳转."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="7.1",
+        title="文件内跳转 gg/G/%",
+        module="高级移动与跳转",
+        module_num=7,
+        description="学习在文件内快速跳转",
+        explanation="""
+文件级跳转命令：
+
+  gg - 跳到文件开头
+  G - 跳到文件末尾
+  {n}G 或 {n}gg - 跳到第 n 行
+  % - 跳到匹配的括号 (){}[]
+
+屏幕内跳转：
+  H - 跳到屏幕顶部 (High)
+  M - 跳到屏幕中间 (Middle)
+  L - 跳到屏幕底部 (Low)
+
+滚动屏幕：
+  Ctrl-f - 向下翻页 (forward)
+  Ctrl-b - 向上翻页 (backward)
+  Ctrl-d - 向下半页 (down)
+  Ctrl-u - 向上半页 (up)
+  zz - 将当前行置于屏幕中央
+""",
+        why="""
+为什么需要这么多跳转方式？
+
+不同场景需要不同粒度的移动：
+- 编辑代码时，% 跳转括号配对非常有用
+- 浏览长文件时，Ctrl-d/u 比逐行滚动快得多
+- zz 让你专注于当前编辑的代码
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 G 跳到文件末尾，然后用 gg 回到开头",
+                initial="第一行\n第二行\n第三行\n第四行\n最后一行",
+                expected="第一行\n第二行\n第三行\n第四行\n最后一行",
+                hint="按 G 到末尾，按 gg 回到开头",
+                commands_to_learn=["G", "gg"],
+                cursor_position=0,
+                solution="Ggg:wq<CR>",
+            ),
+            Exercise(
+                instruction="使用 3G 跳到第3行，将 'three' 改为 'THREE'",
+                initial="one\ntwo\nthree\nfour",
+                expected="one\ntwo\nTHREE\nfour",
+                hint="按 3G 跳到第3行，按 cw 输入 THREE",
+                commands_to_learn=["3G", "cw"],
+                cursor_position=0,
+                solution="3GcwTHREE<Esc>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="7.2",
+        title="标记与跳转 m/'",
+        module="高级移动与跳转",
+        module_num=7,
+        description="学习使用标记保存位置",
+        explanation="""
+标记（Mark）让你保存位置并快速返回：
+
+设置标记：
+  m{a-z} - 设置本地标记（当前文件）
+  m{A-Z} - 设置全局标记（跨文件）
+
+跳转到标记：
+  '{a-z} - 跳到标记所在行
+  `{a-z} - 跳到标记的精确位置（行和列）
+
+特殊标记：
+  '' - 跳回上次跳转前的位置
+  `. - 跳到上次修改的位置
+  `^ - 跳到上次插入的位置
+
+跳转列表：
+  Ctrl-o - 跳到上一个位置 (older)
+  Ctrl-i - 跳到下一个位置 (newer)
+""",
+        why="""
+标记的实际用途：
+
+1. 在长文件中标记重要位置，快速来回跳转
+2. 用 `` 快速返回上次位置（非常常用！）
+3. 全局标记可以跨文件跳转
+4. Ctrl-o/i 让你在跳转历史中导航
+""",
+        exercises=[
+            Exercise(
+                instruction="用 ma 在第一行设置标记，跳到最后一行后用 'a 返回",
+                initial="标记这里\n中间行\n最后一行",
+                expected="标记这里\n中间行\n最后一行",
+                hint="按 ma 设置标记，按 G 到末尾，按 'a 返回",
+                commands_to_learn=["m", "'"],
+                cursor_position=0,
+                solution="maG'a:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="7.3",
+        title="窗口分割",
+        module="高级移动与跳转",
+        module_num=7,
+        description="学习分割窗口同时查看多个文件",
+        explanation="""
+窗口分割命令：
+
+  :sp [file] - 水平分割窗口 (split)
+  :vs [file] - 垂直分割窗口 (vertical split)
+  Ctrl-w s - 水平分割当前窗口
+  Ctrl-w v - 垂直分割当前窗口
+
+窗口间移动：
+  Ctrl-w h/j/k/l - 移动到左/下/上/右窗口
+  Ctrl-w w - 循环切换窗口
+  Ctrl-w Ctrl-w - 同上
+
+窗口操作：
+  Ctrl-w c - 关闭当前窗口
+  Ctrl-w o - 只保留当前窗口
+  Ctrl-w = - 平均分配窗口大小
+""",
+        why="""
+窗口分割的用途：
+
+1. 同时查看代码和测试文件
+2. 对比两个文件的差异
+3. 一边看文档一边写代码
+4. 查看同一文件的不同部分
+""",
+        exercises=[
+            Exercise(
+                instruction="这是了解性课程，直接 :wq 保存退出",
+                initial="窗口分割让你同时查看多个文件\n试试 :vs 和 Ctrl-w w",
+                expected="窗口分割让你同时查看多个文件\n试试 :vs 和 Ctrl-w w",
+                hint="输入 :wq 保存退出",
+                commands_to_learn=[":sp", ":vs", "Ctrl-w"],
+                cursor_position=0,
+                solution=":wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,193 @@
+"""Module 8: 文件与 Shell."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="8.1",
+        title="文件保存与退出",
+        module="文件与 Shell",
+        module_num=8,
+        description="掌握各种保存和退出方式",
+        explanation="""
+文件操作是服务器工作的基础：
+
+保存：
+  :w - 保存当前文件
+  :w filename - 另存为新文件
+  :w! - 强制保存（覆盖只读）
+
+退出：
+  :q - 退出（未修改时）
+  :q! - 强制退出（放弃修改）
+  :wq 或 :x 或 ZZ - 保存并退出
+  :wq! - 强制保存并退出
+
+组合：
+  :wa - 保存所有文件
+  :qa - 退出所有文件
+  :wqa - 保存并退出所有
+""",
+        why="""
+服务器上的常见场景：
+
+1. 编辑配置文件后 :wq 保存退出
+2. 改错了用 :q! 放弃修改
+3. 没有权限时用 :w !sudo tee % 保存
+4. ZZ 是最快的保存退出方式
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 ZZ 快速保存并退出（比 :wq 更快）",
+                initial="学会 ZZ 可以更快退出",
+                expected="学会 ZZ 可以更快退出",
+                hint="直接按大写 ZZ（Shift+z 两次）",
+                commands_to_learn=["ZZ", ":wq", ":q!"],
+                cursor_position=0,
+                solution="ZZ",
+            ),
+        ],
+    ),
+    Lesson(
+        id="8.2",
+        title="打开与切换文件",
+        module="文件与 Shell",
+        module_num=8,
+        description="学习在 Vim 中打开和切换多个文件",
+        explanation="""
+打开文件：
+  :e filename - 打开文件 (edit)
+  :e! - 重新加载当前文件（放弃修改）
+  :e . - 打开文件浏览器（当前目录）
+
+缓冲区（打开的文件列表）：
+  :ls 或 :buffers - 列出所有缓冲区
+  :bn - 下一个缓冲区 (buffer next)
+  :bp - 上一个缓冲区 (buffer previous)
+  :b2 - 跳到第 2 个缓冲区
+  :bd - 关闭当前缓冲区 (buffer delete)
+
+快速切换：
+  Ctrl-^ - 切换到上一个文件
+""",
+        why="""
+服务器上经常需要同时编辑多个文件：
+
+1. 编辑代码时参考另一个文件
+2. 同时修改配置文件和脚本
+3. 对比不同版本的文件
+
+缓冲区比反复打开关闭文件高效得多。
+""",
+        exercises=[
+            Exercise(
+                instruction="这是了解性课程，直接 :wq 保存退出",
+                initial="# 试试 :e . 浏览目录\n# 用 :ls 查看打开的文件",
+                expected="# 试试 :e . 浏览目录\n# 用 :ls 查看打开的文件",
+                hint="输入 :wq 保存退出",
+                commands_to_learn=[":e", ":ls", ":bn", ":bp"],
+                cursor_position=0,
+                solution=":wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="8.3",
+        title="执行 Shell 命令",
+        module="文件与 Shell",
+        module_num=8,
+        description="在 Vim 中执行外部命令",
+        explanation="""
+在 Vim 中执行 Shell 命令非常实用：
+
+执行命令：
+  :!command - 执行命令并显示结果
+  :!ls - 列出目录
+  :!pwd - 显示当前路径
+  :!bash - 临时进入 shell（exit 返回）
+
+读取命令输出到文件：
+  :r !command - 将命令输出插入光标下方
+  :r !date - 插入当前日期
+  :r !cat file - 插入另一个文件内容
+
+将选中内容传给命令：
+  :%!sort - 对整个文件排序
+  :'<,'>!sort - 对选中行排序
+
+挂起 Vim：
+  Ctrl-z - 挂起 Vim 回到 shell
+  fg - 在 shell 中输入 fg 返回 Vim
+""",
+        why="""
+服务器工作中的实际用途：
+
+1. :!ls 查看目录不用退出 Vim
+2. :r !date 快速插入时间戳
+3. :%!jq . 格式化 JSON 文件
+4. Ctrl-z 临时执行其他任务后返回
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 :r !date 在第二行插入当前日期时间",
+                initial="日志记录：",
+                expected="日志记录：",
+                hint="按 j 到第一行末尾，输入 :r !date",
+                commands_to_learn=[":!", ":r !"],
+                cursor_position=0,
+            ),
+        ],
+    ),
+    Lesson(
+        id="8.4",
+        title="查看大文件",
+        module="文件与 Shell",
+        module_num=8,
+        description="高效浏览和查看大文件",
+        explanation="""
+服务器上经常需要查看日志等大文件：
+
+只读打开（防止误修改）：
+  vim -R file 或 view file
+
+快速浏览：
+  Ctrl-f - 向下翻页
+  Ctrl-b - 向上翻页
+  Ctrl-d - 向下半页
+  Ctrl-u - 向上半页
+  gg - 跳到文件开头
+  G - 跳到文件末尾
+  50% - 跳到文件 50% 位置
+
+搜索定位：
+  /error - 搜索 error
+  ?error - 向上搜索
+  n/N - 下一个/上一个匹配
+  * - 搜索光标下的单词
+
+显示信息：
+  Ctrl-g - 显示文件名和位置
+  g Ctrl-g - 显示详细统计
+""",
+        why="""
+查看服务器日志的技巧：
+
+1. 用 G 跳到末尾看最新日志
+2. 用 ?error 从后往前搜索错误
+3. 用 :set nowrap 避免长行换行
+4. 用 view 打开防止误修改
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 G 跳到末尾，然后 ?ERROR 向上搜索",
+                initial="INFO: 启动服务\nINFO: 连接数据库\nERROR: 连接失败\nINFO: 重试中",
+                expected="INFO: 启动服务\nINFO: 连接数据库\nERROR: 连接失败\nINFO: 重试中",
+                hint="按 G 到末尾，输入 ?ERROR 回车",
+                commands_to_learn=["G", "?", "Ctrl-f", "Ctrl-b"],
+                cursor_position=0,
+                solution="G?ERROR<CR>:wq<CR>",
+            ),
+        ],
+    ),
+]
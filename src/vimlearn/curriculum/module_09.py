@@ -0,0 +1,138 @@
+"""Module 9: 实用配置."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="9.1",
+        title="行号与相对行号",
+        module="实用配置",
+        module_num=9,
+        description="学习配置行号显示",
+        explanation="""
+行号配置命令（在 Vim 中输入）：
+
+  :set number - 显示绝对行号
+  :set nonumber - 隐藏行号
+  :set relativenumber - 显示相对行号
+  :set norelativenumber - 隐藏相对行号
+
+推荐组合：
+  :set number relativenumber
+
+这会显示当前行的绝对行号，其他行显示相对行号。
+
+永久配置（写入 ~/.vimrc）：
+  set number
+  set relativenumber
+""",
+        why="""
+为什么用相对行号？
+
+相对行号让你一眼就能看出目标行距离多远：
+- 看到目标在 5 行下方，直接按 5j
+- 想删除到 8 行下方，直接按 d8j
+
+不需要心算 "81 - 73 = 8"，大大提高效率！
+""",
+        exercises=[
+            Exercise(
+                instruction="输入 :set number relativenumber 开启混合行号，然后 :wq 保存退出",
+                initial="第一行\n第二行\n第三行",
+                expected="第一行\n第二行\n第三行",
+                hint="输入 :set number relativenumber 然后回车，再 :wq",
+                commands_to_learn=[":set number", ":set relativenumber"],
+                cursor_position=0,
+                solution=":set number relativenumber<CR>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="9.2",
+        title="搜索配置",
+        module="实用配置",
+        module_num=9,
+        description="学习优化搜索体验的配置",
+        explanation="""
+搜索相关配置：
+
+  :set hlsearch - 高亮所有搜索匹配
+  :set nohlsearch - 关闭搜索高亮
+  :noh - 临时清除当前高亮（不关闭功能）
+
+  :set incsearch - 增量搜索（边输入边搜索）
+  :set ignorecase - 搜索忽略大小写
+  :set smartcase - 智能大小写（有大写时区分）
+
+推荐配置组合：
+  set hlsearch
+  set incsearch
+  set ignorecase
+  set smartcase
+""",
+        why="""
+smartcase 是什么？
+
+当 ignorecase 和 smartcase 都开启时：
+- 搜索 /hello 会匹配 Hello、HELLO、hello
+- 搜索 /Hello 只匹配 Hello（因为包含大写）
+
+这样既方便又灵活！
+""",
+        exercises=[
+            Exercise(
+                instruction="输入 :set hlsearch incsearch 然后搜索 /vim",
+                initial="vim is great\nI love vim\nVIM is powerful",
+                expected="vim is great\nI love vim\nVIM is powerful",
+                hint="输入 :set hlsearch incsearch 回车，然后 /vim 回车",
+                commands_to_learn=[":set hlsearch", ":set incsearch"],
+                cursor_position=0,
+                solution=":set hlsearch incsearch<CR>/vim<CR>:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="9.3",
+        title="缩进与制表符",
+        module="实用配置",
+        module_num=9,
+        description="学习配置缩进行为",
+        explanation="""
+缩进相关配置：
+
+  :set tabstop=4 - Tab 显示为 4 个空格宽
+  :set shiftwidth=4 - 自动缩进的宽度
+  :set expandtab - 将 Tab 转换为空格
+  :set noexpandtab - 保留真正的 Tab
+  :set autoindent - 新行继承上一行缩进
+  :set smartindent - 智能缩进（识别代码结构）
+
+缩进操作：
+  >> - 增加当前行缩进
+  << - 减少当前行缩进
+  = - 自动格式化缩进
+  gg=G - 格式化整个文件的缩进
+""",
+        why="""
+Tab vs 空格之争？
+
+这是程序员永恒的话题。建议：
+- 遵循项目已有的风格
+- Python 推荐 4 空格
+- 很多项目用 2 空格
+- expandtab 可以避免 Tab/空格混用的问题
+""",
+        exercises=[
+            Exercise(
+                instruction="使用 >> 增加第二行的缩进（会添加一个 Tab 或空格）",
+                initial="if true:\nprint('hi')",
+                expected="if true:\n\tprint('hi')",
+                hint="按 j 到第二行，按 >> 增加缩进",
+                commands_to_learn=[">>"],
+                cursor_position=0,
+                solution="j>>:wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,103 @@
+"""Module 10: 宏与重复."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="10.1",
+        title="点命令重复",
+        module="宏与重复",
+        module_num=10,
+        description="学习使用点命令重复操作",
+        explanation="""
+点命令 (.) 是 Vim 最强大的命令之一：
+
+  . - 重复上一次修改操作
+
+什么算"修改操作"？
+- 从进入插入模式到退出的所有输入
+- 删除操作（d、x 等）
+- 修改操作（c、r、s 等）
+- 粘贴操作（p）
+
+技巧：设计你的操作，让它可以被 . 重复
+例如：ciw 修改单词后，可以用 n. 找下一个并重复修改
+""",
+        why="""
+为什么点命令这么重要？
+
+点命令体现了 Vim 的哲学：
+1. 做一次操作
+2. 移动到下一个位置
+3. 按 . 重复
+
+这比录制宏更轻量，比手动重复更高效。
+""",
+        exercises=[
+            Exercise(
+                instruction="用 x 删除第一个字符，然后按 . 两次删除后面两个",
+                initial="abcdef",
+                expected="def",
+                hint="按 x 删除 a，按 . 删除 b，再按 . 删除 c",
+                commands_to_learn=[".", "x"],
+                cursor_position=0,
+                solution="x..:wq<CR>",
+            ),
+            Exercise(
+                instruction="用 cw 将 'aa' 改为 'xx'，然后用 w. 修改其他的",
+                initial="aa bb aa",
+                expected="xx bb xx",
+                hint="按 cw 输入 xx，按 Esc，按 w 跳过 bb，按 w 到第二个 aa，按 .",
+                commands_to_learn=[".", "cw", "w"],
+                cursor_position=0,
+                solution="cwxx<Esc>ww.:wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="10.2",
+        title="宏录制与播放",
+        module="宏与重复",
+        module_num=10,
+        description="学习录制和使用宏",
+        explanation="""
+宏可以录制一系列操作并重复播放：
+
+录制宏：
+  q{a-z} - 开始录制到寄存器（如 qa）
+  q - 停止录制
+
+播放宏：
+  @{a-z} - 播放寄存器中的宏（如 @a）
+  @@ - 重复上次播放的宏
+  {n}@{a-z} - 播放宏 n 次
+
+技巧：
+1. 录制前先想好完整流程
+2. 从行首开始（按 0）确保位置一致
+3. 用 j 移动到下一行，方便重复
+""",
+        why="""
+什么时候用宏？
+
+当你需要对多行/多处做相同的复杂操作时：
+- 格式化多行数据
+- 批量重命名
+- 重复的代码修改
+
+宏比点命令更强大，可以包含移动和多个操作。
+""",
+        exercises=[
+            Exercise(
+                instruction="录制宏：qa 开始，I# <Esc>j 添加注释并下移，q 结束。然后 2@a 应用到剩余行",
+                initial="line 1\nline 2\nline 3",
+                expected="# line 1\n# line 2\n# line 3",
+                hint="按 qa 开始录制，I# <Esc>j，按 q 停止，按 2@a",
+                commands_to_learn=["q", "@"],
+                cursor_position=0,
+                solution="qaI# <Esc>jq2@a:wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,155 @@
+"""Module 11: 插件与进阶."""
+
+from ..lesson import Exercise, Lesson
+
+
+LESSONS = [
+    Lesson(
+        id="11.1",
+        title="插件管理器",
+        module="插件与进阶",
+        module_num=11,
+        description="了解 Vim 插件生态",
+        explanation="""
+Vim 有丰富的插件生态。常用插件管理器：
+
+vim-plug（推荐，简单易用）：
+  安装：curl -fLo ~/.vim/autoload/plug.vim --create-dirs \\
+    https://raw.githubusercontent.com/junegunn/vim-plug/master/plug.vim
+
+在 ~/.vimrc 中配置：
+  call plug#begin('~/.vim/plugged')
+  Plug 'tpope/vim-surround'      " 快速修改包围符号
+  Plug 'preservim/nerdtree'      " 文件树
+  Plug 'junegunn/fzf.vim'        " 模糊搜索
+  call plug#end()
+
+安装插件：:PlugInstall
+更新插件：:PlugUpdate
+删除插件：:PlugClean
+""",
+        why="""
+为什么需要插件？
+
+Vim 本身已经很强大，但插件可以：
+- 添加新功能（文件树、Git 集成）
+- 增强现有功能（更好的补全、语法高亮）
+- 提高特定语言的开发体验
+
+建议：先熟悉原生 Vim，再逐步添加插件。
+""",
+        exercises=[
+            Exercise(
+                instruction="这是一个了解性课程，直接 :wq 保存退出即可",
+                initial="# Vim 插件让编辑更高效\n# 但先掌握基础更重要",
+                expected="# Vim 插件让编辑更高效\n# 但先掌握基础更重要",
+                hint="输入 :wq 保存退出",
+                commands_to_learn=[":PlugInstall"],
+                cursor_position=0,
+                solution=":wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="11.2",
+        title="常用插件推荐",
+        module="插件与进阶",
+        module_num=11,
+        description="了解最实用的 Vim 插件",
+        explanation="""
+强烈推荐的插件：
+
+1. vim-surround - 快速操作包围符号
+   cs"' - 将双引号改为单引号
+   ds" - 删除双引号
+   ysiw" - 给单词加双引号
+
+2. vim-commentary - 快速注释
+   gcc - 注释/取消注释当前行
+   gc{motion} - 注释移动范围
+
+3. fzf.vim - 模糊搜索文件
+   :Files - 搜索文件
+   :Rg - 搜索文件内容
+
+4. NERDTree - 文件树
+   :NERDTreeToggle - 开关文件树
+
+5. coc.nvim - 智能补全（需要 Node.js）
+   提供 VSCode 级别的自动补全
+""",
+        why="""
+如何选择插件？
+
+1. 解决实际痛点，不要为了装而装
+2. 选择活跃维护的项目
+3. 阅读文档，了解所有功能
+4. 一次只添加一个，熟悉后再加下一个
+""",
+        exercises=[
+            Exercise(
+                instruction="这是一个了解性课程，直接 :wq 保存退出即可",
+                initial="# 推荐先尝试 vim-surround\n# 它能大大提高编辑效率",
+                expected="# 推荐先尝试 vim-surround\n# 它能大大提高编辑效率",
+                hint="输入 :wq 保存退出",
+                commands_to_learn=["vim-surround", "vim-commentary"],
+                cursor_position=0,
+                solution=":wq<CR>",
+            ),
+        ],
+    ),
+    Lesson(
+        id="11.3",
+        title="vimrc 配置建议",
+        module="插件与进阶",
+        module_num=11,
+        description="学习配置你自己的 vimrc",
+        explanation="""
+推荐的 ~/.vimrc 基础配置：
+
+" 基础设置
+set nocompatible          " 不兼容 vi
+set encoding=utf-8        " UTF-8 编码
+set number relativenumber " 混合行号
+set cursorline            " 高亮当前行
+set showmatch             " 显示匹配括号
+set wildmenu              " 命令行补全菜单
+
+" 搜索设置
+set hlsearch incsearch    " 高亮和增量搜索
+set ignorecase smartcase  " 智能大小写
+
+" 缩进设置
+set tabstop=4 shiftwidth=4
+set expandtab             " Tab 转空格
+set autoindent smartindent
+
+" 其他实用设置
+set clipboard=unnamed     " 使用系统剪贴板
+set mouse=a               " 启用鼠标
+set scrolloff=5           " 光标距边缘5行
+syntax on                 " 语法高亮
+""",
+        why="""
+vimrc 的哲学：
+
+1. 从简单开始，逐步添加
+2. 理解每一行配置的作用
+3. 不要盲目复制别人的配置
+4. 定期清理不用的配置
+
+你的 vimrc 应该是为你自己定制的！
+""",
+        exercises=[
+            Exercise(
+                instruction="这是最后一课！输入 :wq 完成整个课程",
+                initial="恭喜你完成了 VimLearn 的所有课程！\n现在你已经掌握了 Vim 的核心技能。\n继续练习，Vim 会成为你最强大的工具！",
+                expected="恭喜你完成了 VimLearn 的所有课程！\n现在你已经掌握了 Vim 的核心技能。\n继续练习，Vim 会成为你最强大的工具！",
+                hint="输入 :wq 保存退出，完成课程！",
+                commands_to_learn=["~/.vimrc"],
+                cursor_position=0,
+                solution=":wq<CR>",
+            ),
+        ],
+    ),
+]
@@ -1,33 +1,88 @@
 """Exercise verification for VimLearn."""
 
-import os
+import re
 import subprocess
-import tempfile
-import uuid
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from .lesson import Exercise
+from .profiles import DEFAULT_PROFILE, LaunchProfile, get_profile, parse_startup_time
+from .workspace import Workspace
+
+# Vim key notation such as <Esc>, <CR> or <C-v>; a literal "<" is written <lt>
+_KEY_NOTATION = re.compile(r"<([A-Za-z][A-Za-z0-9-]*)>")
+
+
+def vim_key_string(keys: str) -> str:
+    """Convert Vim key notation into the body of a Vim double-quoted string."""
+    parts = []
+    pos = 0
+    for match in _KEY_NOTATION.finditer(keys):
+        parts.append(keys[pos:match.start()].replace("\\", "\\\\").replace('"', '\\"'))
+        parts.append("\\" + match.group(0))
+        pos = match.end()
+    parts.append(keys[pos:].replace("\\", "\\\\").replace('"', '\\"'))
+    return "".join(parts)
+
+
+def _vim_single_quoted(text: str) -> str:
+    """Escape text for use inside a Vim single-quoted string."""
+    return text.replace("'", "''")
 
 
 class ExerciseRunner:
     """Handles exercise file creation, vim execution, and verification."""
 
-    def __init__(self):
-        self.temp_dir = Path(tempfile.gettempdir())
+    def __init__(self, workspace: Optional[Workspace] = None, profile: Optional[LaunchProfile] = None):
+        self.workspace = workspace or Workspace()
+        self.profile = profile or get_profile(DEFAULT_PROFILE)
         self.current_file: Optional[Path] = None
+        self.session_files: list[Path] = []
+        # Milliseconds from spawn to first screen draw of the last Vim launch
+        self.last_startup_ms: Optional[float] = None
+        # Entered around each interactive Vim, e.g. to repaint the UI afterwards
+        self.suspend: Callable[[], AbstractContextManager] = nullcontext
+
+    def vim_command(self) -> list[str]:
+        """Get the Vim command for the current profile, logging startup time."""
+        self.last_startup_ms = None
+        log_file = self.workspace.helper_file("startuptime.log")
+        self.workspace.discard(log_file)
+        return [*self.profile.command(), "--startuptime", str(log_file)]
+
+    def read_startup_time(self) -> Optional[float]:
+        """Read the startup time of the last launch from its startup log."""
+        try:
+            with open(self.workspace.helper_file("startuptime.log"), "r", encoding="utf-8") as f:
+                self.last_startup_ms = parse_startup_time(f.read())
+        except OSError:
+            self.last_startup_ms = None
+        return self.last_startup_ms
+
+    def _write_exercise_file(self, exercise: Exercise, slot: Optional[int] = None) -> Path:
+        """Write the exercise's initial content, replacing any previous attempt."""
+        filepath = self.workspace.exercise_file(exercise, slot)
+        self.workspace.discard(filepath)
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(exercise.initial)
+        return filepath
 
     def create_exercise_file(self, exercise: Exercise) -> Path:
-        """Create a temporary file with the exercise's initial content."""
-        filename = f"vimlearn_exercise_{uuid.uuid4().hex[:8]}.txt"
-        self.current_file = self.temp_dir / filename
-        with open(self.current_file, "w", encoding="utf-8") as f:
-            f.write(exercise.initial)
+        """Create the session's file for an exercise with its initial content."""
+        self.cleanup()
+        self.current_file = self._write_exercise_file(exercise)
         return self.current_file
 
+    def create_session_files(self, exercises: list[Exercise]) -> list[Path]:
+        """Create one file per exercise for a multi-exercise session."""
+        self.cleanup()
+        self.session_files = [self._write_exercise_file(exercise, i) for i, exercise in enumerate(exercises)]
+        return self.session_files
+
     def run_vim(self, filepath: Path, cursor_position: Optional[int] = None) -> bool:
         """Open vim with the exercise file. Returns True if vim exited normally."""
-        vim_cmd = ["vim"]
+        vim_cmd = self.vim_command()
 
         if cursor_position is not None:
             # Position cursor at specific column on first line
@@ -36,10 +91,83 @@ class ExerciseRunner:
         vim_cmd.append(str(filepath))
 
         try:
-            result = subprocess.run(vim_cmd)
+            with self.suspend():
+                result = subprocess.run(vim_cmd)
+            return result.returncode == 0
+        except FileNotFoundError:
+            return False
+        finally:
+            self.read_startup_time()
+
+    def run_vim_session(self, filepaths: list[Path], exercises: list[Exercise], titles: list[str]) -> bool:
+        """
+        Open several exercise files as tabs of a single vim.
+
+        Each tab shows its title in the status line and echoes it on entry;
+        cursors are placed per exercise. Returns True if vim exited normally.
+        """
+        script = [
+            "set laststatus=2",
+            "set statusline=%{get(b:,'vimlearn_title','')}%=%t",
+            "augroup vimlearn",
+            "  autocmd!",
+            "  autocmd BufEnter * if exists('b:vimlearn_title') | echo b:vimlearn_title | endif",
+            "augroup END",
+        ]
+        for tab, (exercise, title) in enumerate(zip(exercises, titles), 1):
+            column = 1 if exercise.cursor_position is None else exercise.cursor_position + 1
+            script.append(f"{tab}tabnext")
+            script.append(f"let b:vimlearn_title = '{_vim_single_quoted(title)}'")
+            script.append(f"call cursor(1, {column})")
+        script.append("1tabnext")
+        script.append("echo b:vimlearn_title")
+
+        script_file = self.workspace.helper_file("session.vim")
+        with open(script_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(script) + "\n")
+
+        vim_cmd = [*self.vim_command(), "--cmd", f"set tabpagemax={max(len(filepaths), 10)}", "-p"]
+        vim_cmd.extend(str(filepath) for filepath in filepaths)
+        vim_cmd.extend(["-S", str(script_file)])
+
+        try:
+            with self.suspend():
+                result = subprocess.run(vim_cmd)
             return result.returncode == 0
         except FileNotFoundError:
             return False
+        finally:
+            self.workspace.discard(script_file)
+            self.read_startup_time()
+
+    def run_vim_headless(self, filepath: Path, keys: str, cursor_position: Optional[int] = None, timeout: float = 10.0) -> bool:
+        """
+        Replay keystrokes (Vim key notation) on the file in silent Ex mode.
+
+        Uses a clean Vim (no vimrc, viminfo or swap file) so results don't
+        depend on the local configuration. Returns True if Vim exited normally.
+        """
+        # Ex mode starts on the last line, so always place the cursor explicitly
+        column = 1 if cursor_position is None else cursor_position + 1
+        vim_cmd = [
+            "vim", "-N", "-Es", "-u", "NONE", "-i", "NONE", "-n",
+            "-c", f"call cursor(1, {column})",
+            "-c", f'call feedkeys("{vim_key_string(keys)}", "tx")',
+            "-c", "qa!",
+            str(filepath),
+        ]
+
+        try:
+            result = subprocess.run(
+                vim_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+            )
+            return result.returncode == 0
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return False
 
     def verify_result(self, exercise: Exercise) -> tuple[bool, str, str]:
         """
@@ -48,10 +176,19 @@ class ExerciseRunner:
         Returns:
             tuple: (success, actual_content, expected_content)
         """
-        if self.current_file is None or not self.current_file.exists():
+        return self.verify_file(self.current_file, exercise)
+
+    def verify_file(self, filepath: Optional[Path], exercise: Exercise) -> tuple[bool, str, str]:
+        """
+        Verify an exercise result stored in the given file.
+
+        Returns:
+            tuple: (success, actual_content, expected_content)
+        """
+        if filepath is None or not filepath.exists():
             return False, "", exercise.expected
 
-        with open(self.current_file, "r", encoding="utf-8") as f:
+        with open(filepath, "r", encoding="utf-8") as f:
             actual = f.read()
 
         # Normalize: strip trailing whitespace from each line and trailing newlines
@@ -62,13 +199,17 @@ class ExerciseRunner:
         return success, actual, exercise.expected
 
     def cleanup(self) -> None:
-        """Remove the temporary exercise file."""
-        if self.current_file and self.current_file.exists():
-            try:
-                os.remove(self.current_file)
-            except OSError:
-                pass
-            self.current_file = None
+        """Remove the current exercise files and their swap files."""
+        for filepath in [self.current_file, *self.session_files]:
+            if filepath is not None:
+                self.workspace.discard(filepath)
+        self.current_file = None
+        self.session_files = []
+
+    def close(self) -> None:
+        """Remove the whole session workspace."""
+        self.cleanup()
+        self.workspace.remove()
 
     def run_exercise(self, exercise: Exercise) -> tuple[bool, str, str]:
         """
@@ -84,3 +225,18 @@ class ExerciseRunner:
             return False, "", exercise.expected
 
         return self.verify_result(exercise)
+
+    def run_exercises(self, exercises: list[Exercise], titles: list[str]) -> list[tuple[bool, str, str]]:
+        """
+        Run several exercises in one vim session, then verify each file.
+
+        Returns:
+            list: (success, actual_content, expected_content) per exercise
+        """
+        filepaths = self.create_session_files(exercises)
+        vim_success = self.run_vim_session(filepaths, exercises, titles)
+
+        if not vim_success:
+            return [(False, "", exercise.expected) for exercise in exercises]
+
+        return [self.verify_file(filepath, exercise) for filepath, exercise in zip(filepaths, exercises)]
@@ -0,0 +1,84 @@
+"""Single-keypress input for menus.
+
+On a terminal, keys are read in raw mode one at a time, so a menu choice
+needs no Enter. The terminal mode is restored before returning, even on
+errors. Escape sequences (arrow keys and the like) are read whole and
+named, Ctrl-C and Ctrl-D raise KeyboardInterrupt and EOFError as
+``input()`` would. Without a terminal (or termios), callers fall back to
+line input.
+"""
+
+import codecs
+import os
+import select
+import sys
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    tty = None
+
+# Seconds to wait for the rest of an escape sequence before treating ESC as a key
+ESCAPE_TIMEOUT = 0.05
+
+ESCAPE_NAMES = {
+    "[A": "up", "[B": "down", "[C": "right", "[D": "left",
+    "OA": "up", "OB": "down", "OC": "right", "OD": "left",
+    "[H": "home", "[F": "end", "[3~": "delete",
+}
+
+
+def can_read_keys() -> bool:
+    """Check whether single keys can be read from stdin."""
+    return termios is not None and sys.stdin.isatty()
+
+
+def _pending(fd: int, timeout: float) -> bool:
+    return bool(select.select([fd], [], [], timeout)[0])
+
+
+def _read_escape(fd: int) -> str:
+    """Read the rest of an escape sequence after ESC and name it."""
+    if not _pending(fd, ESCAPE_TIMEOUT):
+        return "esc"
+    sequence = os.read(fd, 1).decode("ascii", "replace")
+    if sequence in "[O":
+        # Parameters, then a final byte in @..~
+        while _pending(fd, ESCAPE_TIMEOUT):
+            char = os.read(fd, 1).decode("ascii", "replace")
+            sequence += char
+            if "@" <= char <= "~":
+                break
+    return ESCAPE_NAMES.get(sequence, "")
+
+
+def read_key() -> str:
+    """
+    Read one keypress from the terminal. Returns the character typed,
+    "enter", "esc", an arrow name, or "" for unrecognized sequences.
+    """
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")("replace")
+    try:
+        tty.setraw(fd)
+        key = ""
+        while not key:
+            byte = os.read(fd, 1)
+            if not byte:
+                raise EOFError
+            key = decoder.decode(byte)
+        if key == "\x1b":
+            return _read_escape(fd)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    if key == "\x03":
+        raise KeyboardInterrupt
+    if key == "\x04":
+        raise EOFError
+    if key in ("\r", "\n"):
+        return "enter"
+    return key
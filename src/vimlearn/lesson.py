@@ -1,7 +1,11 @@
 """Lesson data structures for VimLearn."""
 
+import importlib
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .catalog import LessonCatalog
 
 
 @dataclass
@@ -14,6 +18,9 @@ class Exercise:
     hint: str
     commands_to_learn: list[str] = field(default_factory=list)
     cursor_position: Optional[int] = None
+    # Reference keystrokes in Vim key notation (e.g. "cwnew<Esc>:wq<CR>"),
+    # replayed by `vimlearn selftest` to check that `expected` is reachable.
+    solution: Optional[str] = None
 
 
 @dataclass
@@ -28,6 +35,23 @@ class Lesson:
     explanation: str
     exercises: list[Exercise]
     why: Optional[str] = None
+    # Recommended Vim launch profile (see profiles.py); None uses the module's default profile
+    vim_profile: Optional[str] = None
+
+    @property
+    def lesson_num(self) -> int:
+        """Get the lesson number within the module."""
+        return int(self.id.split(".")[1])
+
+
+@dataclass(frozen=True)
+class LessonHeader:
+    """Lightweight lesson metadata, available without loading lesson content."""
+
+    id: str
+    title: str
+    module: str
+    module_num: int
 
     @property
     def lesson_num(self) -> int:
@@ -37,12 +61,25 @@ class Lesson:
 
 @dataclass
 class Module:
-    """Represents a module containing multiple lessons."""
+    """Represents a module containing multiple lessons.
+
+    ``lessons`` holds either full lessons or headers. With headers, ``source``
+    names the Python module whose ``LESSONS`` list provides the full content.
+    """
 
     num: int
     title: str
     description: str
-    lessons: list[Lesson] = field(default_factory=list)
+    lessons: list[Union[LessonHeader, Lesson]] = field(default_factory=list)
+    source: Optional[str] = None
+    # Default Vim launch profile for the module's lessons
+    vim_profile: Optional[str] = None
+
+    def load_lessons(self) -> list[Lesson]:
+        """Get the full lessons of this module, importing its source if needed."""
+        if self.source is None:
+            return [lesson for lesson in self.lessons if isinstance(lesson, Lesson)]
+        return list(importlib.import_module(self.source).LESSONS)
 
 
 def parse_lesson_id(lesson_id: str) -> tuple[int, int]:
@@ -51,25 +88,23 @@ def parse_lesson_id(lesson_id: str) -> tuple[int, int]:
     return int(parts[0]), int(parts[1])
 
 
-def get_next_lesson_id(current_id: str, all_lessons: list[Lesson]) -> Optional[str]:
+def _catalog_for(all_lessons: Optional[Sequence[Lesson]]) -> "LessonCatalog":
+    """Get the catalog index for a lesson sequence, reusing the built-in one."""
+    from .lessons import CATALOG
+    from .catalog import LessonCatalog
+
+    if all_lessons is None:
+        return CATALOG
+    if isinstance(all_lessons, LessonCatalog):
+        return all_lessons
+    return LessonCatalog.from_lessons(all_lessons)
+
+
+def get_next_lesson_id(current_id: str, all_lessons: Optional[Sequence[Lesson]] = None) -> Optional[str]:
     """Get the next lesson ID after the current one."""
-    lesson_ids = [lesson.id for lesson in all_lessons]
-    try:
-        current_index = lesson_ids.index(current_id)
-        if current_index + 1 < len(lesson_ids):
-            return lesson_ids[current_index + 1]
-    except ValueError:
-        pass
-    return None
+    return _catalog_for(all_lessons).next_id(current_id)
 
 
-def get_previous_lesson_id(current_id: str, all_lessons: list[Lesson]) -> Optional[str]:
+def get_previous_lesson_id(current_id: str, all_lessons: Optional[Sequence[Lesson]] = None) -> Optional[str]:
     """Get the previous lesson ID before the current one."""
-    lesson_ids = [lesson.id for lesson in all_lessons]
-    try:
-        current_index = lesson_ids.index(current_id)
-        if current_index > 0:
-            return lesson_ids[current_index - 1]
-    except ValueError:
-        pass
-    return None
+    return _catalog_for(all_lessons).previous_id(current_id)
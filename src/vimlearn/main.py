@@ -1,20 +1,79 @@
-"""Main entry point for VimLearn CLI."""
+"""Main entry point for VimLearn CLI.
 
+Startup is on the critical path of shell prompts, so only what every
+command needs is imported here. Feature modules are imported by the
+commands that use them, and the rich-based ``ui`` module is loaded on first
+use. tests/test_startup.py checks the import-time budget.
+"""
+
+import importlib.util
+import json
 import shutil
+import sys
+import time
 import typer
-from typing import Optional
-
-from .user import User, list_users
-from .lesson import get_next_lesson_id, parse_lesson_id
-from .lessons import MODULES, get_lesson, get_all_lessons
-from .exercise import ExerciseRunner
-from . import ui
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .user import User, list_user_summaries
+from .lessons import MODULES, CATALOG, get_all_lessons, get_catalog_hash
+from .profiles import AUTO, PROFILE_NAMES, resolve_profile
+from .report import STALL_DAYS
+
+if TYPE_CHECKING:
+    from .channel import VimChannel
+    from .exercise import ExerciseRunner
+
+
+def _lazy_import(name: str):
+    """Get a module that is only executed when one of its attributes is used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ui = _lazy_import("vimlearn.ui")
+
+
+def _write_ndjson(rows: Iterable[dict]) -> None:
+    """Stream rows to stdout as NDJSON, one object per line, without loading the UI."""
+    for row in rows:
+        sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def _lesson_rows(user: Optional[User] = None) -> Iterator[dict]:
+    """Yield one row per lesson, with the user's status and attempt totals if given."""
+    for module in MODULES:
+        for lesson in module.lessons:
+            row = {"module": module.num, "module_title": module.title, "id": lesson.id, "title": lesson.title}
+            if user is not None:
+                entries = user.history.get(lesson.id, {}).values()
+                row.update(
+                    completed=lesson.id in user.completed,
+                    exercises=len(entries),
+                    attempts=sum(e["attempts"] for e in entries),
+                    passed=sum(1 for e in entries if e["successes"]),
+                    first_try=sum(1 for e in entries if e["first_try"]),
+                    seconds=round(sum(e["seconds"] for e in entries), 1),
+                )
+            yield row
 
 app = typer.Typer(
     name="vimlearn",
     help="交互式 Vim 学习工具",
     add_completion=False,
 )
+users_app = typer.Typer(help="用户管理。")
+app.add_typer(users_app, name="users")
+
+# Recently active users offered when no username is given.
+RECENT_USERS = 9
 
 
 def check_vim_installed() -> bool:
@@ -26,54 +85,104 @@ def check_vim_installed() -> bool:
 def start(
     username: Optional[str] = typer.Option(None, "--user", "-u", help="用户名"),
     lesson: Optional[str] = typer.Option(None, "--lesson", "-l", help="指定课程 ID (如 1.1)"),
+    command: Optional[str] = typer.Option(None, "--command", "-c", help="直接练习指定命令 (如 dw)"),
+    batch: bool = typer.Option(False, "--batch", "-b", help="在同一个 Vim 中打开本课所有练习"),
+    persistent: bool = typer.Option(False, "--persistent", "-P", help="全程使用同一个 Vim，练习在 Vim 内切换"),
+    vim_profile: Optional[str] = typer.Option(None, "--vim-profile", help="Vim 启动配置: clean / user / custom"),
+    alt_screen: bool = typer.Option(False, "--alt-screen/--no-alt-screen", help="在终端备用屏幕中运行，只重绘变化的部分（画面超出终端高度时退回普通输出）"),
+    lowbw: Optional[bool] = typer.Option(None, "--lowbw/--no-lowbw", help="低带宽显示（默认按用户设置或自动检测）"),
 ):
     """开始学习 Vim。"""
     if not check_vim_installed():
         ui.print_vim_not_found()
         raise typer.Exit(1)
 
+    ui.set_low_bandwidth(ui.resolve_low_bandwidth({}, lowbw))
     ui.clear_screen()
     ui.print_welcome()
 
     # Get or create user
     if username is None:
-        username = ui.prompt_username()
+        username = ui.prompt_username(list_user_summaries()[:RECENT_USERS])
         if not username:
             ui.print_error("用户名不能为空")
             raise typer.Exit(1)
 
     user = User.load_or_create(username)
+    ui.set_low_bandwidth(ui.resolve_low_bandwidth(user.settings, lowbw))
+    if vim_profile is not None:
+        try:
+            resolve_profile(user.settings, override=vim_profile)
+        except ValueError as e:
+            ui.print_error(str(e))
+            raise typer.Exit(1)
 
     # Determine starting lesson
     if lesson:
-        if get_lesson(lesson) is None:
+        if lesson not in CATALOG:
             ui.print_error(f"课程 {lesson} 不存在")
             raise typer.Exit(1)
         user.set_current_lesson(lesson)
 
-    run_learning_session(user)
+    # Jump straight to the first exercise practicing a command
+    start_exercise = 0
+    if command:
+        from .commands import load_command_index
 
+        match = load_command_index(get_catalog_hash(), get_all_lessons).first(command)
+        if match is None:
+            ui.print_error(f"没有练习命令 {command} 的课程")
+            raise typer.Exit(1)
+        user.set_current_lesson(match.lesson_id)
+        start_exercise = match.exercise_index
+
+    # Taken only once the arguments are validated, so an early exit cannot leave it held
+    holder = user.acquire_session()
+    if holder is not None:
+        ui.print_session_in_use(username, holder)
+    try:
+        if persistent and run_persistent_session(user, start_exercise, vim_profile):
+            return
+        with ui.alternate_screen(alt_screen):
+            run_learning_session(user, start_exercise, batch, vim_profile)
+    finally:
+        user.release_session()
+
+
+def record_vim_launch(user: User, runner: "ExerciseRunner") -> None:
+    """Record the startup latency of the runner's last Vim launch."""
+    if runner.last_startup_ms is not None:
+        user.record_vim_launch(runner.profile.name, runner.last_startup_ms)
+
+
+def run_learning_session(
+    user: User,
+    start_exercise: int = 0,
+    batch: bool = False,
+    vim_profile: Optional[str] = None,
+) -> None:
+    """Run the main learning session loop, optionally starting mid-lesson."""
+    from .exercise import ExerciseRunner
 
-def run_learning_session(user: User) -> None:
-    """Run the main learning session loop."""
-    all_lessons = get_all_lessons()
     runner = ExerciseRunner()
+    runner.suspend = ui.suspend_screen
+    runner.workspace.install_signal_handlers()
 
     while True:
-        current_lesson = get_lesson(user.current_lesson)
+        current_lesson = CATALOG.load(user.current_lesson)
         if current_lesson is None:
             ui.print_all_complete()
             break
 
         # Calculate progress info
-        module_num, lesson_num = parse_lesson_id(current_lesson.id)
-        module_lessons = [l for l in all_lessons if l.module_num == module_num]
+        module_num, lesson_num = CATALOG.parse_id(current_lesson.id)
+        module_lessons = CATALOG.module_lessons(module_num)
         total_lessons_in_module = len(module_lessons)
 
         ui.clear_screen()
         ui.print_header(
             user=user,
-            total_lessons=len(all_lessons),
+            total_lessons=len(CATALOG),
             current_module=module_num,
             total_modules=len(MODULES),
             current_lesson_in_module=lesson_num,
@@ -81,10 +190,16 @@ def run_learning_session(user: User) -> None:
         )
 
         ui.print_lesson_header(current_lesson)
-        ui.print_explanation(current_lesson.explanation)
+        ui.print_explanation(current_lesson.explanation, current_lesson.id)
+
+        runner.profile = resolve_profile(user.settings, CATALOG.vim_profile(current_lesson), vim_profile)
 
         # Run exercises
-        lesson_completed = run_lesson_exercises(user, current_lesson, runner)
+        if batch:
+            lesson_completed = run_lesson_batch(user, current_lesson, runner, start_exercise)
+        else:
+            lesson_completed = run_lesson_exercises(user, current_lesson, runner, start_exercise)
+        start_exercise = 0
 
         if not lesson_completed:
             # User quit
@@ -95,12 +210,11 @@ def run_learning_session(user: User) -> None:
         ui.print_lesson_complete(current_lesson)
 
         # Check if module is complete
-        module_lesson_ids = [l.id for l in module_lessons]
-        if all(lid in user.completed_lessons for lid in module_lesson_ids):
+        if user.completed.module_done(module_num):
             ui.print_module_complete(module_num, current_lesson.module)
 
         # Move to next lesson
-        next_lesson_id = get_next_lesson_id(current_lesson.id, all_lessons)
+        next_lesson_id = CATALOG.next_id(current_lesson.id)
         if next_lesson_id:
             user.set_current_lesson(next_lesson_id)
             ui.wait_for_key()
@@ -108,19 +222,20 @@ def run_learning_session(user: User) -> None:
             ui.print_all_complete()
             break
 
-    runner.cleanup()
+    runner.close()
+    user.flush()
 
 
-def run_lesson_exercises(user: User, lesson, runner: ExerciseRunner) -> bool:
+def run_lesson_exercises(user: User, lesson, runner: "ExerciseRunner", start: int = 0) -> bool:
     """
-    Run all exercises in a lesson.
+    Run all exercises in a lesson, beginning at index ``start``.
     Returns True if all exercises completed, False if user quit.
     """
     exercises = lesson.exercises
     total_exercises = len(exercises)
 
-    for i, exercise in enumerate(exercises, 1):
-        ui.print_exercise(exercise, i, total_exercises)
+    for i, exercise in enumerate(exercises[start:], start + 1):
+        ui.print_exercise(exercise, i, total_exercises, lesson.id)
         ui.print_exercise_menu()
 
         first_try = True
@@ -141,11 +256,14 @@ def run_lesson_exercises(user: User, lesson, runner: ExerciseRunner) -> bool:
                     ui.print_info("本课程没有设计原因说明")
             elif action == "1":
                 # Run the exercise
+                started = time.monotonic()
                 success, actual, expected = runner.run_exercise(exercise)
+                duration = time.monotonic() - started
+                record_vim_launch(user, runner)
 
                 if success:
                     ui.print_success()
-                    user.record_exercise(success=True, first_try=first_try)
+                    user.record_exercise(True, first_try, lesson.id, i - 1, duration)
                     # Show success menu and let user choose
                     while True:
                         ui.print_success_menu()
@@ -165,7 +283,7 @@ def run_lesson_exercises(user: User, lesson, runner: ExerciseRunner) -> bool:
                     break
                 else:
                     ui.print_failure(actual, expected)
-                    user.record_exercise(success=False, first_try=first_try)
+                    user.record_exercise(False, first_try, lesson.id, i - 1, duration)
                     first_try = False
                     # Show retry menu and handle actions
                     while True:
@@ -184,10 +302,13 @@ def run_lesson_exercises(user: User, lesson, runner: ExerciseRunner) -> bool:
                             ui.print_hint(exercise.hint)
                         elif retry_action == "1":
                             # Retry - break inner loop to retry exercise
+                            started = time.monotonic()
                             success, actual, expected = runner.run_exercise(exercise)
+                            duration = time.monotonic() - started
+                            record_vim_launch(user, runner)
                             if success:
                                 ui.print_success()
-                                user.record_exercise(success=True, first_try=False)
+                                user.record_exercise(True, False, lesson.id, i - 1, duration)
                                 while True:
                                     ui.print_success_menu()
                                     post_action = ui.prompt_action()
@@ -204,34 +325,432 @@ def run_lesson_exercises(user: User, lesson, runner: ExerciseRunner) -> bool:
                                         return False
                                 break
                             else:
+                                user.record_attempt(lesson.id, i - 1)
                                 ui.print_failure(actual, expected)
                     break
 
     return True
 
 
+def run_persistent_session(user: User, start_exercise: int = 0, vim_profile: Optional[str] = None) -> bool:
+    """
+    Run the learning session inside one long-lived Vim over a channel.
+    Returns False without doing anything if Vim channels are unavailable.
+    """
+    from .channel import VimChannel
+    from .exercise import ExerciseRunner
+
+    first_lesson = CATALOG.get(user.current_lesson)
+    lesson_profile = CATALOG.vim_profile(first_lesson) if first_lesson is not None else None
+    runner = ExerciseRunner(profile=resolve_profile(user.settings, lesson_profile, vim_profile))
+    runner.workspace.install_signal_handlers()
+    channel = VimChannel(runner.workspace.path, runner.vim_command())
+    if not channel.start():
+        runner.close()
+        ui.print_info("当前 Vim 不支持 channel，改用普通模式")
+        return False
+
+    try:
+        while True:
+            current_lesson = CATALOG.load(user.current_lesson)
+            if current_lesson is None:
+                break
+
+            channel.show_lesson(current_lesson)
+            if not run_lesson_in_channel(user, current_lesson, runner, channel, start_exercise):
+                return True
+            start_exercise = 0
+
+            user.complete_lesson(current_lesson.id)
+            module_num, _ = CATALOG.parse_id(current_lesson.id)
+            if user.completed.module_done(module_num):
+                channel.message(f"模块 {module_num}: {current_lesson.module} 全部完成！")
+
+            next_lesson_id = CATALOG.next_id(current_lesson.id)
+            if not next_lesson_id:
+                break
+            user.set_current_lesson(next_lesson_id)
+
+        channel.message("恭喜你完成了所有课程！:qa 退出")
+        while channel.next_event()["event"] != "exit":
+            pass
+        return True
+    finally:
+        channel.close()
+        runner.read_startup_time()
+        record_vim_launch(user, runner)
+        runner.close()
+        user.flush()
+        ui.clear_screen()
+
+
+def run_lesson_in_channel(user: User, lesson, runner: "ExerciseRunner", channel: "VimChannel", start: int = 0) -> bool:
+    """
+    Run a lesson's exercises in the persistent Vim; writing the file submits it.
+    Returns True if all exercises completed, False if Vim was closed.
+    """
+    exercises = lesson.exercises
+    total_exercises = len(exercises)
+
+    for i, exercise in enumerate(exercises[start:], start + 1):
+        filepath = runner.create_exercise_file(exercise)
+        channel.show_exercise(filepath, exercise, f"练习 {i}/{total_exercises}: {exercise.instruction}")
+
+        first_try = True
+        started = time.monotonic()
+        while True:
+            event = channel.next_event()
+            kind = event.get("event")
+
+            if kind == "exit":
+                return False
+            elif kind == "hint":
+                channel.message(exercise.hint)
+            elif kind == "why":
+                channel.message(lesson.why or "本课程没有设计原因说明")
+            elif kind == "skip":
+                break
+            elif kind == "pass":
+                if not first_try:
+                    break
+                channel.message("提交过一次后才能强制通过，请先 :w 提交", error=True)
+            elif kind == "write" and Path(event.get("file", "")).resolve() == filepath.resolve():
+                success, _, expected = runner.verify_result(exercise)
+                user.record_exercise(success, first_try, lesson.id, i - 1, time.monotonic() - started)
+                started = time.monotonic()
+                if success:
+                    break
+                first_try = False
+                channel.message(f"结果不匹配，请再试一次。期望结果:\n{expected}", error=True)
+
+        runner.cleanup()
+
+    channel.message(f"课程 {lesson.id}: {lesson.title} 完成！")
+    return True
+
+
+def run_lesson_batch(user: User, lesson, runner: "ExerciseRunner", start: int = 0) -> bool:
+    """
+    Run all exercises in a lesson in a single Vim session.
+    Failed exercises are reopened together on retry.
+    Returns True if the lesson is finished, False if user quit.
+    """
+    exercises = lesson.exercises
+    total_exercises = len(exercises)
+    pending = list(range(start, total_exercises))
+
+    for i in pending:
+        ui.print_exercise(exercises[i], i + 1, total_exercises, lesson.id)
+    ui.print_batch_menu()
+
+    first_try = True
+    while pending:
+        action = ui.prompt_action()
+
+        if action == "0":
+            return False
+        elif action == "4":
+            # Skip the remaining exercises
+            return True
+        elif action == "5" and not first_try:
+            ui.print_info("已强制通过剩余练习")
+            return True
+        elif action == "2":
+            for i in pending:
+                ui.print_info(f"练习 {i + 1}/{total_exercises}")
+                ui.print_hint(exercises[i].hint)
+        elif action == "3":
+            if lesson.why:
+                ui.print_why(lesson.why)
+            else:
+                ui.print_info("本课程没有设计原因说明")
+        elif action == "1":
+            titles = [f"练习 {i + 1}/{total_exercises}: {exercises[i].instruction}" for i in pending]
+            results = runner.run_exercises([exercises[i] for i in pending], titles)
+            record_vim_launch(user, runner)
+            runner.cleanup()
+
+            failed = []
+            for i, (success, actual, expected) in zip(pending, results):
+                user.record_exercise(success, first_try, lesson.id, i)
+                if success:
+                    ui.print_info(f"练习 {i + 1}/{total_exercises} 完成")
+                else:
+                    ui.print_info(f"练习 {i + 1}/{total_exercises}")
+                    ui.print_failure(actual, expected)
+                    failed.append(i)
+
+            pending = failed
+            first_try = False
+            if pending:
+                ui.print_retry_menu()
+
+    ui.print_success()
+    return True
+
+
 @app.command()
-def lessons():
+def review(
+    username: str = typer.Option(..., "--user", "-u", help="用户名"),
+    limit: int = typer.Option(20, "--limit", "-n", help="本次最多复习的练习数"),
+    vim_profile: Optional[str] = typer.Option(None, "--vim-profile", help="Vim 启动配置: clean / user / custom"),
+    alt_screen: bool = typer.Option(False, "--alt-screen/--no-alt-screen", help="在终端备用屏幕中运行，只重绘变化的部分（画面超出终端高度时退回普通输出）"),
+    lowbw: Optional[bool] = typer.Option(None, "--lowbw/--no-lowbw", help="低带宽显示（默认按用户设置或自动检测）"),
+):
+    """复习到期的练习（间隔重复）。"""
+    if not check_vim_installed():
+        ui.print_vim_not_found()
+        raise typer.Exit(1)
+
+    user = User.load(username)
+    if user is None:
+        ui.print_error(f"用户 {username} 不存在")
+        raise typer.Exit(1)
+    if vim_profile is not None:
+        try:
+            resolve_profile(user.settings, override=vim_profile)
+        except ValueError as e:
+            ui.print_error(str(e))
+            raise typer.Exit(1)
+    ui.set_low_bandwidth(ui.resolve_low_bandwidth(user.settings, lowbw))
+
+    holder = user.acquire_session()
+    if holder is not None:
+        ui.print_session_in_use(username, holder)
+    try:
+        with ui.alternate_screen(alt_screen):
+            run_review_session(user, limit, vim_profile)
+    finally:
+        user.release_session()
+
+
+def run_review_session(user: User, limit: int, vim_profile: Optional[str] = None) -> None:
+    """Review due exercises, most overdue first, rescheduling each by its outcome."""
+    from .exercise import ExerciseRunner
+    from .review import QUALITY_FAILED, QUALITY_FIRST_TRY, QUALITY_RETRIED, ReviewQueue, parse_card_key
+
+    if user.seed_reviews():
+        user.save()
+    queue = ReviewQueue(user.review)
+    runner = ExerciseRunner()
+    runner.suspend = ui.suspend_screen
+    runner.workspace.install_signal_handlers()
+
+    reviewed = 0
+    while reviewed < limit:
+        key = queue.pop_due()
+        if key is None:
+            break
+        lesson_id, index = parse_card_key(key)
+        lesson = CATALOG.load(lesson_id)
+        if lesson is None or index >= len(lesson.exercises):
+            # The exercise was removed from the catalog
+            continue
+        exercise = lesson.exercises[index]
+        runner.profile = resolve_profile(user.settings, CATALOG.vim_profile(lesson), vim_profile)
+
+        ui.clear_screen()
+        ui.print_review_header(lesson, queue.count_due() + 1)
+        ui.print_exercise(exercise, index + 1, len(lesson.exercises), lesson.id)
+        ui.print_review_menu()
+
+        quality = None
+        started = time.monotonic()
+        while quality is None:
+            action = ui.prompt_action()
+            if action == "0":
+                break
+            elif action == "2":
+                ui.print_hint(exercise.hint)
+            elif action == "4":
+                quality = QUALITY_FAILED
+            elif action == "1":
+                first_try = True
+                while True:
+                    success, actual, expected = runner.run_exercise(exercise)
+                    record_vim_launch(user, runner)
+                    if success:
+                        ui.print_success()
+                        quality = QUALITY_FIRST_TRY if first_try else QUALITY_RETRIED
+                        break
+                    ui.print_failure(actual, expected)
+                    first_try = False
+                    if not ui.confirm("再试一次?"):
+                        quality = QUALITY_FAILED
+                        break
+        if quality is None:
+            break
+
+        user.record_review(lesson.id, index, quality, time.monotonic() - started)
+        queue.push(key)
+        reviewed += 1
+        if reviewed < limit and queue.count_due():
+            ui.wait_for_key()
+
+    runner.close()
+    user.flush()
+    ui.print_review_summary(reviewed, queue.next_due())
+
+
+@app.command()
+def lessons(
+    as_json: bool = typer.Option(False, "--json", help="以 NDJSON 输出（每行一个课程），便于脚本处理"),
+):
     """显示所有课程列表。"""
+    if as_json:
+        _write_ndjson(_lesson_rows())
+        return
     ui.clear_screen()
     ui.print_modules_list(MODULES, [])
-    ui.console.print()
 
 
 @app.command()
 def progress(
     username: str = typer.Argument(..., help="用户名"),
+    lesson: Optional[str] = typer.Option(None, "--lesson", "-l", help="显示某课程每个练习的记录，如 2.3"),
+    as_json: bool = typer.Option(False, "--json", help="以 NDJSON 输出：首行为用户统计，之后每行一个课程"),
 ):
     """查看学习进度。"""
-    user = User.load(username)
+    user = User.peek(username)
     if user is None:
         ui.print_error(f"用户 {username} 不存在")
         raise typer.Exit(1)
 
-    all_lessons = get_all_lessons()
+    if as_json:
+        now = time.time()
+        summary = {
+            "username": user.username,
+            "current_lesson": user.current_lesson,
+            "completed": len(user.completed),
+            "total": len(CATALOG),
+            "stats": user.stats,
+            "review_due": sum(1 for card in user.review.values() if card["due"] <= now),
+            "review_cards": len(user.review),
+        }
+        _write_ndjson([summary])
+        _write_ndjson(_lesson_rows(user))
+        return
+
+    if lesson is not None:
+        full_lesson = CATALOG.load(lesson)
+        if full_lesson is None:
+            ui.print_error(f"课程 {lesson} 不存在")
+            raise typer.Exit(1)
+        ui.print_exercise_history(user, full_lesson)
+        return
+
     ui.clear_screen()
-    ui.print_progress_stats(user, len(all_lessons))
-    ui.print_modules_list(MODULES, user.completed_lessons)
+    ui.print_progress(user, MODULES, {l.id: l.title for l in CATALOG.lessons})
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(..., help="搜索内容，如 删除单词 或 ci\""),
+    limit: int = typer.Option(10, "--limit", "-n", help="最多显示条数"),
+):
+    """全文搜索课程和练习。"""
+    from .search import load_search_index
+
+    index = load_search_index(get_catalog_hash(), get_all_lessons)
+    ui.print_search_results(query, index.search(query, limit))
+
+
+@app.command()
+def which(
+    command: str = typer.Argument(..., help="Vim 命令，如 dw 或 Ctrl+r"),
+    prefix: bool = typer.Option(False, "--prefix", "-p", help="匹配以此开头的所有命令"),
+):
+    """查找练习某个命令的课程和练习。"""
+    from .commands import load_command_index
+
+    matches = load_command_index(get_catalog_hash(), get_all_lessons).lookup(command, prefix)
+    titles = {match.lesson_id: CATALOG.get(match.lesson_id).title for match in matches}
+    ui.print_command_matches(command, matches, titles)
+
+
+@app.command()
+def config(
+    username: str = typer.Argument(..., help="用户名"),
+    vim_profile: Optional[str] = typer.Option(None, "--vim-profile", help="Vim 启动配置: auto / clean / user / custom"),
+    vimrc: Optional[str] = typer.Option(None, "--vimrc", help="custom 配置使用的 vimrc 路径"),
+    lowbw: Optional[str] = typer.Option(None, "--lowbw", help="低带宽显示: auto / on / off"),
+):
+    """查看或修改用户设置。"""
+    # Read-only unless settings change, which update_settings() saves
+    user = User.peek(username)
+    if user is None:
+        ui.print_error(f"用户 {username} 不存在")
+        raise typer.Exit(1)
+
+    if vim_profile is not None and vim_profile not in (AUTO, *PROFILE_NAMES):
+        ui.print_error(f"未知的 Vim 启动配置 {vim_profile}")
+        raise typer.Exit(1)
+    if vim_profile == "custom" and not (vimrc or user.settings.get("vimrc")):
+        ui.print_error("custom 配置需要通过 --vimrc 指定 vimrc")
+        raise typer.Exit(1)
+
+    if lowbw is not None and lowbw not in ui.LOWBW_SETTINGS:
+        ui.print_error(f"低带宽显示只能是 {' / '.join(ui.LOWBW_SETTINGS)}")
+        raise typer.Exit(1)
+
+    changes = {key: value for key, value in (("vim_profile", vim_profile), ("vimrc", vimrc)) if value is not None}
+    if lowbw is not None:
+        # "auto" removes the setting
+        changes["lowbw"] = None if lowbw == "auto" else lowbw
+    if changes:
+        user.update_settings(**changes)
+    ui.print_settings(user)
+    if lowbw is not None:
+        lesson = CATALOG.load(user.current_lesson) or CATALOG.load(CATALOG.lessons[0].id)
+        ui.print_screen_savings(lesson, *ui.measure_lesson_screen(lesson))
+
+
+@users_app.command("list")
+def users_list(
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", help="最多显示人数"),
+):
+    """列出所有用户（按最近活跃排序）。"""
+    summaries = list_user_summaries()
+    ui.print_user_list(summaries[:limit] if limit else summaries, len(CATALOG))
+
+
+@users_app.command("import")
+def users_import(
+    roster: Path = typer.Argument(..., help="名单文件 (.csv 或 .ndjson)", exists=True, dir_okay=False),
+    fmt: Optional[str] = typer.Option(None, "--format", "-f", help="文件格式: csv 或 ndjson（默认按扩展名）"),
+):
+    """从名单批量创建或更新用户。"""
+    from .roster import FORMATS as ROSTER_FORMATS, guess_format, import_users
+
+    fmt = fmt or guess_format(roster.name)
+    if fmt not in ROSTER_FORMATS:
+        ui.print_error(f"未知格式 {fmt}")
+        raise typer.Exit(1)
+    with open(roster, "r", encoding="utf-8-sig", newline="") as f:
+        result = import_users(f, fmt)
+    ui.print_import_result(result)
+    if result.failed:
+        raise typer.Exit(1)
+
+
+@users_app.command("export")
+def users_export(
+    output: str = typer.Argument(..., help="输出文件 (.csv 或 .ndjson)，- 表示标准输出"),
+    fmt: Optional[str] = typer.Option(None, "--format", "-f", help="文件格式: csv 或 ndjson（默认按扩展名）"),
+):
+    """导出所有用户的学习进度。"""
+    from .roster import FORMATS as ROSTER_FORMATS, export_users, guess_format
+
+    fmt = fmt or guess_format(output)
+    if fmt not in ROSTER_FORMATS:
+        ui.print_error(f"未知格式 {fmt}")
+        raise typer.Exit(1)
+    if output == "-":
+        export_users(sys.stdout, fmt)
+        return
+    with open(output, "w", encoding="utf-8", newline="") as f:
+        count = export_users(f, fmt)
+    ui.print_info(f"已导出 {count} 个用户到 {output}")
 
 
 @app.command()
@@ -251,5 +770,70 @@ def reset(
         ui.print_info("已取消")
 
 
+@app.command()
+def selftest(
+    lesson: Optional[str] = typer.Option(None, "--lesson", "-l", help="只测试指定课程 (如 1.1) 或模块 (如 4)"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="并行进程数（默认 CPU 核数）"),
+    timeout: float = typer.Option(10.0, "--timeout", help="单个练习超时秒数"),
+    report: Optional[Path] = typer.Option(None, "--report", "-o", help="报告输出文件"),
+    report_format: str = typer.Option("json", "--format", "-f", help="报告格式: json 或 junit"),
+):
+    """用参考答案在无界面 Vim 中批量验证所有练习。"""
+    from .selftest import run_selftest, write_json_report, write_junit_report
+
+    if not check_vim_installed():
+        ui.print_vim_not_found()
+        raise typer.Exit(1)
+    if report_format not in ("json", "junit"):
+        ui.print_error(f"未知报告格式 {report_format}")
+        raise typer.Exit(1)
+
+    lessons = get_all_lessons()
+    if lesson:
+        lessons = [l for l in lessons if l.id == lesson or str(l.module_num) == lesson]
+        if not lessons:
+            ui.print_error(f"课程 {lesson} 不存在")
+            raise typer.Exit(1)
+
+    started = time.perf_counter()
+    results = run_selftest(lessons, jobs, timeout)
+    ui.print_selftest_results(results, time.perf_counter() - started)
+
+    if report:
+        writer = write_json_report if report_format == "json" else write_junit_report
+        writer(results, report)
+        ui.print_info(f"报告已写入 {report}")
+
+    if any(r.status in ("failed", "error") for r in results):
+        raise typer.Exit(1)
+
+
+@app.command()
+def report(
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="并行进程数（默认 CPU 核数）"),
+    stall_days: int = typer.Option(STALL_DAYS, "--stall-days", help="超过多少天未活跃算作停滞"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="同时把报告写成 JSON 文件"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="忽略缓存，重新解析所有用户"),
+):
+    """统计所有用户的学习情况（完成率、一次通过率、活跃度、停滞的学习者）。"""
+    from .report import build_report, write_report_json
+
+    started = time.perf_counter()
+    cohort = build_report(jobs, stall_days, use_cache=not no_cache)
+    ui.print_report(cohort, MODULES, {l.id: l.title for l in CATALOG.lessons}, elapsed=time.perf_counter() - started)
+    if output:
+        write_report_json(cohort, output)
+        ui.print_info(f"报告已写入 {output}")
+
+
+@app.command("build-catalog")
+def build_catalog():
+    """预编译课程快照（课程内容变化时也会自动重建）。"""
+    from .snapshot import rebuild_snapshot
+
+    path = rebuild_snapshot(MODULES)
+    ui.print_info(f"课程快照已生成: {path} ({path.stat().st_size} 字节)")
+
+
 if __name__ == "__main__":
     app()
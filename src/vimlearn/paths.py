@@ -0,0 +1,31 @@
+"""Filesystem locations for VimLearn data."""
+
+import json
+from pathlib import Path
+
+
+def get_data_dir() -> Path:
+    """Get the root VimLearn data directory."""
+    return Path.home() / ".vimlearn"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for rebuildable caches."""
+    cache_dir = get_data_dir() / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_config_file() -> Path:
+    """Get the path of the global (per-installation) config file."""
+    return get_data_dir() / "config.json"
+
+
+def load_config() -> dict:
+    """Read the global config file, or an empty config if absent or unreadable."""
+    try:
+        with open(get_config_file(), "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return config if isinstance(config, dict) else {}
@@ -0,0 +1,73 @@
+"""Vim launch profiles and startup latency measurement."""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# "auto" defers to the lesson's recommended profile.
+AUTO = "auto"
+DEFAULT_PROFILE = "user"
+PROFILE_NAMES = ("clean", "user", "custom")
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """How to start Vim: the profile name and the extra command-line arguments."""
+
+    name: str
+    args: tuple[str, ...] = ()
+
+    def command(self, vim: str = "vim") -> list[str]:
+        """Get the Vim command line prefix for this profile."""
+        return [vim, *self.args]
+
+
+def get_profile(name: str, vimrc: Optional[str] = None) -> LaunchProfile:
+    """
+    Build a launch profile by name.
+
+    - clean:  Vim defaults only; no vimrc, plugins, swap file or viminfo
+    - user:   the learner's own Vim configuration
+    - custom: the given vimrc, without swap file or viminfo
+    """
+    if name == "clean":
+        return LaunchProfile(name, ("-u", "DEFAULTS", "--noplugin", "-i", "NONE", "-n"))
+    if name == "user":
+        return LaunchProfile(name)
+    if name == "custom":
+        if not vimrc:
+            raise ValueError("custom profile requires a vimrc path")
+        return LaunchProfile(name, ("-u", str(Path(vimrc).expanduser()), "-i", "NONE", "-n"))
+    raise ValueError(f"Unknown Vim profile: {name}")
+
+
+def resolve_profile(settings: dict, lesson_profile: Optional[str] = None, override: Optional[str] = None) -> LaunchProfile:
+    """
+    Pick the profile for a launch.
+
+    An explicit override wins, then the user's setting, then the lesson's
+    recommendation (when the user setting is "auto"), then the default.
+    """
+    name = override or settings.get("vim_profile", AUTO)
+    if name == AUTO:
+        name = lesson_profile or DEFAULT_PROFILE
+    return get_profile(name, settings.get("vimrc"))
+
+
+_STARTUP_LINE = re.compile(r"^\s*(\d+\.\d+)\s+.*?:\s*(first screen update|--- VIM STARTED ---)\s*$")
+
+
+def parse_startup_time(log: str) -> Optional[float]:
+    """
+    Get milliseconds from process start to first screen draw from a
+    ``--startuptime`` log, or None if Vim never drew a screen.
+    """
+    started = None
+    for line in log.splitlines():
+        match = _STARTUP_LINE.match(line)
+        if match:
+            if match.group(2) == "first screen update":
+                return float(match.group(1))
+            started = float(match.group(1))
+    return started
@@ -0,0 +1,228 @@
+"""Cohort statistics across all user profiles.
+
+Profiles are streamed from the configured store and summarized into small
+per-user partials on a process pool; only the partials are merged into the
+report. Partials are cached by profile version (file mtime/size or the
+database's last write), so a repeated report only reparses users whose
+profile changed since the last run.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .lessons import CATALOG, get_catalog_hash
+from .paths import get_cache_dir
+from .storage import atomic_write_json, get_store, get_storage_name
+from .user import User
+
+CACHE_VERSION = 1
+CACHE_FILENAME = "report-users.json"
+# Days since last activity (with lessons left) that make a learner stalled.
+STALL_DAYS = 14
+ACTIVE_PERIODS = (1, 7, 30)
+# Users per worker task and in-flight tasks per worker.
+CHUNK_SIZE = 256
+INFLIGHT_PER_JOB = 2
+
+
+@dataclass
+class CohortReport:
+    """Aggregated statistics over every user."""
+
+    users: int = 0
+    finished: int = 0
+    # lesson id -> users who completed it
+    lesson_completion: dict[str, int] = field(default_factory=dict)
+    # module number -> users who completed every lesson in it
+    module_completion: dict[int, int] = field(default_factory=dict)
+    # "lesson#index" -> [users who attempted it, users who passed it first try]
+    exercises: dict[str, list[int]] = field(default_factory=dict)
+    # days -> users active within that many days
+    active: dict[int, int] = field(default_factory=dict)
+    # (username, current lesson, days idle), most idle first
+    stalled: list[tuple[str, str, int]] = field(default_factory=list)
+    reparsed: int = 0
+
+    def first_try_rate(self, key: str) -> Optional[float]:
+        """Get the share of attempting users who passed an exercise first try."""
+        attempted, first_try = self.exercises.get(key, (0, 0))
+        return first_try / attempted if attempted else None
+
+
+def summarize_user(username: str) -> Optional[dict]:
+    """
+    Reduce one user's profile and pending events to a small partial.
+    Read-only: the user's event log is never compacted here.
+    """
+    user = User.peek(username)
+    if user is None:
+        return None
+
+    attempted, first_try = [], []
+    for lesson_id, exercises in user.history.items():
+        for index, entry in exercises.items():
+            key = f"{lesson_id}#{index}"
+            attempted.append(key)
+            if entry["first_try"]:
+                first_try.append(key)
+    return {
+        "last_active": user.last_active,
+        "current_lesson": user.current_lesson,
+        "completed": format(user.completed.bits, "x"),
+        "attempted": attempted,
+        "first_try": first_try,
+    }
+
+
+def _summarize_chunk(usernames: list[str]) -> list[tuple[str, Optional[dict]]]:
+    return [(username, summarize_user(username)) for username in usernames]
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _cache_file() -> Path:
+    return get_cache_dir() / CACHE_FILENAME
+
+
+def load_partial_cache(cache_key: str) -> dict:
+    """Load cached partials (username -> [version, partial]) for this catalog and store."""
+    try:
+        with open(_cache_file(), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == CACHE_VERSION and cached.get("key") == cache_key:
+            return cached["users"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def save_partial_cache(cache_key: str, users: dict) -> None:
+    """Store partials; failures are ignored since the cache can be rebuilt."""
+    try:
+        atomic_write_json(_cache_file(), {"version": CACHE_VERSION, "key": cache_key, "users": users})
+    except OSError:
+        pass
+
+
+class _Aggregator:
+    """Folds partials into a CohortReport one at a time."""
+
+    def __init__(self, now: datetime, stall_days: int):
+        self.report = CohortReport(active={days: 0 for days in ACTIVE_PERIODS})
+        self.now = now
+        self.stall_days = stall_days
+        self.lesson_counts = [0] * len(CATALOG)
+
+    def add(self, username: str, partial: dict) -> None:
+        report = self.report
+        report.users += 1
+
+        completed = int(partial["completed"], 16)
+        bits = completed
+        while bits:
+            low = bits & -bits
+            self.lesson_counts[low.bit_length() - 1] += 1
+            bits ^= low
+        finished = True
+        for module_num, (start, end) in CATALOG.module_ranges.items():
+            if ((completed >> start) & ((1 << (end - start)) - 1)) == (1 << (end - start)) - 1:
+                report.module_completion[module_num] = report.module_completion.get(module_num, 0) + 1
+            else:
+                finished = False
+        report.finished += finished
+
+        for key in partial["attempted"]:
+            report.exercises.setdefault(key, [0, 0])[0] += 1
+        for key in partial["first_try"]:
+            report.exercises[key][1] += 1
+
+        try:
+            idle = self.now - datetime.fromisoformat(partial["last_active"])
+        except (TypeError, ValueError):
+            return
+        for days in ACTIVE_PERIODS:
+            if idle <= timedelta(days=days):
+                report.active[days] += 1
+        if not finished and idle > timedelta(days=self.stall_days):
+            report.stalled.append((username, partial["current_lesson"], idle.days))
+
+    def finish(self) -> CohortReport:
+        report = self.report
+        report.lesson_completion = {
+            lesson.id: count for lesson, count in zip(CATALOG.lessons, self.lesson_counts)
+        }
+        report.stalled.sort(key=lambda entry: -entry[2])
+        return report
+
+
+def build_report(
+    jobs: Optional[int] = None,
+    stall_days: int = STALL_DAYS,
+    use_cache: bool = True,
+    now: Optional[datetime] = None,
+) -> CohortReport:
+    """Scan every user in the configured store and aggregate cohort statistics."""
+    store = get_store()
+    cache_key = f"{get_catalog_hash()}:{get_storage_name()}"
+    cached = load_partial_cache(cache_key) if use_cache else {}
+    fresh: dict[str, list] = {}
+    aggregator = _Aggregator(now or datetime.now(), stall_days)
+    versions: dict[str, str] = {}
+
+    def stale_users() -> Iterator[str]:
+        for username, version in store.scan():
+            entry = cached.get(username)
+            if entry is not None and entry[0] == version:
+                fresh[username] = entry
+                aggregator.add(username, entry[1])
+            else:
+                versions[username] = version
+                yield username
+
+    def collect(results: list[tuple[str, Optional[dict]]]) -> None:
+        for username, partial in results:
+            version = versions.pop(username)
+            if partial is not None:
+                fresh[username] = [version, partial]
+                aggregator.add(username, partial)
+                aggregator.report.reparsed += 1
+
+    jobs = jobs or os.cpu_count() or 1
+    chunks = _chunks(stale_users(), CHUNK_SIZE)
+    if jobs == 1:
+        for chunk in chunks:
+            collect(_summarize_chunk(chunk))
+    else:
+        # Loaded only when a pool is used; multiprocessing is slow to import
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            pending = set()
+            for chunk in chunks:
+                pending.add(pool.submit(_summarize_chunk, chunk))
+                # Bound the work queued ahead of the workers
+                if len(pending) >= jobs * INFLIGHT_PER_JOB:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+            for future in pending:
+                collect(future.result())
+
+    if use_cache:
+        save_partial_cache(cache_key, fresh)
+    return aggregator.finish()
+
+
+def write_report_json(report: CohortReport, path: Path) -> None:
+    """Write a report as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(asdict(report), f, indent=2, ensure_ascii=False)
@@ -0,0 +1,117 @@
+"""Spaced-repetition scheduling of completed exercises (SM-2).
+
+Each exercise a user has passed gets a card holding its SM-2 state. Cards
+are updated by outcomes from the event log (passing an exercise while
+learning, or a review), so the schedule is persisted incrementally with the
+rest of the profile and never recomputed from history. Due cards are kept in
+a heap ordered by due time, so picking the next review is O(log n), and the
+number still due is tracked as cards are taken and requeued.
+"""
+
+import heapq
+import time
+from typing import Optional
+
+DAY = 24 * 3600
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+
+# Review qualities on the SM-2 scale of 0 (blackout) to 5 (perfect)
+QUALITY_FIRST_TRY = 5
+QUALITY_RETRIED = 3
+QUALITY_FAILED = 1
+
+
+def card_key(lesson_id: str, exercise_index: int) -> str:
+    """Get the card key for an exercise."""
+    return f"{lesson_id}#{exercise_index}"
+
+
+def parse_card_key(key: str) -> tuple[str, int]:
+    """Get (lesson id, exercise index) from a card key."""
+    lesson_id, index = key.rsplit("#", 1)
+    return lesson_id, int(index)
+
+
+def new_card() -> dict:
+    """Get the state of a card that has never been scheduled."""
+    return {"ease": INITIAL_EASE, "interval": 0, "reps": 0, "due": 0, "lapses": 0}
+
+
+def schedule(card: dict, quality: int, when: float) -> dict:
+    """Apply one SM-2 review outcome at time ``when`` (epoch seconds) to a card, in place."""
+    if quality < 3:
+        card["reps"] = 0
+        card["interval"] = 1
+        card["lapses"] += 1
+    else:
+        if card["reps"] == 0:
+            card["interval"] = 1
+        elif card["reps"] == 1:
+            card["interval"] = 6
+        else:
+            card["interval"] = max(1, round(card["interval"] * card["ease"]))
+        card["reps"] += 1
+    card["ease"] = round(max(MIN_EASE, card["ease"] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)), 3)
+    card["due"] = int(when + card["interval"] * DAY)
+    return card
+
+
+class ReviewQueue:
+    """
+    Min-heap of cards by due time, with lazy removal of rescheduled entries.
+
+    Cards count as due if they were due when the queue was built, so the due
+    count is kept up to date as entries are pushed and popped rather than
+    recounted.
+    """
+
+    def __init__(self, cards: dict[str, dict], now: Optional[float] = None):
+        self.cards = cards
+        self.now = time.time() if now is None else now
+        self._heap = [(card["due"], key) for key, card in cards.items()]
+        heapq.heapify(self._heap)
+        # Heap entries due at self.now
+        self._due = sum(1 for due, _ in self._heap if due <= self.now)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def _pop(self) -> tuple[int, str]:
+        entry = heapq.heappop(self._heap)
+        if entry[0] <= self.now:
+            self._due -= 1
+        return entry
+
+    def _top(self) -> Optional[tuple[int, str]]:
+        # Drop entries whose card has been rescheduled since they were pushed
+        while self._heap:
+            due, key = self._heap[0]
+            card = self.cards.get(key)
+            if card is not None and card["due"] == due:
+                return self._heap[0]
+            self._pop()
+        return None
+
+    def push(self, key: str) -> None:
+        """(Re)queue a card after its state changed."""
+        due = self.cards[key]["due"]
+        heapq.heappush(self._heap, (due, key))
+        if due <= self.now:
+            self._due += 1
+
+    def pop_due(self) -> Optional[str]:
+        """Remove and return the most overdue card key, or None if nothing is due."""
+        top = self._top()
+        if top is None or top[0] > self.now:
+            return None
+        return self._pop()[1]
+
+    def next_due(self) -> Optional[int]:
+        """Get when the earliest card is due, if any."""
+        top = self._top()
+        return top[0] if top is not None else None
+
+    def count_due(self) -> int:
+        """Count the cards that are due."""
+        return self._due
@@ -0,0 +1,196 @@
+"""Bulk import and export of users as CSV or NDJSON.
+
+Both directions stream one row at a time, so memory stays bounded by the
+batch size rather than the roster size. Imports are written to the store in
+batches and a bad row is reported without stopping the rest.
+
+CSV columns: ``username`` (required), ``current_lesson``,
+``completed_lessons`` (IDs separated by spaces or ``;``), ``vim_profile`` and
+``vimrc``. NDJSON rows may use the same keys, or be whole records as written
+by export (``User.to_dict()``), whose stats and history are restored for
+users that do not exist yet.
+"""
+
+import csv
+import json
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import IO, Iterator
+
+from .lessons import CATALOG
+from .profiles import AUTO, PROFILE_NAMES
+from .storage import COUNTERS, get_store
+from .user import User, validate_username
+
+FORMATS = ("csv", "ndjson")
+BATCH_SIZE = 200
+# Errors kept for display; the count is always exact.
+MAX_REPORTED_ERRORS = 100
+
+CSV_FIELDS = [
+    "username", "created_at", "last_active", "current_lesson", "completed_lessons",
+    *COUNTERS, "vim_profile", "vimrc",
+]
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a roster import."""
+
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    # (line number, username, message)
+    errors: list[tuple[int, str, str]] = field(default_factory=list)
+
+    def error(self, line: int, username: str, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, username, message))
+
+
+def guess_format(filename: str) -> str:
+    """Pick csv or ndjson from a file name."""
+    return "csv" if filename.lower().endswith(".csv") else "ndjson"
+
+
+def _read_rows(f: IO[str], fmt: str) -> Iterator[tuple[int, object]]:
+    """Yield (line number, raw row) pairs; a row that cannot be parsed is yielded as its error."""
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_num, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_num, json.loads(line)
+        except ValueError as e:
+            yield line_num, ValueError(f"invalid JSON: {e}")
+
+
+def _to_record(row: object) -> dict:
+    """Normalize and validate one roster row."""
+    if isinstance(row, Exception):
+        raise row
+    if not isinstance(row, dict):
+        raise ValueError("row is not an object")
+
+    record = dict(row)
+    record["username"] = validate_username(str(record.get("username") or ""))
+
+    completed = record.get("completed_lessons") or []
+    if isinstance(completed, str):
+        completed = [lesson_id for lesson_id in re.split(r"[\s;,]+", completed) if lesson_id]
+    unknown = [lesson_id for lesson_id in completed if lesson_id not in CATALOG]
+    if unknown:
+        raise ValueError(f"unknown lessons: {' '.join(unknown)}")
+    record["completed_lessons"] = completed
+
+    current = record.get("current_lesson") or None
+    if current is not None and current not in CATALOG:
+        raise ValueError(f"unknown lesson: {current}")
+    record["current_lesson"] = current
+
+    settings = dict(record.get("settings") or {})
+    for key in ("vim_profile", "vimrc"):
+        if record.get(key):
+            settings[key] = record[key]
+    profile = settings.get("vim_profile")
+    if profile is not None and profile not in (AUTO, *PROFILE_NAMES):
+        raise ValueError(f"unknown Vim profile: {profile}")
+    record["settings"] = settings
+
+    stats = record.get("stats")
+    if stats is None and any(record.get(name) for name in COUNTERS):
+        stats = {name: int(record.get(name) or 0) for name in COUNTERS}
+    if stats is not None and not (
+        isinstance(stats, dict) and all(isinstance(value, (int, dict)) for value in stats.values())
+    ):
+        raise ValueError("stats must be an object of numbers and objects")
+    record["stats"] = stats
+
+    history = record.get("history")
+    if history is not None and not (
+        isinstance(history, dict)
+        and all(
+            isinstance(exercises, dict) and all(isinstance(entry, dict) for entry in exercises.values())
+            for exercises in history.values()
+        )
+    ):
+        raise ValueError("history must map lessons to objects of exercise entries")
+    return record
+
+
+def _import_record(record: dict) -> bool:
+    """Create or update one user. Returns True if the user was created."""
+    store = get_store()
+    username = record["username"]
+    with store.locked(username):
+        if store.load(username) is None:
+            user = User(
+                username,
+                created_at=record.get("created_at"),
+                last_active=record.get("last_active"),
+                current_lesson=record["current_lesson"] or "1.1",
+                completed_lessons=record["completed_lessons"],
+                stats=record["stats"],
+                settings=record["settings"],
+                history=record.get("history"),
+            )
+            # A brand-new user has no event log to fold in
+            store.save(user.to_dict(), {name: user.stats.get(name, 0) for name in COUNTERS})
+            return True
+
+    user = User.from_dict(store.load(username))
+    user.merge_record(record)
+    user.save()
+    return False
+
+
+def import_users(f: IO[str], fmt: str, batch_size: int = BATCH_SIZE) -> ImportResult:
+    """Create or update users from a roster, one batch of rows at a time."""
+    result = ImportResult()
+    store = get_store()
+    rows = _read_rows(f, fmt)
+    while batch := list(islice(rows, batch_size)):
+        with store.batch():
+            for line_num, row in batch:
+                username = str(row.get("username", "")) if isinstance(row, dict) else ""
+                try:
+                    if _import_record(_to_record(row)):
+                        result.created += 1
+                    else:
+                        result.updated += 1
+                except (ValueError, TypeError, *store.errors) as e:
+                    result.error(line_num, username, str(e))
+    return result
+
+
+def export_users(out: IO[str], fmt: str) -> int:
+    """Write every user's record. Returns the number of users written."""
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+    count = 0
+    for username, _ in get_store().scan():
+        user = User.peek(username)
+        if user is None:
+            continue
+        record = user.to_dict()
+        if writer is not None:
+            writer.writerow({
+                **record,
+                **{name: record["stats"].get(name, 0) for name in COUNTERS},
+                "completed_lessons": " ".join(record["completed_lessons"]),
+                "vim_profile": record["settings"].get("vim_profile", ""),
+                "vimrc": record["settings"].get("vimrc", ""),
+            })
+        else:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
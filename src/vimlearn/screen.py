@@ -0,0 +1,236 @@
+"""Retained-mode drawing of the session UI on the terminal's alternate screen.
+
+While a ``Screen`` is active it stands in for the console's output file:
+everything printed is written into a model of the current frame, and the
+frame is only put on the terminal when the UI waits for input. Then just the
+rows that differ from what is already shown are redrawn, so starting a new
+frame (``clear``) resends the rows that changed, such as the progress bar,
+instead of the whole screen, in a single write. The model also lets
+the screen be repainted without re-rendering after Vim, which leaves the
+alternate screen when it exits.
+
+The alternate screen has no scrollback, so a frame taller than the terminal
+could not be read in full. The first time that happens the screen goes back
+to the normal screen, writes the frame there, and passes output straight
+through for the rest of the session, as if it had never been used.
+
+For slow links, ``BufferedOutput`` keeps the plain line-by-line output but
+holds it until the UI waits for input, so each screen is one write.
+"""
+
+import os
+import re
+import shutil
+import sys
+from typing import IO, Optional
+
+from rich.cells import cell_len
+
+
+ENTER_ALT_SCREEN = "\x1b[?1049h"
+LEAVE_ALT_SCREEN = "\x1b[?1049l"
+CLEAR = "\x1b[H\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+
+_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+# Serial lines on Linux (ttyS0, ttyUSB0, ttyAMA0, ttyACM0) and macOS (cu.*, tty.usbserial*)
+_SERIAL_TTY = re.compile(r"^(ttyS|ttyUSB|ttyAMA|ttyACM|cu\.|tty\.)")
+
+
+def _move(row: int, column: int = 1) -> str:
+    return f"\x1b[{row};{column}H"
+
+
+class Screen:
+    """File-like frame model that redraws changed rows on flush."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        # Rows of the frame being composed; the cursor is at the end of the last one
+        self.rows: list[str] = [""]
+        # What each terminal row shows (None for blank)
+        self._shown: list[Optional[str]] = []
+        self._size: Optional[tuple[int, int]] = None
+        self._full = True
+        # First frame row printed since the last input
+        self._output_start = 0
+        self.active = False
+        # Set once a frame did not fit: output then scrolls on the normal screen
+        self.scrolling = False
+        self.bytes_written = 0
+        self.redraws = 0
+
+    # File protocol used by rich
+
+    def write(self, text: str) -> int:
+        if self.scrolling:
+            self._emit(text)
+            return len(text)
+        lines = text.split("\n")
+        self.rows[-1] += lines[0]
+        self.rows.extend(lines[1:])
+        return len(text)
+
+    def flush(self) -> None:
+        # Frames are presented by refresh() once complete, not per print
+        pass
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.stream, "encoding", "utf-8")
+
+    # Screen control
+
+    def _emit(self, data: str) -> None:
+        if data:
+            self.stream.write(data)
+            self.stream.flush()
+            self.bytes_written += len(data.encode("utf-8", "replace"))
+
+    def enter(self) -> None:
+        """Switch to the alternate screen and draw the frame in full."""
+        self.active = True
+        self._emit(ENTER_ALT_SCREEN)
+        self.invalidate()
+        self.refresh()
+
+    def leave(self) -> None:
+        """
+        Return to the normal screen, carrying over what was printed since the
+        last input (such as a closing message) so it stays visible.
+        """
+        if not self.active:
+            return
+        self.active = False
+        rows = self.rows[self._output_start:]
+        if rows and not rows[-1]:
+            rows.pop()
+        self._emit(LEAVE_ALT_SCREEN + "".join(row + "\n" for row in rows))
+
+    def resume(self) -> None:
+        """Repaint from the model after another program (Vim) used the terminal."""
+        if self.active:
+            self.enter()
+
+    def clear(self) -> None:
+        """Start a new frame; rows it shares with the shown one are not redrawn."""
+        if self.scrolling:
+            self._emit(CLEAR)
+            return
+        self.rows = [""]
+        self._output_start = 0
+
+    def invalidate(self) -> None:
+        """Forget what the terminal shows so the next refresh redraws everything."""
+        self._full = True
+
+    def note_input(self, text: str) -> None:
+        """Account for a line the terminal echoed while reading input."""
+        if self.scrolling:
+            return
+        self.rows[-1] += text
+        self.rows.append("")
+        self._output_start = len(self.rows) - 1
+        row = len(self.rows) - 2
+        if row < len(self._shown):
+            self._shown[row] = self.rows[-2]
+            if row + 1 == len(self._shown):
+                # The newline scrolled the terminal
+                self._shown = self._shown[1:] + [None]
+
+    def echo_input(self, text: str) -> None:
+        """Echo an answer that was read with terminal echo off."""
+        self._emit(text + "\n")
+        self.note_input(text)
+
+    def _fall_back(self) -> None:
+        """Leave the alternate screen for good, writing the current frame on the normal one."""
+        self.active = False
+        self.scrolling = True
+        self._emit(LEAVE_ALT_SCREEN + CLEAR + "\n".join(self.rows))
+
+    def refresh(self) -> None:
+        """Redraw the rows that differ from what the terminal shows."""
+        if not self.active:
+            return
+        size = tuple(shutil.get_terminal_size())
+        if size != self._size:
+            self._size = size
+            self._full = True
+        height = size[1]
+        if len(self.rows) > height:
+            self._fall_back()
+            return
+
+        out = []
+        if self._full:
+            out.append(CLEAR)
+            self._shown = [None] * height
+            self._full = False
+
+        for row in range(height):
+            new = self.rows[row] if row < len(self.rows) else None
+            if new == "":
+                new = None
+            if new != self._shown[row]:
+                out.append(_move(row + 1) + (new or "") + CLEAR_LINE)
+                self._shown[row] = new
+
+        if out:
+            column = cell_len(_ESCAPE.sub("", self.rows[-1])) + 1
+            out.append(_move(len(self.rows), column))
+            self.redraws += 1
+            self._emit("".join(out))
+
+
+class BufferedOutput:
+    """File-like buffer that writes everything printed at once on refresh()."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self._pending: list[str] = []
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        self._pending.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        # Written by refresh() once the screen is complete, not per print
+        pass
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.stream, "encoding", "utf-8")
+
+    def refresh(self) -> None:
+        """Write out everything printed since the last refresh."""
+        if self._pending:
+            data = "".join(self._pending)
+            self._pending.clear()
+            self.stream.write(data)
+            self.stream.flush()
+            self.bytes_written += len(data.encode("utf-8", "replace"))
+
+
+def detect_low_bandwidth(stream: IO[str] = sys.stdout) -> bool:
+    """Guess whether output goes over a slow link: a dumb terminal or a serial console."""
+    if os.environ.get("TERM") == "dumb":
+        return True
+    try:
+        name = os.ttyname(stream.fileno())
+    except (OSError, ValueError, AttributeError):
+        return False
+    return bool(_SERIAL_TTY.match(os.path.basename(name)))
@@ -0,0 +1,176 @@
+"""Full-text lesson search for VimLearn.
+
+Lessons and exercises are indexed once into an inverted index that is cached
+on disk, keyed by the catalog content hash. Chinese text is tokenized into
+character bigrams; other text is kept as whitespace-delimited tokens (so Vim
+commands like ``ci"`` or ``:s`` stay searchable) plus their alphanumeric parts.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from .cache import load_cached
+from .lesson import Lesson
+
+INDEX_VERSION = 1
+
+# Relative importance of a match in each field.
+FIELD_WEIGHTS = {
+    "title": 5.0,
+    "commands": 4.0,
+    "description": 3.0,
+    "instruction": 2.0,
+    "hint": 1.0,
+    "why": 1.0,
+    "explanation": 1.0,
+}
+
+_CJK_RUN = re.compile(r"[㐀-䶿一-鿿豈-﫿]+")
+_WORD = re.compile(r"[a-z0-9_]+")
+# Separators inside non-CJK text: whitespace and full-width punctuation.
+_SPLIT = re.compile(r"[\s　-〿＀-￯]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into CJK bigrams and ASCII command/word tokens."""
+    tokens = []
+    text = text.lower()
+    for run in _CJK_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+
+    for chunk in _SPLIT.split(_CJK_RUN.sub(" ", text)):
+        if not chunk:
+            continue
+        tokens.append(chunk)
+        words = _WORD.findall(chunk)
+        if words != [chunk]:
+            tokens.extend(words)
+    return tokens
+
+
+@dataclass
+class SearchResult:
+    """A ranked search hit: a lesson, or one exercise within it."""
+
+    lesson_id: str
+    exercise_index: Optional[int]
+    title: str
+    snippet: str
+    score: float
+
+
+def _documents(lessons: Iterable[Lesson]) -> Iterable[tuple[dict, dict[str, str]]]:
+    """Yield (document metadata, field texts) for every lesson and exercise."""
+    for lesson in lessons:
+        yield (
+            {"lesson_id": lesson.id, "exercise_index": None, "title": lesson.title, "snippet": lesson.description},
+            {
+                "title": lesson.title,
+                "description": lesson.description,
+                "explanation": lesson.explanation,
+                "why": lesson.why or "",
+            },
+        )
+        for i, exercise in enumerate(lesson.exercises):
+            yield (
+                {"lesson_id": lesson.id, "exercise_index": i, "title": lesson.title, "snippet": exercise.instruction},
+                {
+                    "instruction": exercise.instruction,
+                    "hint": exercise.hint,
+                    "commands": " ".join(exercise.commands_to_learn),
+                },
+            )
+
+
+class SearchIndex:
+    """Inverted index from token to weighted document postings."""
+
+    def __init__(self, catalog_hash: str, docs: list[dict], postings: dict[str, list[list[float]]]):
+        self.catalog_hash = catalog_hash
+        self.docs = docs
+        self.postings = postings
+
+    @classmethod
+    def build(cls, lessons: Iterable[Lesson], catalog_hash: str) -> "SearchIndex":
+        """Index the given lessons."""
+        docs: list[dict] = []
+        postings: dict[str, list[list[float]]] = {}
+        for doc, fields in _documents(lessons):
+            doc_id = len(docs)
+            docs.append(doc)
+            weights: dict[str, float] = {}
+            for field_name, text in fields.items():
+                for token in tokenize(text):
+                    weights[token] = weights.get(token, 0.0) + FIELD_WEIGHTS[field_name]
+            for token, weight in weights.items():
+                postings.setdefault(token, []).append([doc_id, weight])
+        return cls(catalog_hash, docs, postings)
+
+    def search(self, query: str, limit: int = 10) -> list[SearchResult]:
+        """Rank documents by TF-IDF, favouring those matching more query terms."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        scores: dict[int, float] = {}
+        matched: dict[int, int] = {}
+        for term in terms:
+            postings = self.postings.get(term) or self._single_char_postings(term)
+            if not postings:
+                continue
+            idf = math.log(1 + len(self.docs) / len(postings))
+            for doc_id, weight in postings:
+                doc_id = int(doc_id)
+                scores[doc_id] = scores.get(doc_id, 0.0) + (1 + math.log(weight)) * idf
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+
+        ranked = sorted(
+            ((score * (matched[doc_id] / len(terms)) ** 2, doc_id) for doc_id, score in scores.items()),
+            key=lambda item: (-item[0], item[1]),
+        )
+        return [
+            SearchResult(score=score, **self.docs[doc_id])
+            for score, doc_id in ranked[:limit]
+        ]
+
+    def _single_char_postings(self, term: str) -> list[list[float]]:
+        """Match a lone CJK character against the bigrams that contain it."""
+        if len(term) != 1 or not _CJK_RUN.match(term):
+            return []
+        merged: dict[int, float] = {}
+        for token, postings in self.postings.items():
+            if term in token and _CJK_RUN.match(token):
+                for doc_id, weight in postings:
+                    merged[int(doc_id)] = max(merged.get(int(doc_id), 0.0), weight)
+        return [[doc_id, weight] for doc_id, weight in merged.items()]
+
+    def to_dict(self) -> dict:
+        """Convert the index to a dictionary for JSON serialization."""
+        return {
+            "catalog_hash": self.catalog_hash,
+            "docs": self.docs,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SearchIndex":
+        """Create an index from a dictionary."""
+        return cls(data["catalog_hash"], data["docs"], data["postings"])
+
+
+def load_search_index(catalog_hash: str, lessons_factory: Callable[[], Iterable[Lesson]]) -> SearchIndex:
+    """Load the cached index for a catalog version, building it if missing.
+
+    ``lessons_factory`` is only called on a cache miss, so cached queries never
+    load lesson content.
+    """
+    data = load_cached(
+        "search", catalog_hash, INDEX_VERSION,
+        lambda: SearchIndex.build(lessons_factory(), catalog_hash).to_dict(),
+    )
+    return SearchIndex.from_dict(data)
@@ -0,0 +1,107 @@
+"""Headless self-test of exercises using their reference solutions."""
+
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .exercise import ExerciseRunner
+from .lesson import Exercise, Lesson
+
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+SKIPPED = "skipped"
+
+
+@dataclass
+class SelfTestResult:
+    """Outcome of replaying one exercise's solution."""
+
+    lesson_id: str
+    exercise_index: int
+    status: str
+    duration: float
+    actual: str = ""
+    expected: str = ""
+    message: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"{self.lesson_id}#{self.exercise_index + 1}"
+
+
+def run_one(lesson_id: str, exercise_index: int, exercise: Exercise, timeout: float) -> SelfTestResult:
+    """Replay a single exercise's solution in a headless Vim and verify it."""
+    if not exercise.solution:
+        return SelfTestResult(lesson_id, exercise_index, SKIPPED, 0.0, message="no solution")
+
+    runner = ExerciseRunner()
+    started = time.perf_counter()
+    try:
+        filepath = runner.create_exercise_file(exercise)
+        if not runner.run_vim_headless(filepath, exercise.solution, exercise.cursor_position, timeout):
+            return SelfTestResult(
+                lesson_id, exercise_index, ERROR, time.perf_counter() - started,
+                expected=exercise.expected, message="vim failed or timed out",
+            )
+        success, actual, expected = runner.verify_result(exercise)
+        status = PASSED if success else FAILED
+        return SelfTestResult(lesson_id, exercise_index, status, time.perf_counter() - started, actual, expected)
+    finally:
+        runner.close()
+
+
+def _run_one(args: tuple) -> SelfTestResult:
+    return run_one(*args)
+
+
+def run_selftest(lessons: Iterable[Lesson], jobs: Optional[int] = None, timeout: float = 10.0) -> list[SelfTestResult]:
+    """Run every exercise of the given lessons across a process pool."""
+    tasks = [
+        (lesson.id, i, exercise, timeout)
+        for lesson in lessons
+        for i, exercise in enumerate(lesson.exercises)
+    ]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) <= 1:
+        return [_run_one(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_run_one, tasks, chunksize=4))
+
+
+def write_json_report(results: list[SelfTestResult], path: Path) -> None:
+    """Write results as a JSON report."""
+    summary = {status: sum(1 for r in results if r.status == status) for status in (PASSED, FAILED, ERROR, SKIPPED)}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "results": [asdict(r) for r in results]}, f, indent=2, ensure_ascii=False)
+
+
+def write_junit_report(results: list[SelfTestResult], path: Path) -> None:
+    """Write results as a JUnit XML report."""
+    suite = ET.Element(
+        "testsuite",
+        name="vimlearn.selftest",
+        tests=str(len(results)),
+        failures=str(sum(1 for r in results if r.status == FAILED)),
+        errors=str(sum(1 for r in results if r.status == ERROR)),
+        skipped=str(sum(1 for r in results if r.status == SKIPPED)),
+        time=f"{sum(r.duration for r in results):.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite, "testcase",
+            classname=f"lesson_{result.lesson_id}", name=result.name, time=f"{result.duration:.3f}",
+        )
+        if result.status == FAILED:
+            failure = ET.SubElement(case, "failure", message="result does not match expected")
+            failure.text = f"expected:\n{result.expected}\nactual:\n{result.actual}"
+        elif result.status == ERROR:
+            ET.SubElement(case, "error", message=result.message)
+        elif result.status == SKIPPED:
+            ET.SubElement(case, "skipped", message=result.message)
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
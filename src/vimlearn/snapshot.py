@@ -0,0 +1,267 @@
+"""Precompiled binary lesson catalog snapshot for VimLearn.
+
+The snapshot stores the whole module/lesson/exercise tree as fixed-size
+records that point into a shared string table. It is memory-mapped, so
+concurrent processes share the same page-cache pages and lessons are decoded
+only when opened instead of executing the curriculum literals.
+
+Layout (little-endian)::
+
+    header | string index | modules | lessons | exercises | command refs | string data
+"""
+
+import hashlib
+import importlib.util
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .lesson import Exercise, Lesson, LessonHeader, Module
+from .paths import get_cache_dir
+
+MAGIC = b"VLCS"
+FORMAT_VERSION = 3
+SNAPSHOT_FILENAME = "catalog.bin"
+
+# Marks an absent optional string (e.g. Lesson.why).
+NO_STRING = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHH32sIIIII")
+_STRING_REF = struct.Struct("<II")
+_MODULE = struct.Struct("<iIIII")
+_LESSON = struct.Struct("<IIIiIIIIII")
+_EXERCISE = struct.Struct("<IIIIIIiI")
+_COMMAND = struct.Struct("<I")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, corrupt or out of date."""
+
+
+def get_snapshot_file() -> Path:
+    """Get the path of the catalog snapshot file."""
+    return get_cache_dir() / SNAPSHOT_FILENAME
+
+
+def _module_source_bytes(module: Module) -> bytes:
+    """Get the bytes that define a module's lesson content."""
+    if module.source is None:
+        return repr(module.lessons).encode("utf-8")
+    spec = importlib.util.find_spec(module.source)
+    if spec is None or spec.origin is None:
+        raise SnapshotError(f"Cannot locate lesson source {module.source}")
+    return Path(spec.origin).read_bytes()
+
+
+def compute_source_hash(modules: Iterable[Module]) -> bytes:
+    """Hash the module headers and lesson source files without importing them."""
+    digest = hashlib.sha256(f"vimlearn-catalog-v{FORMAT_VERSION}".encode("ascii"))
+    for module in modules:
+        headers = [(lesson.id, lesson.title, lesson.module, lesson.module_num) for lesson in module.lessons]
+        digest.update(repr((module.num, module.title, module.description, module.source, headers)).encode("utf-8"))
+        digest.update(_module_source_bytes(module))
+    return digest.digest()
+
+
+class _StringTable:
+    """Deduplicating string table used while building a snapshot."""
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.data = bytearray()
+        self.refs: list[tuple[int, int]] = []
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        string_id = self.ids.get(value)
+        if string_id is None:
+            encoded = value.encode("utf-8")
+            string_id = len(self.refs)
+            self.refs.append((len(self.data), len(encoded)))
+            self.data += encoded
+            self.ids[value] = string_id
+        return string_id
+
+
+def build_snapshot(modules: list[Module], source_hash: bytes) -> bytes:
+    """Serialize the full lesson tree of the given modules."""
+    strings = _StringTable()
+    module_records, lesson_records, exercise_records, command_records = [], [], [], []
+
+    for module in modules:
+        lessons = module.load_lessons()
+        module_records.append(_MODULE.pack(
+            module.num, strings.add(module.title), strings.add(module.description),
+            len(lesson_records), len(lessons),
+        ))
+        for lesson in lessons:
+            lesson_records.append(_LESSON.pack(
+                strings.add(lesson.id), strings.add(lesson.title), strings.add(lesson.module),
+                lesson.module_num, strings.add(lesson.description), strings.add(lesson.explanation),
+                strings.add(lesson.why), len(exercise_records), len(lesson.exercises),
+                strings.add(lesson.vim_profile),
+            ))
+            for exercise in lesson.exercises:
+                exercise_records.append(_EXERCISE.pack(
+                    strings.add(exercise.instruction), strings.add(exercise.initial),
+                    strings.add(exercise.expected), strings.add(exercise.hint),
+                    len(command_records), len(exercise.commands_to_learn),
+                    -1 if exercise.cursor_position is None else exercise.cursor_position,
+                    strings.add(exercise.solution),
+                ))
+                command_records.extend(_COMMAND.pack(strings.add(cmd)) for cmd in exercise.commands_to_learn)
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, source_hash, len(strings.refs),
+        len(module_records), len(lesson_records), len(exercise_records), len(command_records),
+    )
+    string_index = b"".join(_STRING_REF.pack(offset, length) for offset, length in strings.refs)
+    return b"".join([
+        header, string_index, *module_records, *lesson_records,
+        *exercise_records, *command_records, bytes(strings.data),
+    ])
+
+
+def write_snapshot(path: Path, data: bytes) -> None:
+    """Atomically replace the snapshot file so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class CatalogSnapshot:
+    """Read-only view over a memory-mapped catalog snapshot."""
+
+    def __init__(self, path: Path, expected_hash: Optional[bytes] = None):
+        with open(path, "rb") as f:
+            try:
+                self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotError(f"Empty snapshot file {path}") from e
+
+        if len(self._buf) < _HEADER.size:
+            raise SnapshotError(f"Truncated snapshot file {path}")
+        (magic, version, _, source_hash, n_strings, n_modules,
+         n_lessons, n_exercises, n_commands) = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot format in {path}")
+        if expected_hash is not None and source_hash != expected_hash:
+            raise SnapshotError(f"Snapshot {path} is out of date")
+
+        self.source_hash = source_hash
+        self._strings_at = _HEADER.size
+        self._modules_at = self._strings_at + n_strings * _STRING_REF.size
+        self._lessons_at = self._modules_at + n_modules * _MODULE.size
+        self._exercises_at = self._lessons_at + n_lessons * _LESSON.size
+        self._commands_at = self._exercises_at + n_exercises * _EXERCISE.size
+        self._data_at = self._commands_at + n_commands * _COMMAND.size
+        self._counts = (n_strings, n_modules, n_lessons)
+        self._lesson_index: Optional[dict[str, int]] = None
+
+        if len(self._buf) < self._data_at:
+            raise SnapshotError(f"Truncated snapshot file {path}")
+
+    def close(self) -> None:
+        self._buf.close()
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode a string from the string table."""
+        if string_id == NO_STRING:
+            return None
+        offset, length = _STRING_REF.unpack_from(self._buf, self._strings_at + string_id * _STRING_REF.size)
+        start = self._data_at + offset
+        return self._buf[start:start + length].decode("utf-8")
+
+    def modules(self) -> list[Module]:
+        """Get all modules with lesson headers, in curriculum order."""
+        modules = []
+        for i in range(self._counts[1]):
+            num, title, description, first, count = _MODULE.unpack_from(self._buf, self._modules_at + i * _MODULE.size)
+            module_title = self.string(title)
+            lessons = []
+            for j in range(first, first + count):
+                lesson_id, lesson_title = _LESSON.unpack_from(self._buf, self._lessons_at + j * _LESSON.size)[:2]
+                lessons.append(LessonHeader(
+                    id=self.string(lesson_id), title=self.string(lesson_title),
+                    module=module_title, module_num=num,
+                ))
+            modules.append(Module(num=num, title=module_title, description=self.string(description), lessons=lessons))
+        return modules
+
+    def lesson(self, lesson_id: str) -> Optional[Lesson]:
+        """Decode the full lesson with the given ID, if present."""
+        if self._lesson_index is None:
+            self._lesson_index = {
+                self.string(_LESSON.unpack_from(self._buf, self._lessons_at + i * _LESSON.size)[0]): i
+                for i in range(self._counts[2])
+            }
+        index = self._lesson_index.get(lesson_id)
+        if index is None:
+            return None
+
+        (id_, title, module, module_num, description, explanation,
+         why, first_exercise, exercise_count, vim_profile) = _LESSON.unpack_from(self._buf, self._lessons_at + index * _LESSON.size)
+        return Lesson(
+            id=self.string(id_),
+            title=self.string(title),
+            module=self.string(module),
+            module_num=module_num,
+            description=self.string(description),
+            explanation=self.string(explanation),
+            exercises=[self._exercise(i) for i in range(first_exercise, first_exercise + exercise_count)],
+            why=self.string(why),
+            vim_profile=self.string(vim_profile),
+        )
+
+    def _exercise(self, index: int) -> Exercise:
+        (instruction, initial, expected, hint, first_cmd,
+         cmd_count, cursor, solution) = _EXERCISE.unpack_from(self._buf, self._exercises_at + index * _EXERCISE.size)
+        commands = [
+            self.string(_COMMAND.unpack_from(self._buf, self._commands_at + i * _COMMAND.size)[0])
+            for i in range(first_cmd, first_cmd + cmd_count)
+        ]
+        return Exercise(
+            instruction=self.string(instruction),
+            initial=self.string(initial),
+            expected=self.string(expected),
+            hint=self.string(hint),
+            commands_to_learn=commands,
+            cursor_position=None if cursor < 0 else cursor,
+            solution=self.string(solution),
+        )
+
+
+def rebuild_snapshot(modules: list[Module], path: Optional[Path] = None) -> Path:
+    """Build and write a fresh snapshot for the given modules."""
+    path = path or get_snapshot_file()
+    write_snapshot(path, build_snapshot(modules, compute_source_hash(modules)))
+    return path
+
+
+def load_snapshot(
+    modules: list[Module], path: Optional[Path] = None, source_hash: Optional[bytes] = None,
+) -> Optional[CatalogSnapshot]:
+    """Open the snapshot for the given modules, rebuilding it when stale.
+
+    ``source_hash`` is the modules' compute_source_hash(), if the caller
+    already has it. Returns None if no usable snapshot can be produced (e.g.
+    read-only home), in which case callers fall back to importing lesson sources.
+    """
+    try:
+        path = path or get_snapshot_file()
+        source_hash = source_hash or compute_source_hash(modules)
+        try:
+            return CatalogSnapshot(path, source_hash)
+        except (OSError, SnapshotError):
+            write_snapshot(path, build_snapshot(modules, source_hash))
+            return CatalogSnapshot(path, source_hash)
+    except (OSError, SnapshotError):
+        return None
@@ -0,0 +1,646 @@
+"""Storage backends for user profiles.
+
+A store persists a user's profile snapshot (the dict from ``User.to_dict``)
+and the attempt events logged since that snapshot. Two backends exist:
+
+- json:   one JSON file plus one JSONL attempt log per user (the default),
+          sharded into ``users/<hash prefix>/`` directories, with an
+          append-only ``users/index.jsonl`` of per-user summaries
+- sqlite: a single WAL-mode database shared by all users, for hosts with
+          many learners; counters are updated in place with ``value + delta``
+
+The backend is chosen by ``$VIMLEARN_STORAGE`` or the ``"storage"`` key of
+``~/.vimlearn/config.json``.
+
+Writers of one user's data serialize on a per-user lock (an advisory file
+lock for JSON, a write transaction for SQLite) held only for the few
+milliseconds of a read-merge-write, and a separate session lock tells a new
+session that another live one is already running for the same user.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .paths import get_data_dir, load_config
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, last writer wins
+    fcntl = None
+
+STORAGE_ENV = "VIMLEARN_STORAGE"
+DEFAULT_STORAGE = "json"
+STORAGE_NAMES = ("json", "sqlite")
+
+# Top-level stats that are plain additive counters.
+COUNTERS = ("total_exercises", "successful_first_try", "total_attempts")
+
+# Hex digits of the username hash naming a user's shard directory.
+SHARD_WIDTH = 2
+INDEX_FILENAME = "index.jsonl"
+# Superseded index lines tolerated before the index is rewritten.
+INDEX_SLACK = 64
+
+# Directories known to exist, so lookups do not mkdir every time
+_known_dirs: set[Path] = set()
+
+
+@dataclass(frozen=True)
+class UserSummary:
+    """What user listings need, without reading the profile."""
+
+    username: str
+    last_active: Optional[str]
+    current_lesson: Optional[str]
+    completed: int
+
+
+def _ensure_dir(path: Path) -> Path:
+    if path not in _known_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(path)
+    return path
+
+
+def shard_name(username: str) -> str:
+    """Get the shard directory name for a user."""
+    return hashlib.sha1(username.encode("utf-8")).hexdigest()[:SHARD_WIDTH]
+
+
+def get_user_dir(username: Optional[str] = None) -> Path:
+    """Get the user data root, or a user's shard directory within it."""
+    root = get_data_dir() / "users"
+    if root not in _known_dirs:
+        _ensure_dir(root)
+        migrate_flat_layout(root)
+    if username is None:
+        return root
+    return _ensure_dir(root / shard_name(username))
+
+
+def get_user_file(username: str) -> Path:
+    """Get the path to a user's data file."""
+    return get_user_dir(username) / f"{username}.json"
+
+
+def get_attempt_log_file(username: str) -> Path:
+    """Get the path to a user's append-only attempt log."""
+    return get_user_dir(username) / f"{username}.attempts.jsonl"
+
+
+def get_database_file() -> Path:
+    """Get the path of the SQLite user database."""
+    data_dir = get_data_dir()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir / "users.db"
+
+
+def get_lock_file(username: str) -> Path:
+    """Get the path of a user's advisory lock file."""
+    return get_user_dir(username) / f".{username}.lock"
+
+
+def get_session_file(username: str) -> Path:
+    """Get the path of the file marking a user's running session."""
+    return get_user_dir(username) / f".{username}.session"
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+class SessionLock:
+    """An advisory lock held for as long as a learning session runs."""
+
+    def __init__(self, username: str):
+        self.path = get_session_file(username)
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> Optional[int]:
+        """
+        Take the lock, or report who holds it.
+        Returns None on success, else the PID of the live holder (0 if unknown).
+        """
+        if fcntl is None or self._fd is not None:
+            return None
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            try:
+                holder = int(os.read(fd, 32).decode("ascii").strip() or 0)
+            except (OSError, ValueError):
+                holder = 0
+            os.close(fd)
+            return holder
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        self._fd = fd
+        return None
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self._fd is not None:
+            os.ftruncate(self._fd, 0)
+            os.close(self._fd)
+            self._fd = None
+
+
+def _iter_shards(root: Path) -> Iterator[Path]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir() and len(entry.name) == SHARD_WIDTH:
+                yield Path(entry.path)
+
+
+def summarize_profile(data: dict) -> UserSummary:
+    """Get the index summary of a profile dict."""
+    return UserSummary(
+        data["username"], data.get("last_active"), data.get("current_lesson"),
+        len(data.get("completed_lessons", [])),
+    )
+
+
+def _index_line(summary: UserSummary) -> str:
+    record = [summary.username, summary.last_active, summary.current_lesson, summary.completed]
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def rebuild_user_index(root: Path) -> dict[str, UserSummary]:
+    """Rewrite the index from the profiles on disk (after migration or loss)."""
+    summaries = {}
+    for shard in _iter_shards(root):
+        for profile in shard.glob("*.json"):
+            try:
+                with open(profile, "r", encoding="utf-8") as f:
+                    summary = summarize_profile(json.load(f))
+            except (OSError, ValueError, KeyError):
+                continue
+            summaries[summary.username] = summary
+    _write_index(root, summaries)
+    return summaries
+
+
+def _write_index(root: Path, summaries: dict[str, UserSummary]) -> None:
+    index_file = root / INDEX_FILENAME
+    tmp_file = index_file.with_name(f".{INDEX_FILENAME}.{os.getpid()}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.writelines(_index_line(summary) for summary in summaries.values())
+    os.replace(tmp_file, index_file)
+
+
+def read_user_index(root: Path) -> dict[str, UserSummary]:
+    """Read the latest summary of every user, compacting the index when it has grown."""
+    with file_lock(root / ".index.lock"):
+        summaries: dict[str, UserSummary] = {}
+        lines = 0
+        try:
+            f = open(root / INDEX_FILENAME, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return rebuild_user_index(root)
+        with f:
+            for line in f:
+                try:
+                    username, last_active, current_lesson, completed = json.loads(line)
+                except ValueError:
+                    continue
+                lines += 1
+                summaries[username] = UserSummary(username, last_active, current_lesson, completed)
+        if lines > len(summaries) + INDEX_SLACK:
+            _write_index(root, summaries)
+        return summaries
+
+
+def update_user_index(root: Path, *summaries: UserSummary) -> None:
+    """Append users' latest summaries to the index."""
+    with file_lock(root / ".index.lock"):
+        with open(root / INDEX_FILENAME, "a", encoding="utf-8") as f:
+            f.writelines(_index_line(summary) for summary in summaries)
+
+
+def migrate_flat_layout(root: Path) -> int:
+    """
+    Move profiles and attempt logs from the old flat ``users/`` directory into
+    shard directories and rebuild the index. Returns the number of users moved.
+    """
+    with os.scandir(root) as entries:
+        flat = [entry.name for entry in entries if entry.is_file() and entry.name.endswith(".json")]
+    if not flat:
+        return 0
+
+    moved = 0
+    with file_lock(root / ".migrate.lock"):
+        for name in flat:
+            username = name[:-len(".json")]
+            source = root / name
+            if not source.exists():
+                # Another process migrated it first
+                continue
+            shard = _ensure_dir(root / shard_name(username))
+            log_file = root / f"{username}.attempts.jsonl"
+            if log_file.exists():
+                shutil.move(log_file, shard / log_file.name)
+            shutil.move(source, shard / name)
+            moved += 1
+        if moved:
+            with file_lock(root / ".index.lock"):
+                rebuild_user_index(root)
+    return moved
+
+
+def read_attempt_log(path: Path) -> list[dict]:
+    """Read all log events, skipping torn lines."""
+    events = []
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return events
+    with f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                # A crash mid-append leaves at most one partial line
+                continue
+            if isinstance(event, dict):
+                events.append(event)
+    return events
+
+
+def atomic_write_json(path: Path, data: dict) -> None:
+    """Write JSON via temp file + fsync + rename so readers see old or new, never partial."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Persist the rename itself
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class UserStore:
+    """Interface for user profile storage."""
+
+    name = ""
+    # Exceptions the backend raises when storage is unavailable
+    errors: tuple[type[Exception], ...] = (OSError,)
+
+    def load(self, username: str) -> Optional[dict]:
+        """Get a user's profile snapshot, or None if the user does not exist."""
+        raise NotImplementedError
+
+    def locked(self, username: str):
+        """Context manager serializing read-merge-write cycles for one user."""
+        raise NotImplementedError
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group many saves so the backend can commit them together."""
+        yield
+
+    def save(self, data: dict, counter_deltas: dict) -> None:
+        """
+        Write a profile snapshot that has folded in every logged event, and
+        drop the log. Must be called inside ``locked()``.
+
+        ``counter_deltas`` holds the change of each counter in ``COUNTERS``
+        relative to the stored profile, for backends that update them in place.
+        """
+        raise NotImplementedError
+
+    def append_event(self, username: str, event: dict) -> None:
+        """Append one event to a user's log."""
+        raise NotImplementedError
+
+    def read_events(self, username: str) -> list[dict]:
+        """Get a user's logged events, oldest first."""
+        raise NotImplementedError
+
+    def list_users(self) -> list[str]:
+        """List all existing users."""
+        return [summary.username for summary in self.list_summaries()]
+
+    def list_summaries(self) -> list[UserSummary]:
+        """List every user's summary, most recently active first, without reading profiles."""
+        raise NotImplementedError
+
+    def scan(self) -> Iterator[tuple[str, str]]:
+        """
+        Stream ``(username, version)`` for every user without reading profiles.
+        The version changes whenever the profile or its event log does.
+        """
+        raise NotImplementedError
+
+
+class JsonUserStore(UserStore):
+    """One pretty-printed JSON profile and one JSONL attempt log per user."""
+
+    name = "json"
+
+    def load(self, username: str) -> Optional[dict]:
+        try:
+            with open(get_user_file(username), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def __init__(self):
+        self._index_buffer: Optional[list[UserSummary]] = None
+
+    def locked(self, username: str):
+        return file_lock(get_lock_file(username))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # Profiles are still written one by one; index lines go out in one append
+        if self._index_buffer is not None:
+            yield
+            return
+        self._index_buffer = []
+        try:
+            yield
+        finally:
+            summaries, self._index_buffer = self._index_buffer, None
+            if summaries:
+                update_user_index(get_user_dir(), *summaries)
+
+    def save(self, data: dict, counter_deltas: dict) -> None:
+        username = data["username"]
+        atomic_write_json(get_user_file(username), data)
+        # Every logged event is now in the snapshot
+        log_file = get_attempt_log_file(username)
+        if log_file.exists():
+            with open(log_file, "w", encoding="utf-8"):
+                pass
+        if self._index_buffer is not None:
+            self._index_buffer.append(summarize_profile(data))
+        else:
+            update_user_index(get_user_dir(), summarize_profile(data))
+
+    def append_event(self, username: str, event: dict) -> None:
+        # Locked so a concurrent compaction cannot drop the line unseen
+        with file_lock(get_lock_file(username)):
+            with open(get_attempt_log_file(username), "a", encoding="utf-8") as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def read_events(self, username: str) -> list[dict]:
+        return read_attempt_log(get_attempt_log_file(username))
+
+    def list_summaries(self) -> list[UserSummary]:
+        summaries = read_user_index(get_user_dir()).values()
+        return sorted(summaries, key=lambda summary: summary.last_active or "", reverse=True)
+
+    def scan(self) -> Iterator[tuple[str, str]]:
+        for shard in _iter_shards(get_user_dir()):
+            with os.scandir(shard) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                        continue
+                    username = entry.name[:-len(".json")]
+                    try:
+                        profile = entry.stat()
+                    except OSError:
+                        continue
+                    try:
+                        log_mtime = os.stat(shard / f"{username}.attempts.jsonl").st_mtime_ns
+                    except OSError:
+                        log_mtime = 0
+                    yield username, f"{profile.st_mtime_ns}:{profile.st_size}:{log_mtime}"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    created_at TEXT,
+    last_active TEXT,
+    current_lesson TEXT,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_last_active ON users (last_active);
+CREATE TABLE IF NOT EXISTS stats (
+    username TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (username, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_username ON events (username);
+"""
+
+
+class SqliteUserStore(UserStore):
+    """
+    All users in one SQLite database in WAL mode.
+
+    Each call is a short transaction, so sessions of different users only
+    contend for the brief moment of a write and readers never block writers.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = 10.0):
+        # Imported here so the JSON backend never loads sqlite3
+        import sqlite3
+
+        self.errors = (OSError, sqlite3.Error)
+        self.path = path or get_database_file()
+        # The debounce timer flushes from another thread
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._depth = 0
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def locked(self, username: str) -> Iterator[None]:
+        # BEGIN IMMEDIATE takes the database write lock up front; nested
+        # uses join the outer transaction
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("COMMIT")
+
+    def batch(self):
+        # One write transaction for the whole batch
+        return self.locked("")
+
+    def load(self, username: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM users WHERE username = ?", (username,)).fetchone()
+            if row is None:
+                # Not moved over from the JSON layout yet; that happens on the first write
+                return JsonUserStore().load(username)
+            data = json.loads(row[0])
+            stats = data.setdefault("stats", {})
+            for name, value in self._conn.execute("SELECT name, value FROM stats WHERE username = ?", (username,)):
+                stats[name] = value
+            return data
+
+    def _has_user(self, username: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM users WHERE username = ?", (username,)).fetchone() is not None
+
+    def _import_json(self, username: str) -> None:
+        """Move a profile from the JSON layout into the database before its first write."""
+        if self._has_user(username):
+            return
+        data = JsonUserStore().load(username)
+        if data is None:
+            return
+        stats = data.get("stats") or {}
+        with self.locked(username):
+            self._write(data, {name: stats.get(name, 0) for name in COUNTERS})
+            self._conn.executemany(
+                "INSERT INTO events (username, data) VALUES (?, ?)",
+                [(username, json.dumps(event, ensure_ascii=False)) for event in JsonUserStore().read_events(username)],
+            )
+
+    def save(self, data: dict, counter_deltas: dict) -> None:
+        username = data["username"]
+        with self.locked(username):
+            # Deltas are relative to what load() returned, which may be the JSON profile
+            self._import_json(username)
+            self._write(data, counter_deltas)
+
+    def _write(self, data: dict, counter_deltas: dict) -> None:
+        username = data["username"]
+        self._conn.execute(
+            "INSERT INTO users (username, created_at, last_active, current_lesson, completed_count, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (username) DO UPDATE SET last_active = excluded.last_active, "
+            "current_lesson = excluded.current_lesson, completed_count = excluded.completed_count, "
+            "data = excluded.data",
+            (
+                username, data.get("created_at"), data.get("last_active"), data.get("current_lesson"),
+                len(data.get("completed_lessons", [])), json.dumps(data, ensure_ascii=False),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT INTO stats (username, name, value) VALUES (?, ?, ?) "
+            "ON CONFLICT (username, name) DO UPDATE SET value = value + excluded.value",
+            [(username, name, delta) for name, delta in counter_deltas.items() if delta],
+        )
+        self._conn.execute("DELETE FROM events WHERE username = ?", (username,))
+
+    def append_event(self, username: str, event: dict) -> None:
+        with self._lock:
+            self._import_json(username)
+            self._conn.execute(
+                "INSERT INTO events (username, data) VALUES (?, ?)",
+                (username, json.dumps(event, ensure_ascii=False)),
+            )
+
+    def read_events(self, username: str) -> list[dict]:
+        with self._lock:
+            if not self._has_user(username):
+                return JsonUserStore().read_events(username)
+            rows = self._conn.execute(
+                "SELECT data FROM events WHERE username = ? ORDER BY id", (username,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def list_summaries(self) -> list[UserSummary]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT username, last_active, current_lesson, completed_count FROM users ORDER BY last_active DESC"
+            ).fetchall()
+        summaries = [UserSummary(*row) for row in rows]
+        # Profiles not yet moved over from the JSON layout
+        known = {summary.username for summary in summaries}
+        legacy = [summary for summary in JsonUserStore().list_summaries() if summary.username not in known]
+        if legacy:
+            summaries = sorted(summaries + legacy, key=lambda summary: summary.last_active or "", reverse=True)
+        return summaries
+
+    def scan(self) -> Iterator[tuple[str, str]]:
+        # A separate cursor, so the rows stream instead of being fetched at once
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT username, last_active, "
+                "(SELECT max(id) FROM events WHERE events.username = users.username) FROM users"
+            )
+        known = set()
+        for username, last_active, last_event in cursor:
+            known.add(username)
+            yield username, f"{last_active}:{last_event or 0}"
+        # Profiles not yet moved over from the JSON layout; the first write imports them
+        for username, version in JsonUserStore().scan():
+            if username not in known:
+                yield username, f"json:{version}"
+
+
+@lru_cache(maxsize=None)
+def get_storage_name() -> str:
+    """Get the configured storage backend name, resolved once per process.
+
+    get_store() runs on every event and save, so the config file is not re-read each time.
+    """
+    return os.environ.get(STORAGE_ENV) or load_config().get("storage") or DEFAULT_STORAGE
+
+
+@lru_cache(maxsize=None)
+def open_store(name: str, pid: int) -> UserStore:
+    """Open the store with the given backend name, once per process.
+
+    Keyed by PID so a forked child never shares its parent's database connection.
+    """
+    if name == "json":
+        return JsonUserStore()
+    if name == "sqlite":
+        return SqliteUserStore()
+    raise ValueError(f"Unknown storage backend: {name}")
+
+
+def get_store() -> UserStore:
+    """Get the configured user store."""
+    return open_store(get_storage_name(), os.getpid())
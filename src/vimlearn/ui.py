@@ -1,29 +1,207 @@
 """Terminal UI components for VimLearn using rich."""
 
-from rich.console import Console
+import atexit
+import io
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import zip_longest
+from typing import Callable, Container, Iterator, Optional
+
+from rich.cells import cell_len
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.segment import Segments
+from rich.styled import Styled
 from rich.table import Table
 from rich.text import Text
+from rich.theme import Theme
 from rich import box
 
 from .lesson import Lesson, Exercise, Module
+from .keys import can_read_keys, read_key
+from .lessons import get_catalog_hash
+from .screen import BufferedOutput, Screen, detect_low_bandwidth
 from .user import User
 
 
-console = Console()
+# Styles for named style lookups; see set_theme()
+theme = Theme()
+console = Console(theme=theme)
 
 # 统一的分隔线
 SEPARATOR = "─" * 60
 
+# Rendered static lesson content (lesson header, explanation, exercise panels),
+# keyed by catalog hash, what was rendered, terminal width, color system and theme.
+RENDER_CACHE_SIZE = 512
+_render_cache: dict[tuple, Segments] = {}
+
+# Set while the session UI runs on the alternate screen (see screen.py)
+screen: Optional[Screen] = None
+
+# Plain output for slow links, see set_low_bandwidth()
+low_bandwidth = False
+LOWBW_SETTINGS = ("auto", "on", "off")
+
+
+def resolve_low_bandwidth(settings: dict, override: Optional[bool] = None) -> bool:
+    """Pick low-bandwidth mode from a command-line flag, the user's setting, or detection."""
+    if override is not None:
+        return override
+    setting = settings.get("lowbw", "auto")
+    if setting != "auto":
+        return setting == "on"
+    return detect_low_bandwidth()
+
+
+def set_low_bandwidth(enabled: bool) -> None:
+    """
+    Switch low-bandwidth rendering on or off: no colors, panels or separators,
+    compact exercises, and each screen written at once when input is awaited.
+    """
+    global console, low_bandwidth
+    if enabled == low_bandwidth:
+        return
+    low_bandwidth = enabled
+    if enabled:
+        output = BufferedOutput(sys.stdout)
+        atexit.register(output.refresh)
+        console = Console(file=output, color_system=None, emoji=False, highlight=False, theme=theme)
+    else:
+        # Show what the buffered console still holds before it is dropped
+        console.file.refresh()
+        console = Console(theme=theme)
+
+
+def set_theme(new_theme: Theme) -> None:
+    """Use another style theme; static content rendered with the old one is not reused."""
+    global theme
+    theme = new_theme
+    console.push_theme(new_theme)
+
+
+def _present() -> None:
+    """Put output held back for the current screen on the terminal."""
+    if screen is not None:
+        screen.refresh()
+    elif low_bandwidth:
+        console.file.refresh()
+
+
+@contextmanager
+def alternate_screen(enabled: bool = True) -> Iterator[None]:
+    """
+    Run the enclosed session UI on the alternate screen, redrawing only
+    changed rows. Does nothing unless enabled and writing to a terminal.
+    Set $VIMLEARN_SCREEN_STATS to print the bytes written afterwards.
+    """
+    global screen
+    if not enabled or low_bandwidth or screen is not None or not console.is_terminal:
+        yield
+        return
+    screen = Screen(console.file)
+    console.file = screen
+    screen.enter()
+    try:
+        yield
+    finally:
+        screen.leave()
+        console.file = screen.stream
+        if os.environ.get("VIMLEARN_SCREEN_STATS"):
+            print(f"屏幕输出 {screen.bytes_written} 字节，重绘 {screen.redraws} 次", file=sys.stderr)
+        screen = None
+
+
+@contextmanager
+def suspend_screen() -> Iterator[None]:
+    """Hand the terminal to another program (Vim), repainting the screen afterwards."""
+    _present()
+    try:
+        yield
+    finally:
+        if screen is not None:
+            screen.resume()
+
+
+def _input(prompt: str) -> str:
+    if screen is None and not low_bandwidth:
+        return console.input(prompt)
+    console.print(prompt, end="")
+    _present()
+    answer = input()
+    if screen is not None:
+        screen.note_input(answer)
+    return answer
+
+
+def _read_key(prompt: str) -> str:
+    """Prompt for a single keypress, or for a line when stdin is not a terminal."""
+    if not can_read_keys():
+        return _input(prompt).strip()
+    console.print(prompt, end="")
+    _present()
+    key = read_key()
+    # Echo the key as line input would have
+    echo = key if len(key) == 1 and key.isprintable() else ""
+    if screen is not None:
+        screen.echo_input(echo)
+    else:
+        console.print(echo, markup=False, highlight=False)
+    return key
+
 
 def clear_screen() -> None:
-    """Clear the terminal screen."""
-    console.clear()
+    """Clear the terminal screen (on the alternate screen, start a new frame)."""
+    if screen is not None:
+        screen.clear()
+    else:
+        console.clear()
+
+
+def _print_static(key: tuple, build: Callable[[], RenderableType]) -> None:
+    """
+    Print static lesson content, reusing its rendered segments when the same
+    content was already laid out for this terminal width, color system and theme.
+    """
+    cache_key = (get_catalog_hash(), *key, console.width, console.color_system, theme, low_bandwidth)
+    segments = _render_cache.get(cache_key)
+    if segments is None:
+        if len(_render_cache) >= RENDER_CACHE_SIZE:
+            del _render_cache[next(iter(_render_cache))]
+        segments = _render_cache[cache_key] = Segments(console.render(build(), console.options))
+    console.print(segments)
+
+
+def _panel(renderable: RenderableType, title: Optional[str] = None, **options) -> RenderableType:
+    """Get a panel, or in low-bandwidth mode just its title and content."""
+    if low_bandwidth:
+        return Group(Text(f"[{title}]"), renderable) if title else renderable
+    return Panel(renderable, title=title, **options)
+
+
+def _columns(left_title: str, left: str, right_title: str, right: str) -> Text:
+    """Lay out two texts side by side in plain text, for low-bandwidth mode."""
+    left_lines = [left_title, *left.splitlines()]
+    right_lines = [right_title, *right.splitlines()]
+    width = max(cell_len(line) for line in left_lines)
+    return Text("\n".join(
+        f"{l}{' ' * (width - cell_len(l))} | {r}" for l, r in zip_longest(left_lines, right_lines, fillvalue="")
+    ))
 
 
 def print_header(user: User, total_lessons: int, current_module: int, total_modules: int, current_lesson_in_module: int, total_lessons_in_module: int) -> None:
     """Print the application header with user info and progress."""
     progress_pct = user.get_progress_percentage(total_lessons)
+    if low_bandwidth:
+        console.print(
+            f"VimLearn | {user.username} | 进度 {progress_pct:.0f}% | "
+            f"模块 {current_module}/{total_modules} 课程 {current_lesson_in_module}/{total_lessons_in_module}",
+            markup=False,
+        )
+        return
     progress_bar = create_progress_bar(progress_pct)
 
     header_text = Text()
@@ -46,27 +224,36 @@ def create_progress_bar(percentage: float, width: int = 20) -> str:
 
 def print_lesson_header(lesson: Lesson) -> None:
     """Print the lesson header."""
-    console.print()
-    console.print(f"[模块 {lesson.module_num}] {lesson.module}", style="bold magenta")
-    console.print(f"[课程 {lesson.id}] {lesson.title}", style="bold green")
-    console.print()
+    _print_static(("lesson", lesson.id), lambda: Group(
+        Text(),
+        Styled(console.render_str(f"[模块 {lesson.module_num}] {lesson.module}"), "bold magenta"),
+        Styled(console.render_str(f"[课程 {lesson.id}] {lesson.title}"), "bold green"),
+        Text(),
+    ))
 
 
-def print_explanation(explanation: str) -> None:
-    """Print the lesson explanation in a panel."""
-    console.print(Panel(
+def _explanation_panel(explanation: str) -> RenderableType:
+    return _panel(
         explanation.strip(),
         title="讲解",
         title_align="left",
         border_style="cyan",
         box=box.ROUNDED,
-    ))
+    )
+
+
+def print_explanation(explanation: str, lesson_id: Optional[str] = None) -> None:
+    """Print the lesson explanation in a panel (cached when the lesson is given)."""
+    if lesson_id is None:
+        console.print(_explanation_panel(explanation))
+    else:
+        _print_static(("explanation", lesson_id), lambda: _explanation_panel(explanation))
 
 
 def print_why(why: str) -> None:
     """Print the design philosophy explanation."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         why.strip(),
         title="为什么这样设计？",
         title_align="left",
@@ -75,40 +262,52 @@ def print_why(why: str) -> None:
     ))
 
 
-def print_exercise(exercise: Exercise, exercise_num: int, total_exercises: int) -> None:
-    """Print an exercise."""
-    console.print()
-    console.print(SEPARATOR, style="dim")
-    console.print()
-    console.print(f"练习 {exercise_num}/{total_exercises}: {exercise.instruction}", style="bold white")
-    console.print()
-
-    # Initial content
-    console.print("[dim]初始内容:[/dim]")
-    console.print(Panel(
-        exercise.initial or "(空文件)",
-        border_style="white",
-        box=box.ROUNDED,
-    ))
-
-    # Expected content
-    console.print("[dim]目标内容:[/dim]")
-    console.print(Panel(
-        exercise.expected or "(空文件)",
-        border_style="green",
-        box=box.ROUNDED,
-    ))
-
+def _exercise_view(exercise: Exercise, exercise_num: int, total_exercises: int) -> Group:
+    if low_bandwidth:
+        parts = [
+            Text(),
+            Text(f"练习 {exercise_num}/{total_exercises}: {exercise.instruction}"),
+            _columns("初始内容", exercise.initial or "(空文件)", "目标内容", exercise.expected or "(空文件)"),
+        ]
+        if exercise.commands_to_learn:
+            parts.append(Text(f"本练习命令: {'  '.join(exercise.commands_to_learn)}"))
+        return Group(*parts)
+
+    parts: list[RenderableType] = [
+        Text(),
+        Text(SEPARATOR, style="dim"),
+        Text(),
+        Styled(console.render_str(f"练习 {exercise_num}/{total_exercises}: {exercise.instruction}"), "bold white"),
+        Text(),
+        # Initial content
+        console.render_str("[dim]初始内容:[/dim]"),
+        Panel(exercise.initial or "(空文件)", border_style="white", box=box.ROUNDED),
+        # Expected content
+        console.render_str("[dim]目标内容:[/dim]"),
+        Panel(exercise.expected or "(空文件)", border_style="green", box=box.ROUNDED),
+    ]
     # Commands to learn
     if exercise.commands_to_learn:
         commands = "  ".join([f"[bold cyan]{cmd}[/bold cyan]" for cmd in exercise.commands_to_learn])
-        console.print(f"本练习命令: {commands}")
+        parts.append(console.render_str(f"本练习命令: {commands}"))
+    return Group(*parts)
+
+
+def print_exercise(exercise: Exercise, exercise_num: int, total_exercises: int, lesson_id: Optional[str] = None) -> None:
+    """Print an exercise (cached when the lesson is given)."""
+    if lesson_id is None:
+        console.print(_exercise_view(exercise, exercise_num, total_exercises))
+    else:
+        _print_static(
+            ("exercise", lesson_id, exercise_num, total_exercises),
+            lambda: _exercise_view(exercise, exercise_num, total_exercises),
+        )
 
 
 def print_hint(hint: str) -> None:
     """Print a hint."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         hint,
         title="提示",
         title_align="left",
@@ -121,7 +320,8 @@ def print_menu(options: list[tuple[str, str]]) -> None:
     """Print a menu with options. Each option is (key, label)."""
     menu_items = "  ".join([f"[bold cyan]{key}[/bold cyan] {label}" for key, label in options])
     console.print()
-    console.print(SEPARATOR)
+    if not low_bandwidth:
+        console.print(SEPARATOR)
     console.print(menu_items)
 
 
@@ -136,10 +336,22 @@ def print_exercise_menu() -> None:
     ])
 
 
+def print_batch_menu() -> None:
+    """Print the action menu for a multi-exercise Vim session."""
+    print_menu([
+        ("1", "开始练习（全部）"),
+        ("2", "显示提示"),
+        ("3", "设计原因"),
+        ("4", "跳过"),
+        ("0", "退出"),
+    ])
+    console.print("[dim]所有练习在同一个 Vim 中以标签页打开：gt 切换，:wqa 保存并退出[/dim]")
+
+
 def print_success() -> None:
     """Print success message."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         "练习完成！",
         border_style="green",
         box=box.ROUNDED,
@@ -159,12 +371,15 @@ def print_success_menu() -> None:
 def print_failure(actual: str, expected: str) -> None:
     """Print failure message with diff."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         "结果不匹配，请再试一次",
         border_style="red",
         box=box.ROUNDED,
     ))
     console.print()
+    if low_bandwidth:
+        console.print(_columns("你的结果", actual or "(空)", "期望结果", expected or "(空)"))
+        return
 
     # 使用表格并排显示对比
     table = Table(show_header=True, box=box.ROUNDED, border_style="dim")
@@ -185,10 +400,39 @@ def print_retry_menu() -> None:
     ])
 
 
+def print_review_menu() -> None:
+    """Print the action menu for a review card."""
+    print_menu([
+        ("1", "开始复习"),
+        ("2", "显示提示"),
+        ("4", "想不起来（稍后再复习）"),
+        ("0", "退出"),
+    ])
+
+
+def print_review_header(lesson: Lesson, due_count: int) -> None:
+    """Print which lesson a review card comes from."""
+    console.print()
+    console.print(f"[bold cyan]复习[/bold cyan] {lesson.id} {lesson.title}  [dim](待复习 {due_count})[/dim]")
+
+
+def print_review_summary(reviewed: int, next_due: Optional[float]) -> None:
+    """Print the end of a review session and when the next card is due."""
+    console.print()
+    if reviewed:
+        console.print(f"[bold green]本次复习了 {reviewed} 个练习。[/bold green]")
+    else:
+        console.print("[bold green]现在没有需要复习的练习。[/bold green]")
+    if next_due is not None:
+        when = datetime.fromtimestamp(next_due).strftime("%Y-%m-%d %H:%M")
+        console.print(f"[dim]下次复习: {when}[/dim]")
+    console.print()
+
+
 def print_lesson_complete(lesson: Lesson) -> None:
     """Print lesson completion message."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         f"课程 {lesson.id}: {lesson.title} 完成！",
         border_style="green",
         box=box.DOUBLE,
@@ -198,7 +442,7 @@ def print_lesson_complete(lesson: Lesson) -> None:
 def print_module_complete(module_num: int, module_title: str) -> None:
     """Print module completion message."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         f"模块 {module_num}: {module_title} 全部完成！",
         border_style="yellow",
         box=box.DOUBLE,
@@ -208,41 +452,47 @@ def print_module_complete(module_num: int, module_title: str) -> None:
 def print_all_complete() -> None:
     """Print all lessons complete message."""
     console.print()
-    console.print(Panel(
+    console.print(_panel(
         "恭喜你完成了所有课程！",
         border_style="magenta",
         box=box.DOUBLE,
     ))
 
 
-def print_modules_list(modules: list[Module], completed_lessons: list[str]) -> None:
-    """Print a list of all modules and their lessons."""
+def _modules_view(modules: list[Module], completed_lessons: Container[str]) -> Text:
+    """Build the module and lesson list as one text, rendered in a single pass."""
+    lines = []
     for module in modules:
-        console.print()
-        console.print(f"[模块 {module.num}] {module.title}", style="bold magenta")
-        console.print(f"  {module.description}", style="dim")
+        lines.append(Text())
+        lines.append(Text(f"[模块 {module.num}] {module.title}", style="bold magenta"))
+        lines.append(Text(f"  {module.description}", style="dim"))
 
         for lesson in module.lessons:
             if lesson.id in completed_lessons:
-                console.print(f"  [green]✓[/green] {lesson.id}: {lesson.title}", style="green")
+                lines.append(Text(f"  ✓ {lesson.id}: {lesson.title}", style="green"))
             else:
-                console.print(f"    {lesson.id}: {lesson.title}", style="white")
+                lines.append(Text(f"    {lesson.id}: {lesson.title}", style="white"))
+    return Text("\n").join(lines)
 
 
-def print_progress_stats(user: User, total_lessons: int) -> None:
-    """Print detailed progress statistics."""
-    console.print()
-    console.print(Panel(
+def print_modules_list(modules: list[Module], completed_lessons: Container[str]) -> None:
+    """Print a list of all modules and their lessons, followed by a blank line."""
+    console.print(_modules_view(modules, completed_lessons), end="\n\n")
+
+
+def _progress_stats_view(user: User, total_lessons: int) -> Group:
+    """Build the progress statistics panel and table."""
+    title = Panel(
         f"学习统计 - {user.username}",
         border_style="cyan",
         box=box.DOUBLE,
-    ))
+    )
 
     table = Table(show_header=False, box=box.SIMPLE)
     table.add_column("项目", style="dim", width=15)
     table.add_column("数值", style="bold")
 
-    completed = len(user.completed_lessons)
+    completed = len(user.completed)
     progress_pct = user.get_progress_percentage(total_lessons)
 
     table.add_row("已完成课程", f"{completed} / {total_lessons}")
@@ -256,9 +506,257 @@ def print_progress_stats(user: User, total_lessons: int) -> None:
         first_try_rate = (user.stats["successful_first_try"] / user.stats["total_exercises"]) * 100
         table.add_row("一次通过率", f"{first_try_rate:.1f}%")
 
+    if user.review:
+        now = time.time()
+        due = sum(1 for card in user.review.values() if card["due"] <= now)
+        table.add_row("待复习", f"{due} / {len(user.review)}")
+
+    for profile, launch in sorted(user.stats.get("vim_startup", {}).items()):
+        average = launch["total_ms"] / launch["launches"]
+        table.add_row(f"Vim 启动 ({profile})", f"平均 {average:.0f}ms / 最近 {launch['last_ms']:.0f}ms / {launch['launches']} 次")
+
+    return Group(Text(), title, table)
+
+
+def _lesson_history_view(user: User, titles: dict) -> Optional[Table]:
+    """Build the per-lesson attempt history table, or None without history."""
+    if not user.history:
+        return None
+    table = Table(show_header=True, box=box.SIMPLE, title="练习记录", title_justify="left")
+    table.add_column("课程", style="bold green", no_wrap=True)
+    table.add_column("标题", style="bold")
+    table.add_column("练习", justify="right")
+    table.add_column("尝试", justify="right")
+    table.add_column("通过", justify="right")
+    table.add_column("一次通过", justify="right")
+    table.add_column("用时", justify="right", style="dim")
+
+    for lesson_id, exercises in user.history.items():
+        entries = exercises.values()
+        table.add_row(
+            lesson_id,
+            titles.get(lesson_id, ""),
+            str(len(exercises)),
+            str(sum(e["attempts"] for e in entries)),
+            str(sum(1 for e in entries if e["successes"])),
+            str(sum(1 for e in entries if e["first_try"])),
+            f"{sum(e['seconds'] for e in entries):.0f}s",
+        )
+    return table
+
+
+def print_progress(user: User, modules: list[Module], titles: dict) -> None:
+    """
+    Print the whole progress page (statistics, lesson list and history) as
+    one renderable, so it is laid out in one pass and written at once.
+    """
+    parts = [_progress_stats_view(user, len(titles)), _modules_view(modules, user.completed)]
+    history = _lesson_history_view(user, titles)
+    if history is not None:
+        parts.append(history)
+    console.print(Group(*parts))
+
+
+def print_exercise_history(user: User, lesson) -> None:
+    """Print per-exercise attempt history for one lesson."""
+    history = user.lesson_history(lesson.id)
+    table = Table(show_header=True, box=box.SIMPLE, title=f"[课程 {lesson.id}] {lesson.title}", title_justify="left")
+    table.add_column("练习", justify="right", no_wrap=True)
+    table.add_column("内容", style="bold")
+    table.add_column("尝试", justify="right")
+    table.add_column("结果")
+    table.add_column("用时", justify="right", style="dim")
+    table.add_column("最近", style="dim")
+
+    for i, exercise in enumerate(lesson.exercises):
+        entry = history.get(i)
+        if entry is None:
+            table.add_row(str(i + 1), exercise.instruction, "0", "[dim]未练习[/dim]", "-", "-")
+            continue
+        if entry["first_try"]:
+            result = "[green]一次通过[/green]"
+        elif entry["successes"]:
+            result = "[yellow]通过[/yellow]"
+        else:
+            result = "[red]未通过[/red]"
+        table.add_row(
+            str(i + 1), exercise.instruction, str(entry["attempts"]), result,
+            f"{entry['seconds']:.0f}s", entry["last"] or "-",
+        )
+    console.print(table)
+
+
+def print_settings(user: User) -> None:
+    """Print a user's settings."""
+    table = Table(show_header=False, box=box.SIMPLE, title=f"设置 - {user.username}", title_justify="left")
+    table.add_column("项目", style="dim", width=15)
+    table.add_column("数值", style="bold")
+    table.add_row("Vim 启动配置", user.settings.get("vim_profile", "auto"))
+    table.add_row("vimrc", user.settings.get("vimrc", "-"))
+    table.add_row("低带宽显示", user.settings.get("lowbw", "auto"))
     console.print(table)
 
 
+def measure_lesson_screen(lesson: Lesson) -> tuple[int, int]:
+    """Get the bytes a lesson's screens take with full and with low-bandwidth rendering."""
+    global console, low_bandwidth
+    saved = console, low_bandwidth
+    sizes = []
+    try:
+        for low in (False, True):
+            output = io.StringIO()
+            console = Console(
+                file=output, width=saved[0].width, force_terminal=True,
+                color_system=None if low else saved[0].color_system or "standard", emoji=not low, highlight=not low,
+                theme=theme,
+            )
+            low_bandwidth = low
+            print_lesson_header(lesson)
+            print_explanation(lesson.explanation, lesson.id)
+            for i, exercise in enumerate(lesson.exercises, 1):
+                print_exercise(exercise, i, len(lesson.exercises), lesson.id)
+                print_exercise_menu()
+            sizes.append(len(output.getvalue().encode("utf-8")))
+    finally:
+        console, low_bandwidth = saved
+    return sizes[0], sizes[1]
+
+
+def print_screen_savings(lesson: Lesson, full: int, low: int) -> None:
+    """Print how much output low-bandwidth rendering saves on a lesson."""
+    saved = (1 - low / full) * 100 if full else 0.0
+    console.print(f"课程 {lesson.id} 的画面: 完整 {full} 字节，低带宽 {low} 字节（节省 {saved:.0f}%）")
+
+
+def print_search_results(query: str, results: list) -> None:
+    """Print ranked search results."""
+    console.print()
+    if not results:
+        console.print(f"没有找到与 \"{query}\" 相关的内容", style="dim")
+        return
+
+    table = Table(show_header=True, box=box.SIMPLE, title=f"搜索: {query}", title_justify="left")
+    table.add_column("课程", style="bold green", no_wrap=True)
+    table.add_column("练习", style="cyan", no_wrap=True)
+    table.add_column("标题", style="bold")
+    table.add_column("内容", style="dim")
+
+    for result in results:
+        exercise = "-" if result.exercise_index is None else str(result.exercise_index + 1)
+        table.add_row(result.lesson_id, exercise, result.title, result.snippet)
+
+    console.print(table)
+
+
+def print_command_matches(command: str, matches: list, titles: dict[str, str]) -> None:
+    """Print the exercises that practice a command."""
+    console.print()
+    if not matches:
+        console.print(f"没有练习命令 {command} 的课程", style="dim")
+        return
+
+    table = Table(show_header=True, box=box.SIMPLE, title=f"命令: {command}", title_justify="left")
+    table.add_column("命令", style="bold cyan", no_wrap=True)
+    table.add_column("课程", style="bold green", no_wrap=True)
+    table.add_column("练习", style="cyan", no_wrap=True)
+    table.add_column("标题", style="bold")
+
+    for match in matches:
+        table.add_row(match.command, match.lesson_id, str(match.exercise_index + 1), titles.get(match.lesson_id, ""))
+
+    console.print(table)
+
+
+def print_selftest_results(results: list, elapsed: float) -> None:
+    """Print self-test failures and a summary."""
+    problems = [r for r in results if r.status in ("failed", "error")]
+    if problems:
+        table = Table(show_header=True, box=box.ROUNDED, border_style="dim")
+        table.add_column("练习", style="bold", no_wrap=True)
+        table.add_column("状态", no_wrap=True)
+        table.add_column("实际结果", style="red")
+        table.add_column("期望结果", style="green")
+        for r in problems:
+            status = "[red]失败[/red]" if r.status == "failed" else f"[yellow]错误: {r.message}[/yellow]"
+            table.add_row(r.name, status, r.actual or "(空)", r.expected or "(空)")
+        console.print(table)
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in ("passed", "failed", "error", "skipped")}
+    style = "green" if not problems else "red"
+    console.print(Panel(
+        f"通过 {counts['passed']}  失败 {counts['failed']}  错误 {counts['error']}  "
+        f"跳过 {counts['skipped']}  (共 {len(results)} 个练习, {elapsed:.2f}s)",
+        title="自检结果",
+        title_align="left",
+        border_style=style,
+        box=box.ROUNDED,
+    ))
+
+
+def print_report(report, modules: list[Module], titles: dict, stalled_limit: int = 20, elapsed: float = 0.0) -> None:
+    """Print cohort statistics from ``vimlearn report``."""
+    if report.users == 0:
+        console.print("还没有任何用户", style="dim")
+        return
+    console.print(Panel(
+        f"用户 {report.users}  全部完成 {report.finished}  "
+        + "  ".join(f"{days} 天内活跃 {count}" for days, count in report.active.items())
+        + f"\n重新解析 {report.reparsed} 个用户 ({elapsed:.2f}s)",
+        title="学习报告",
+        title_align="left",
+        border_style="cyan",
+        box=box.ROUNDED,
+    ))
+
+    lesson_rates: dict[str, list[float]] = {}
+    for key in report.exercises:
+        rate = report.first_try_rate(key)
+        if rate is not None:
+            lesson_rates.setdefault(key.split("#")[0], []).append(rate)
+
+    table = Table(show_header=True, box=box.SIMPLE, title="课程完成情况", title_justify="left")
+    table.add_column("课程", style="bold green", no_wrap=True)
+    table.add_column("标题", style="bold")
+    table.add_column("完成人数", justify="right")
+    table.add_column("完成率", justify="right")
+    table.add_column("一次通过率", justify="right", style="dim")
+    for module in modules:
+        done = report.module_completion.get(module.num, 0)
+        table.add_row(f"[magenta]{module.num}[/magenta]", f"[magenta]{module.title}[/magenta]",
+                      str(done), f"{done / report.users * 100:.1f}%", "")
+        for lesson in module.lessons:
+            count = report.lesson_completion.get(lesson.id, 0)
+            rates = lesson_rates.get(lesson.id)
+            first_try = f"{sum(rates) / len(rates) * 100:.0f}%" if rates else "-"
+            table.add_row(lesson.id, titles.get(lesson.id, lesson.title), str(count),
+                          f"{count / report.users * 100:.1f}%", first_try)
+    console.print(table)
+
+    hardest = sorted(
+        (key for key, (attempted, _) in report.exercises.items() if attempted),
+        key=lambda key: report.first_try_rate(key),
+    )[:10]
+    if hardest:
+        table = Table(show_header=True, box=box.SIMPLE, title="一次通过率最低的练习", title_justify="left")
+        table.add_column("练习", style="bold", no_wrap=True)
+        table.add_column("尝试人数", justify="right")
+        table.add_column("一次通过率", justify="right")
+        for key in hardest:
+            lesson_id, index = key.split("#")
+            table.add_row(f"{lesson_id} 练习 {int(index) + 1}", str(report.exercises[key][0]),
+                          f"{report.first_try_rate(key) * 100:.0f}%")
+        console.print(table)
+
+    if report.stalled:
+        table = Table(show_header=True, box=box.SIMPLE, title=f"停滞的学习者 (共 {len(report.stalled)} 人)", title_justify="left")
+        table.add_column("用户", style="bold")
+        table.add_column("当前课程", style="green")
+        table.add_column("未活跃天数", justify="right")
+        for username, lesson_id, days in report.stalled[:stalled_limit]:
+            table.add_row(username, lesson_id, str(days))
+        console.print(table)
+
+
 def print_welcome() -> None:
     """Print welcome message."""
     welcome_text = """
@@ -276,7 +774,7 @@ def print_welcome() -> None:
 
 准备好了吗？让我们开始吧！
 """
-    console.print(Panel(
+    console.print(_panel(
         welcome_text.strip(),
         title="VimLearn",
         title_align="left",
@@ -285,22 +783,62 @@ def print_welcome() -> None:
     ))
 
 
-def prompt_username() -> str:
-    """Prompt for username."""
+def prompt_username(recent: Optional[list] = None) -> str:
+    """Prompt for username, offering recently active users by number."""
     console.print()
-    return console.input("[bold cyan]请输入用户名: [/bold cyan]").strip()
+    recent = recent or []
+    for i, summary in enumerate(recent, 1):
+        console.print(f"  [bold]{i}[/bold]. {summary.username} [dim](课程 {summary.current_lesson}，已完成 {summary.completed})[/dim]")
+    answer = _input("[bold cyan]请输入用户名" + ("或编号" if recent else "") + ": [/bold cyan]").strip()
+    if answer.isdigit() and 1 <= int(answer) <= len(recent):
+        return recent[int(answer) - 1].username
+    return answer
+
+
+def print_import_result(result) -> None:
+    """Print the outcome of a roster import, listing rejected rows."""
+    if result.errors:
+        table = Table(show_header=True, box=box.SIMPLE, title="未导入的行", title_justify="left")
+        table.add_column("行", justify="right", no_wrap=True)
+        table.add_column("用户", style="bold")
+        table.add_column("原因", style="red")
+        for line, username, message in result.errors:
+            table.add_row(str(line), username or "-", message)
+        console.print(table)
+        if result.failed > len(result.errors):
+            console.print(f"……另有 {result.failed - len(result.errors)} 行未显示", style="dim")
+    style = "red" if result.failed else "green"
+    console.print(f"[{style}]新建 {result.created}  更新 {result.updated}  失败 {result.failed}[/{style}]")
+
+
+def print_user_list(summaries: list, total_lessons: int) -> None:
+    """Print users with their index summaries."""
+    if not summaries:
+        console.print("还没有任何用户", style="dim")
+        return
+    table = Table(show_header=True, box=box.SIMPLE, title=f"用户 (共 {len(summaries)} 人)", title_justify="left")
+    table.add_column("用户", style="bold")
+    table.add_column("当前课程", style="green")
+    table.add_column("已完成", justify="right")
+    table.add_column("最近活跃", style="dim")
+    for summary in summaries:
+        table.add_row(
+            summary.username, summary.current_lesson or "-",
+            f"{summary.completed} / {total_lessons}", (summary.last_active or "-")[:16].replace("T", " "),
+        )
+    console.print(table)
 
 
 def prompt_action(prompt: str = "") -> str:
-    """Prompt for a single character action."""
+    """Prompt for a single character action (one keypress on a terminal)."""
     if prompt:
         console.print(prompt, style="dim")
-    return console.input("[bold cyan]请选择 > [/bold cyan]").strip().lower()
+    return _read_key("[bold cyan]请选择 > [/bold cyan]").lower()
 
 
 def confirm(message: str) -> bool:
     """Ask for confirmation."""
-    response = console.input(f"[bold yellow]{message} (y/n): [/bold yellow]").strip().lower()
+    response = _read_key(f"[bold yellow]{message} (y/n): [/bold yellow]").lower()
     return response in ("y", "yes", "是")
 
 
@@ -309,6 +847,15 @@ def print_error(message: str) -> None:
     console.print(f"[bold red]错误: {message}[/bold red]")
 
 
+def print_session_in_use(username: str, pid: int) -> None:
+    """Warn that another live session is running for the same user."""
+    owner = f" (PID {pid})" if pid else ""
+    console.print(
+        f"[bold yellow]注意: 用户 {username} 正在另一个终端中学习{owner}。"
+        f"两边的进度会自动合并，但当前课程以最后保存的一方为准。[/bold yellow]"
+    )
+
+
 def print_info(message: str) -> None:
     """Print an info message."""
     console.print(f"[cyan]{message}[/cyan]")
@@ -328,5 +875,5 @@ def print_vim_not_found() -> None:
 
 
 def wait_for_key() -> None:
-    """Wait for user to press Enter."""
-    console.input("\n[dim]按 Enter 继续...[/dim]")
+    """Wait for a keypress (Enter when stdin is not a terminal)."""
+    _read_key("\n[dim]按任意键继续...[/dim]" if can_read_keys() else "\n[dim]按 Enter 继续...[/dim]")
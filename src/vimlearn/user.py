@@ -1,21 +1,45 @@
-"""User management for VimLearn."""
+"""User management for VimLearn.
 
-import json
+Progress is persisted write-behind: frequent mutations (exercise attempts)
+only mark the user dirty and are flushed by a debounce timer, while lesson
+boundaries and exit flush immediately. Every write goes through a temp file,
+fsync and atomic rename, so a crash never leaves a truncated profile.
+
+Exercise attempts and Vim launches are appended to a per-user event log as
+they happen. The profile is a compacted snapshot of that log, and saving it
+folds the logged events in and drops them. Events are tagged with a
+per-process session id and sequence number; the snapshot remembers the last
+ones it folded so a crash between writing it and dropping the log never
+counts an event twice.
+
+Saves hold the user's lock only while they reload the stored profile, merge
+this session's changes into it (union of completed lessons, counters rebuilt
+from the shared log, last writer wins for the current lesson and changed
+settings) and write it back, so two sessions of the same user never
+overwrite each other's progress. Where profiles and logs live is up to the
+configured store (see ``storage``).
+"""
+
+import atexit
+import threading
+import uuid
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
+from .catalog import CompletionSet
+from .lessons import CATALOG
+from .review import QUALITY_FIRST_TRY, QUALITY_RETRIED, card_key, new_card, schedule
+from .storage import COUNTERS, SessionLock, UserSummary, get_store
 
-def get_user_dir() -> Path:
-    """Get the user data directory."""
-    user_dir = Path.home() / ".vimlearn" / "users"
-    user_dir.mkdir(parents=True, exist_ok=True)
-    return user_dir
+# Seconds to coalesce deferred mutations before writing them out.
+FLUSH_DELAY = 5.0
+# Pending log events that force a compaction into the profile snapshot.
+COMPACT_EVENTS = 200
 
-
-def get_user_file(username: str) -> Path:
-    """Get the path to a user's data file."""
-    return get_user_dir() / f"{username}.json"
+EVENT_EXERCISE = "exercise"
+EVENT_ATTEMPT = "attempt"
+EVENT_VIM_LAUNCH = "vim_launch"
+EVENT_REVIEW = "review"
 
 
 class User:
@@ -29,17 +53,46 @@ class User:
         current_lesson: str = "1.1",
         completed_lessons: Optional[list[str]] = None,
         stats: Optional[dict] = None,
+        settings: Optional[dict] = None,
+        history: Optional[dict] = None,
+        log_applied: Optional[dict] = None,
+        review: Optional[dict] = None,
     ):
         self.username = username
         self.created_at = created_at or datetime.now().isoformat()
         self.last_active = last_active or datetime.now().isoformat()
         self.current_lesson = current_lesson
-        self.completed_lessons = completed_lessons or []
+        # Serialized as the readable id list; held as a bitset over the catalog
+        self.completed = CompletionSet(CATALOG, completed_lessons or ())
         self.stats = stats or {
             "total_exercises": 0,
             "successful_first_try": 0,
             "total_attempts": 0,
         }
+        self.settings = settings or {}
+        # lesson id -> exercise index (str) -> attempts/successes/first_try/seconds/last
+        self.history = history or {}
+        # card key ("lesson#index") -> SM-2 state, see review.py
+        self.review = review or {}
+        # session id -> last sequence number folded into this snapshot
+        self.log_applied = log_applied or {}
+        self._session_id = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._pending_events = 0
+        # What this session changed since the last save, for merging
+        self._lesson_changed = False
+        self._changed_settings: set[str] = set()
+        self._reset = False
+        self._session_lock: Optional[SessionLock] = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._exit_hook = False
+
+    @property
+    def completed_lessons(self) -> list[str]:
+        """Completed lesson IDs in curriculum order."""
+        return self.completed.ids()
 
     def to_dict(self) -> dict:
         """Convert user to dictionary for JSON serialization."""
@@ -48,8 +101,12 @@ class User:
             "created_at": self.created_at,
             "last_active": self.last_active,
             "current_lesson": self.current_lesson,
-            "completed_lessons": self.completed_lessons,
+            "completed_lessons": self.completed.ids(),
             "stats": self.stats,
+            "settings": self.settings,
+            "history": self.history,
+            "log_applied": self.log_applied,
+            "review": self.review,
         }
 
     @classmethod
@@ -62,24 +119,164 @@ class User:
             current_lesson=data.get("current_lesson", "1.1"),
             completed_lessons=data.get("completed_lessons", []),
             stats=data.get("stats"),
+            settings=data.get("settings"),
+            history=data.get("history"),
+            # Profiles written before session ids tracked a single sequence
+            log_applied=data.get("log_applied") or ({"": data["log_seq"]} if "log_seq" in data else None),
+            review=data.get("review"),
         )
 
+    def _fold_events(self, events: list[dict], apply: bool = True) -> dict:
+        """
+        Apply the events this snapshot does not already include.
+        Returns the last sequence number seen per session.
+        """
+        folded: dict[str, int] = {}
+        for event in events:
+            session_id = event.get("sid", "")
+            seq = event.get("seq", 0)
+            folded[session_id] = max(folded.get(session_id, 0), seq)
+            if apply and seq > self.log_applied.get(session_id, 0):
+                self._apply_event(event)
+        return folded
+
     def save(self) -> None:
-        """Save user data to file."""
-        self.last_active = datetime.now().isoformat()
-        user_file = get_user_file(self.username)
-        with open(user_file, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        """
+        Merge this session's changes into the stored profile and write it now,
+        cancelling any pending deferred write.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            store = get_store()
+            with store.locked(self.username):
+                data = store.load(self.username)
+                stored = User.from_dict(data) if data is not None else None
+                stored_counters = {name: stored.stats.get(name, 0) for name in COUNTERS} if stored else {}
+                merged = User(self.username, created_at=stored.created_at if stored else self.created_at)
+                if stored is not None:
+                    # A reset clears progress, not settings
+                    merged.settings = stored.settings
+                if stored is not None and not self._reset:
+                    merged.current_lesson = stored.current_lesson
+                    merged.completed = stored.completed
+                    merged.stats = stored.stats
+                    merged.history = stored.history
+                    merged.review = stored.review
+                    merged.log_applied = stored.log_applied
+                merged.log_applied = merged._fold_events(store.read_events(self.username), apply=not self._reset)
+
+                if self._lesson_changed or stored is None or self._reset:
+                    merged.current_lesson = self.current_lesson
+                merged.completed.update(self.completed)
+                # Cards seeded from old history exist only here until saved
+                for key, card in self.review.items():
+                    merged.review.setdefault(key, card)
+                for key in self._changed_settings:
+                    if key in self.settings:
+                        merged.settings[key] = self.settings[key]
+                    else:
+                        merged.settings.pop(key, None)
+                merged.last_active = datetime.now().isoformat()
+
+                deltas = {name: merged.stats.get(name, 0) - stored_counters.get(name, 0) for name in COUNTERS}
+                store.save(merged.to_dict(), deltas)
+
+            # Adopt the merged view, which includes other sessions' progress
+            self.last_active = merged.last_active
+            self.current_lesson = merged.current_lesson
+            self.completed = merged.completed
+            self.stats = merged.stats
+            self.settings = merged.settings
+            self.history = merged.history
+            # Updated in place: a running review queue holds this dict
+            self.review.clear()
+            self.review.update(merged.review)
+            self.log_applied = merged.log_applied
+            self._lesson_changed = False
+            self._changed_settings.clear()
+            self._reset = False
+            self._dirty = False
+            self._pending_events = 0
+
+    def flush(self) -> None:
+        """Write pending changes, if any."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def _changed(self, flush: bool = False) -> None:
+        """Record a mutation; write now at boundaries, otherwise after FLUSH_DELAY."""
+        with self._lock:
+            self._dirty = True
+            if flush:
+                self.save()
+                return
+            if not self._exit_hook:
+                atexit.register(self.flush)
+                self._exit_hook = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_DELAY, self._timer_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timer_flush(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            try:
+                self.flush()
+            except get_store().errors:
+                # Keep the changes dirty; the next boundary or exit retries
+                pass
+
+    def acquire_session(self) -> Optional[int]:
+        """
+        Mark this process as running a learning session for the user.
+        Returns the PID of another live session that already holds the
+        mark (progress is still merged safely), or None.
+        """
+        if self._session_lock is None:
+            self._session_lock = SessionLock(self.username)
+        return self._session_lock.acquire()
+
+    def release_session(self) -> None:
+        """Release the session mark taken by acquire_session()."""
+        if self._session_lock is not None:
+            self._session_lock.release()
+            self._session_lock = None
 
     @classmethod
     def load(cls, username: str) -> Optional["User"]:
-        """Load a user from file."""
-        user_file = get_user_file(username)
-        if not user_file.exists():
+        """Load a user from the configured store."""
+        store = get_store()
+        data = store.load(username)
+        if data is None:
             return None
-        with open(user_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        user = cls.from_dict(data)
+
+        # Fold in events logged after the last snapshot
+        events = store.read_events(username)
+        user._fold_events(events)
+        if events:
+            user._pending_events = len(events)
+            user._changed()
+        return user
+
+    @classmethod
+    def peek(cls, username: str) -> Optional["User"]:
+        """
+        Load a user read-only: pending events are folded in memory, but unlike
+        load() nothing is scheduled to be written back.
+        """
+        store = get_store()
+        data = store.load(username)
+        if data is None:
+            return None
+        user = cls.from_dict(data)
+        user._fold_events(store.read_events(username))
+        return user
 
     @classmethod
     def create(cls, username: str) -> "User":
@@ -98,47 +295,188 @@ class User:
 
     def complete_lesson(self, lesson_id: str) -> None:
         """Mark a lesson as completed."""
-        if lesson_id not in self.completed_lessons:
-            self.completed_lessons.append(lesson_id)
-        self.save()
+        with self._lock:
+            self.completed.add(lesson_id)
+            self._changed(flush=True)
+
+    def _apply_event(self, event: dict) -> None:
+        """Fold one log event into the aggregate stats and history."""
+        if event.get("type") == EVENT_VIM_LAUNCH:
+            launches = self.stats.setdefault("vim_startup", {})
+            entry = launches.setdefault(event["profile"], {"launches": 0, "total_ms": 0.0, "last_ms": 0.0})
+            entry["launches"] += 1
+            entry["total_ms"] += event["ms"]
+            entry["last_ms"] = event["ms"]
+            return
+        if event.get("type") == EVENT_REVIEW:
+            self._schedule_review(event, event["quality"])
+            return
 
-    def record_exercise(self, success: bool, first_try: bool) -> None:
-        """Record an exercise attempt."""
-        self.stats["total_exercises"] += 1
         self.stats["total_attempts"] += 1
-        if success and first_try:
-            self.stats["successful_first_try"] += 1
-        self.save()
+        if event.get("type") == EVENT_EXERCISE:
+            self.stats["total_exercises"] += 1
+            if event.get("success") and event.get("first_try"):
+                self.stats["successful_first_try"] += 1
 
-    def record_attempt(self) -> None:
+        lesson_id = event.get("lesson")
+        index = event.get("exercise")
+        if lesson_id is None or index is None:
+            return
+        entry = self.history.setdefault(lesson_id, {}).setdefault(
+            str(index), {"attempts": 0, "successes": 0, "first_try": False, "seconds": 0.0, "last": None}
+        )
+        entry["attempts"] += 1
+        entry["seconds"] += event.get("duration") or 0.0
+        entry["last"] = event.get("ts")
+        if event.get("success"):
+            entry["successes"] += 1
+            if event.get("first_try"):
+                entry["first_try"] = True
+            if event.get("type") == EVENT_EXERCISE:
+                # Passing an exercise while learning also drives its review schedule
+                self._schedule_review(event, QUALITY_FIRST_TRY if event.get("first_try") else QUALITY_RETRIED)
+
+    def _schedule_review(self, event: dict, quality: int) -> None:
+        key = card_key(event["lesson"], event["exercise"])
+        try:
+            when = datetime.fromisoformat(event["ts"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            when = datetime.now().timestamp()
+        schedule(self.review.setdefault(key, new_card()), quality, when)
+
+    def _log_event(self, event: dict) -> None:
+        """Append an event to the log and apply it in memory."""
+        self._seq += 1
+        event = {
+            "sid": self._session_id, "seq": self._seq,
+            "ts": datetime.now().isoformat(timespec="seconds"), **event,
+        }
+        get_store().append_event(self.username, event)
+        self._pending_events += 1
+        self._apply_event(event)
+        self._changed(flush=self._pending_events >= COMPACT_EVENTS)
+
+    def record_exercise(
+        self,
+        success: bool,
+        first_try: bool,
+        lesson_id: Optional[str] = None,
+        exercise_index: Optional[int] = None,
+        duration: Optional[float] = None,
+    ) -> None:
+        """Record an exercise attempt."""
+        with self._lock:
+            self._log_event({
+                "type": EVENT_EXERCISE, "lesson": lesson_id, "exercise": exercise_index,
+                "success": success, "first_try": first_try,
+                "duration": None if duration is None else round(duration, 3),
+            })
+
+    def record_attempt(self, lesson_id: Optional[str] = None, exercise_index: Optional[int] = None) -> None:
         """Record an additional attempt (retry)."""
-        self.stats["total_attempts"] += 1
-        self.save()
+        with self._lock:
+            self._log_event({"type": EVENT_ATTEMPT, "lesson": lesson_id, "exercise": exercise_index, "success": False})
+
+    def record_review(self, lesson_id: str, exercise_index: int, quality: int, duration: Optional[float] = None) -> None:
+        """Record the outcome of reviewing an exercise (SM-2 quality 0-5)."""
+        with self._lock:
+            self._log_event({
+                "type": EVENT_REVIEW, "lesson": lesson_id, "exercise": exercise_index, "quality": quality,
+                "duration": None if duration is None else round(duration, 3),
+            })
+
+    def seed_reviews(self) -> int:
+        """
+        Give every passed exercise without a card one that is due now, for
+        history recorded before reviews existed. Returns the number added.
+        """
+        added = 0
+        for lesson_id, exercises in self.history.items():
+            for index, entry in exercises.items():
+                key = card_key(lesson_id, int(index))
+                if entry["successes"] and key not in self.review:
+                    self.review[key] = new_card()
+                    added += 1
+        return added
+
+    def lesson_history(self, lesson_id: str) -> dict:
+        """Get per-exercise history for a lesson, keyed by exercise index."""
+        return {int(index): entry for index, entry in self.history.get(lesson_id, {}).items()}
+
+    def record_vim_launch(self, profile: str, startup_ms: float) -> None:
+        """Record how long a Vim launch took to draw its first screen."""
+        with self._lock:
+            self._log_event({"type": EVENT_VIM_LAUNCH, "profile": profile, "ms": round(startup_ms, 3)})
+
+    def update_settings(self, **settings) -> None:
+        """Update per-user settings; None values remove a setting."""
+        with self._lock:
+            for key, value in settings.items():
+                if value is None:
+                    self.settings.pop(key, None)
+                else:
+                    self.settings[key] = value
+                self._changed_settings.add(key)
+            self._changed(flush=True)
 
     def set_current_lesson(self, lesson_id: str) -> None:
         """Set the current lesson."""
-        self.current_lesson = lesson_id
-        self.save()
+        with self._lock:
+            self.current_lesson = lesson_id
+            self._lesson_changed = True
+            self._changed(flush=True)
+
+    def merge_record(self, record: dict) -> None:
+        """
+        Merge an imported roster record without saving: completed lessons are
+        added, and a given current lesson or setting replaces this user's.
+        """
+        with self._lock:
+            for lesson_id in record.get("completed_lessons") or ():
+                self.completed.add(lesson_id)
+            if record.get("current_lesson"):
+                self.current_lesson = record["current_lesson"]
+                self._lesson_changed = True
+            for key, value in (record.get("settings") or {}).items():
+                self.settings[key] = value
+                self._changed_settings.add(key)
+            self._dirty = True
 
     def get_progress_percentage(self, total_lessons: int) -> float:
         """Calculate progress percentage."""
         if total_lessons == 0:
             return 0.0
-        return (len(self.completed_lessons) / total_lessons) * 100
+        return (len(self.completed) / total_lessons) * 100
 
     def reset_progress(self) -> None:
         """Reset all progress."""
-        self.current_lesson = "1.1"
-        self.completed_lessons = []
-        self.stats = {
-            "total_exercises": 0,
-            "successful_first_try": 0,
-            "total_attempts": 0,
-        }
-        self.save()
+        with self._lock:
+            self.current_lesson = "1.1"
+            self.completed = CompletionSet(CATALOG)
+            self.history = {}
+            self.review = {}
+            self._reset = True
+            self.stats = {
+                "total_exercises": 0,
+                "successful_first_try": 0,
+                "total_attempts": 0,
+            }
+            self._changed(flush=True)
+
+
+def validate_username(username: str) -> str:
+    """Check that a username can name a profile file. Returns it stripped."""
+    username = username.strip()
+    if not username or username.startswith(".") or any(c in username for c in '/\\\0') or len(username) > 64:
+        raise ValueError(f"Invalid username: {username!r}")
+    return username
 
 
 def list_users() -> list[str]:
     """List all existing users."""
-    user_dir = get_user_dir()
-    return [f.stem for f in user_dir.glob("*.json")]
+    return get_store().list_users()
+
+
+def list_user_summaries() -> list[UserSummary]:
+    """List users with their current lesson and progress, most recently active first."""
+    return get_store().list_summaries()
@@ -0,0 +1,146 @@
+"""Per-session workspace directories for exercise files.
+
+Each session gets its own directory, preferably on tmpfs under
+``$XDG_RUNTIME_DIR``, named after the owning PID. Exercise files (and the swap
+files Vim puts next to them) live there and are removed on retry, at exit and
+on termination signals. Workspaces left behind by dead processes are swept
+when a new one is created.
+"""
+
+import atexit
+import hashlib
+import os
+import re
+import shutil
+import signal
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from .lesson import Exercise
+
+# Upper bound on directory entries inspected per startup sweep.
+SWEEP_LIMIT = 200
+# Exercise files from older versions lived directly in the temp dir.
+LEGACY_FILE_MAX_AGE = 24 * 3600
+
+_WORKSPACE_NAME = re.compile(r"^session-(\d+)-[0-9a-f]+$")
+
+
+def get_workspace_root() -> Path:
+    """Get the per-user directory that holds session workspaces."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir) and os.access(runtime_dir, os.W_OK):
+        root = Path(runtime_dir) / "vimlearn"
+    else:
+        root = Path(tempfile.gettempdir()) / f"vimlearn-{os.getuid() if hasattr(os, 'getuid') else 'user'}"
+    root.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return root
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def sweep_stale_workspaces(root: Path, limit: int = SWEEP_LIMIT) -> int:
+    """Remove workspaces whose owning process is gone. Returns the count removed."""
+    removed = 0
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return 0
+    with entries:
+        for i, entry in enumerate(entries):
+            if i >= limit:
+                break
+            match = _WORKSPACE_NAME.match(entry.name)
+            if match and not _pid_alive(int(match.group(1))):
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+
+    # Files written straight into the temp dir by older versions
+    cutoff = time.time() - LEGACY_FILE_MAX_AGE
+    for i, legacy in enumerate(Path(tempfile.gettempdir()).glob("vimlearn_exercise_*.txt")):
+        if i >= limit:
+            break
+        try:
+            if legacy.stat().st_mtime < cutoff:
+                legacy.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _remove_with_swap_files(filepath: Path) -> None:
+    """Remove a file and any Vim swap files (.name.swp, .swo, ...) beside it."""
+    for path in [filepath, *filepath.parent.glob(f".{filepath.name}.sw?")]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class Workspace:
+    """A session-owned directory for exercise and helper files."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or get_workspace_root()
+        self._path: Optional[Path] = None
+
+    @property
+    def path(self) -> Path:
+        """The workspace directory, created (after a stale sweep) on first use."""
+        if self._path is None:
+            sweep_stale_workspaces(self.root)
+            self._path = self.root / f"session-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            self._path.mkdir(mode=0o700, parents=True, exist_ok=True)
+            atexit.register(self.remove)
+        return self._path
+
+    def exercise_file(self, exercise: Exercise, slot: Optional[int] = None) -> Path:
+        """Get the deterministic file path for an exercise within this session."""
+        digest = hashlib.sha1(
+            "\0".join([exercise.instruction, exercise.initial, exercise.expected]).encode("utf-8")
+        ).hexdigest()[:10]
+        suffix = "" if slot is None else f"_{slot}"
+        return self.path / f"vimlearn_exercise_{digest}{suffix}.txt"
+
+    def helper_file(self, name: str) -> Path:
+        """Get the path for a helper file (e.g. a generated Vim script)."""
+        return self.path / name
+
+    def discard(self, filepath: Path) -> None:
+        """Remove a workspace file together with its Vim swap files."""
+        _remove_with_swap_files(filepath)
+
+    def remove(self) -> None:
+        """Delete the workspace directory and everything in it."""
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+            atexit.unregister(self.remove)
+
+    def install_signal_handlers(self) -> None:
+        """
+        Exit cleanly on SIGTERM/SIGHUP so the workspace is removed and other
+        atexit hooks (such as pending progress writes) still run.
+        """
+        def handler(signum, frame):
+            self.remove()
+            raise SystemExit(128 + signum)
+
+        for name in ("SIGTERM", "SIGHUP"):
+            signum = getattr(signal, name, None)
+            if signum is not None:
+                signal.signal(signum, handler)
@@ -0,0 +1,27 @@
+import pytest
+
+from vimlearn import storage
+
+
+def _clear_store_caches():
+    storage._known_dirs.clear()
+    storage.get_storage_name.cache_clear()
+    storage.open_store.cache_clear()
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Give each test an empty data directory and fresh stores."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    _clear_store_caches()
+    yield tmp_path
+    _clear_store_caches()
+
+
+@pytest.fixture
+def use_backend(home, monkeypatch):
+    """Switch the storage backend, as a new process with this environment would see it."""
+    def switch(name):
+        monkeypatch.setenv(storage.STORAGE_ENV, name)
+        storage.get_storage_name.cache_clear()
+    return switch
@@ -0,0 +1,40 @@
+"""Regression checks for roster import and export across storage backends."""
+
+import io
+import json
+
+import pytest
+
+from vimlearn.roster import export_users, import_users
+from vimlearn.user import User
+
+
+def test_export_after_switching_to_sqlite(use_backend):
+    # Users created with the JSON backend, then the backend switched before any of them is loaded
+    use_backend("json")
+    for username in ("alice", "bob", "carol"):
+        User.create(username).flush()
+
+    use_backend("sqlite")
+    out = io.StringIO()
+    count = export_users(out, "ndjson")
+
+    exported = sorted(json.loads(line)["username"] for line in out.getvalue().splitlines())
+    assert count == 3
+    assert exported == ["alice", "bob", "carol"]
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_import_reports_bad_rows_and_continues(use_backend, backend):
+    use_backend(backend)
+    roster = io.StringIO("\n".join([
+        '{"username": "z1"}',
+        '{"username": "z2", "stats": "oops"}',
+        '{"username": "z3", "history": {"1.1": ["bad"]}}',
+        '{"username": "z4", "completed_lessons": "1.1"}',
+    ]))
+    result = import_users(roster, "ndjson")
+
+    assert (result.created, result.failed) == (2, 2)
+    assert [line for line, _, _ in result.errors] == [2, 3]
+    assert "1.1" in User.peek("z4").completed
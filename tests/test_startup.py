@@ -0,0 +1,54 @@
+"""Import-time budget for the CLI.
+
+Shell prompts and login scripts run ``vimlearn`` on every invocation, so
+importing ``vimlearn.main`` must stay fast and must not load modules that
+only some commands need.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Cumulative import time of vimlearn.main (best of the runs), in milliseconds.
+BUDGET_MS = 100.0
+RUNS = 5
+# Modules that must not load just by importing the CLI.
+DEFERRED_MODULES = (
+    "rich", "sqlite3", "csv", "concurrent.futures", "multiprocessing", "socket", "xml",
+    "vimlearn.ui", "vimlearn.channel", "vimlearn.commands", "vimlearn.exercise",
+    "vimlearn.roster", "vimlearn.search", "vimlearn.selftest",
+)
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_imports(module: str = "vimlearn.main") -> dict[str, int]:
+    """Import a module in a fresh interpreter; returns cumulative microseconds per module loaded."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def test_cli_import_stays_within_budget():
+    runs = [measure_imports() for _ in range(RUNS)]
+
+    best_ms = min(times["vimlearn.main"] for times in runs) / 1000
+    assert best_ms <= BUDGET_MS, f"import vimlearn.main took {best_ms:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+
+    loaded = set().union(*runs)
+    offenders = sorted(
+        name for name in loaded
+        if any(name == deferred or name.startswith(deferred + ".") for deferred in DEFERRED_MODULES)
+    )
+    assert offenders == [], f"loaded at startup, should be deferred: {offenders}"
@@ -0,0 +1,43 @@
+"""Checks for moving JSON profiles into the SQLite backend."""
+
+from vimlearn.storage import get_database_file, get_store
+from vimlearn.user import EVENT_ATTEMPT, EVENT_EXERCISE, User
+
+
+def _sqlite_users():
+    import sqlite3
+
+    with sqlite3.connect(get_database_file()) as conn:
+        return [row[0] for row in conn.execute("SELECT username FROM users")]
+
+
+def _legacy_user(use_backend):
+    """A JSON profile with two attempts still in its event log."""
+    use_backend("json")
+    User.create("legacy")
+    store = get_store()
+    store.append_event("legacy", {"sid": "s", "seq": 1, "type": EVENT_EXERCISE, "lesson": "1.1", "exercise": 0, "success": True, "first_try": True})
+    store.append_event("legacy", {"sid": "s", "seq": 2, "type": EVENT_ATTEMPT, "lesson": "1.1", "exercise": 1, "success": False})
+    use_backend("sqlite")
+
+
+def test_reading_a_json_profile_does_not_import_it(use_backend):
+    _legacy_user(use_backend)
+
+    user = User.peek("legacy")
+    assert user.stats["total_attempts"] == 2
+    assert [username for username, _ in get_store().scan()] == ["legacy"]
+    assert _sqlite_users() == []
+
+
+def test_first_write_imports_a_json_profile(use_backend):
+    _legacy_user(use_backend)
+
+    user = User.load("legacy")
+    user.record_attempt("1.1", 1)
+    user.flush()
+
+    assert _sqlite_users() == ["legacy"]
+    stored = User.peek("legacy")
+    assert stored.stats["total_attempts"] == 3
+    assert stored.stats["total_exercises"] == 1